@@ -83,6 +83,7 @@ class ToolkitBackend(AEDTCommon):
             if not prim:
                 logger.error("Primitive not created")
                 return False
+            self.invalidate_export_cache(self.properties.active_project)
             self.release_aedt(False, False)
             return prim.name
         logger.error("Design not connected")
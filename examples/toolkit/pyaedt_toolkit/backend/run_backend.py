@@ -50,14 +50,16 @@ def create_geometry():
         return jsonify("Geometry not created"), 500
 
 
-def run_backend(port=None):
+def run_backend(port=None, unix_socket=None):
     """Run the server."""
     app.debug = toolkit_api.properties.debug
     server = MultithreadingServer()
     if not port:
         warnings.warn("Using port value defined in toolkit properties.")
         port = toolkit_api.properties.port
-    server.run(host=toolkit_api.properties.url, port=port, app=app)
+    if unix_socket is None:
+        unix_socket = toolkit_api.properties.unix_socket
+    server.run(host=toolkit_api.properties.url, port=port, app=app, unix_socket=unix_socket)
 
 
 if __name__ == "__main__":
@@ -24,6 +24,7 @@
 import atexit
 import multiprocessing
 import os
+import socket
 import sys
 
 from PySide6.QtCore import QTimer
@@ -33,6 +34,8 @@ from ansys.aedt.toolkits.common.utils import clean_python_processes
 from ansys.aedt.toolkits.common.utils import find_free_port
 from ansys.aedt.toolkits.common.utils import is_server_running
 from ansys.aedt.toolkits.common.utils import process_desktop_properties
+from ansys.aedt.toolkits.common.utils import remove_unix_socket
+from ansys.aedt.toolkits.common.utils import unix_socket_path
 
 from examples.toolkit.pyaedt_toolkit.backend.models import properties as backend_properties
 from examples.toolkit.pyaedt_toolkit.ui.models import properties as frontend_properties
@@ -41,15 +44,29 @@ backend = None
 ui = None
 
 
-def start_backend(pp):
+def start_backend(pp, unix_socket=None):
     """Start the backend process."""
     from examples.toolkit.pyaedt_toolkit.backend.run_backend import run_backend
 
-    print(f"Starting backend on port {pp}...")
-    run_backend(pp)
+    print(f"Starting backend on {unix_socket or f'port {pp}'}...")
+    run_backend(pp, unix_socket)
 
 
-def show_splash_and_start_frontend(app, url, port):
+def start_in_process_backend():
+    """Start the backend in this process, the frontend calls it without HTTP."""
+    from ansys.aedt.toolkits.common.backend.multithreading_server import InProcessServer
+    from ansys.aedt.toolkits.common.ui.actions_generic import FrontendGeneric
+
+    from examples.toolkit.pyaedt_toolkit.backend.run_backend import app as backend_app
+
+    print("Starting backend in process...")
+    server = InProcessServer(backend_app)
+    server.start()
+    FrontendGeneric.backend_app = server
+    return server
+
+
+def show_splash_and_start_frontend(app, url, port, session=None):
     from examples.toolkit.pyaedt_toolkit.ui.run_frontend import run_frontend
     from examples.toolkit.pyaedt_toolkit.ui.splash import show_splash_screen
 
@@ -57,7 +74,7 @@ def show_splash_and_start_frontend(app, url, port):
     url_call = f"http://{url}:{port}"
 
     def check_backend():
-        if check_backend_communication(url_call):
+        if check_backend_communication(url_call, session=session):
             splash.close()
             run_frontend(url, port, app)
         else:
@@ -70,9 +87,37 @@ if __name__ == "__main__":
     multiprocessing.freeze_support()
 
     is_linux = os.name == "posix"
-    new_port = find_free_port(backend_properties.url, backend_properties.port)
-    if not new_port:
-        raise Exception(f"No free ports available in {backend_properties.url}")
+
+    if frontend_properties.in_process_backend:
+        # Single desktop user: no backend process, and no HTTP between the frontend and the backend
+        from ansys.aedt.toolkits.common.ui.actions_generic import BackendSession
+        from examples.toolkit.pyaedt_toolkit.ui.run_frontend import run_frontend
+
+        server = start_in_process_backend()
+        url = frontend_properties.backend_url
+        port = frontend_properties.backend_port
+        process_desktop_properties(is_linux, f"http://{url}:{port}", session=BackendSession(app=server))
+
+        app = QApplication(sys.argv)
+        run_frontend(url, port, app)
+        sys.exit(app.exec())
+
+    # On shared Linux nodes, a per-user Unix domain socket avoids port collisions and system-wide cleanup
+    unix_socket = None
+    if frontend_properties.use_unix_socket and hasattr(socket, "AF_UNIX"):
+        from ansys.aedt.toolkits.common.ui.actions_generic import BackendSession
+        from ansys.aedt.toolkits.common.ui.models import general_settings
+
+        unix_socket = unix_socket_path(f"{frontend_properties.toolkit_name}-{os.getpid()}")
+        new_port = backend_properties.port
+        frontend_properties.backend_unix_socket = unix_socket
+        general_settings.backend_unix_socket = unix_socket
+        session = BackendSession(unix_socket=unix_socket)
+    else:
+        new_port = find_free_port(backend_properties.url, backend_properties.port)
+        if not new_port:
+            raise Exception(f"No free ports available in {backend_properties.url}")
+        session = None
 
     backend_properties.port = new_port
     frontend_properties.backend_port = new_port
@@ -90,21 +135,25 @@ if __name__ == "__main__":
         print("Processes terminated.")
 
 
-    # Clean python processes when script ends
-    atexit.register(clean_python_processes, url, port)
+    if unix_socket:
+        # Remove the socket file when script ends
+        atexit.register(remove_unix_socket, unix_socket)
+    else:
+        # Clean python processes when script ends
+        atexit.register(clean_python_processes, url, port)
 
-    # Check if backend is already running
-    if is_server_running(server=url, port=port):
-        raise Exception(f"A process is already running at: {url_call}")
+        # Check if backend is already running
+        if is_server_running(server=url, port=port):
+            raise Exception(f"A process is already running at: {url_call}")
 
     # Launch backend process
-    backend_process = multiprocessing.Process(target=start_backend, args=(new_port,))
+    backend_process = multiprocessing.Process(target=start_backend, args=(new_port, unix_socket))
     backend_process.start()
 
     # Connect to AEDT session if necessary
-    process_desktop_properties(is_linux, url_call)
+    process_desktop_properties(is_linux, url_call, session=session)
 
     app = QApplication(sys.argv)
-    show_splash_and_start_frontend(app, url, port)
+    show_splash_and_start_frontend(app, url, port, session=session)
     app.aboutToQuit.connect(terminate_processes)
     sys.exit(app.exec())
@@ -22,7 +22,6 @@
 # SOFTWARE.
 
 from ansys.aedt.core.generic.file_utils import generate_unique_project_name
-import requests
 import os
 
 from ansys.aedt.toolkits.common.ui.actions_generic import FrontendGeneric
@@ -60,7 +59,7 @@ class Frontend(FrontendGeneric):
 
         self.set_properties(be_properties)
 
-        response = requests.post(self.url + "/create_geometry", timeout=DEFAULT_REQUESTS_TIMEOUT)
+        response = self.session.post(self.url + "/create_geometry", timeout=DEFAULT_REQUESTS_TIMEOUT)
 
         self.properties.example.primitives_created.append(response.text)
 
@@ -228,7 +228,6 @@ class GeometryMenu(object):
         active_design = properties["active_design"]
         if active_project != selected_project or active_design != selected_design:
             self.main_window.home_menu.update_project()
-            self.main_window.home_menu.update_design()
 
         if success:
             msg = "Geometry created."
@@ -1,28 +1,25 @@
+import tempfile
 import time
 
-from PySide6.QtCore import Slot
 from PySide6.QtCore import QObject
 from PySide6.QtCore import QThread
 from PySide6.QtCore import Signal
+from PySide6.QtCore import Slot
 from PySide6.QtWidgets import QComboBox
+from PySide6.QtWidgets import QGridLayout
 from PySide6.QtWidgets import QLabel
 from PySide6.QtWidgets import QLineEdit
 from PySide6.QtWidgets import QVBoxLayout
-from PySide6.QtWidgets import QGridLayout
 from PySide6.QtWidgets import QWidget
-from examples.toolkit.pyaedt_toolkit.ui.windows.plot_design.plot_design_column import Ui_LeftColumn
-from examples.toolkit.pyaedt_toolkit.ui.windows.plot_design.plot_design_page import Ui_Plot_Design
 from ansys.tools.visualization_interface import Plotter
 from ansys.tools.visualization_interface.backends.pyvista import PyVistaBackend
-import tempfile
-import base64
-
-import pyvista as pv
-import os
+from examples.toolkit.pyaedt_toolkit.ui.windows.plot_design.plot_design_column import Ui_LeftColumn
+from examples.toolkit.pyaedt_toolkit.ui.windows.plot_design.plot_design_page import Ui_Plot_Design
 
 
 class PlotDesignThread(QThread):
     finished_signal = Signal(bool)
+    preview_signal = Signal(object)
 
     def __init__(self, app, selected_project, selected_design):
         super().__init__()
@@ -33,8 +30,9 @@ class PlotDesignThread(QThread):
         self.model_info = None
 
     def run(self):
-        self.model_info = self.main_window.get_aedt_model(
-            self.selected_project, self.selected_design, air_objects=True
+        # A coarse preview is displayed while the full model is transferred
+        self.model_info = self.main_window.get_aedt_mesh(
+            self.selected_project, self.selected_design, air_objects=True, preview_callback=self.preview_signal.emit
         )
 
         self.finished_signal.emit(self.model_info)
@@ -90,11 +88,12 @@ class PlotDesignMenu(object):
         # Set column
         # Create geometry button
         row_returns = self.ui.add_n_buttons(
-            self.plot_design_column_vertical_layout, num_buttons=1,
+            self.plot_design_column_vertical_layout,
+            num_buttons=1,
             height=40,
             width=[200],
             text=["Plot design"],
-            font_size=self.main_window.properties.font["title_size"]
+            font_size=self.main_window.properties.font["title_size"],
         )
 
         self.plot_design_button_layout = row_returns[0]
@@ -104,9 +103,10 @@ class PlotDesignMenu(object):
 
     def plot_design_button_clicked(self):
 
-        if (not self.main_window.settings_menu.aedt_thread or
-                (hasattr(self.main_window.settings_menu.aedt_thread, 'aedt_launched') and
-                 not self.main_window.settings_menu.aedt_thread.aedt_launched)):
+        if not self.main_window.settings_menu.aedt_thread or (
+            hasattr(self.main_window.settings_menu.aedt_thread, "aedt_launched")
+            and not self.main_window.settings_menu.aedt_thread.aedt_launched
+        ):
             msg = "AEDT not launched."
             self.ui.update_logger(msg)
             return False
@@ -130,6 +130,7 @@ class PlotDesignMenu(object):
                 selected_design=selected_design,
             )
             self.get_model_thread.finished_signal.connect(self.get_model_finished)
+            self.get_model_thread.preview_signal.connect(self.preview_model)
 
             msg = "Exporting model."
             self.ui.update_logger(msg)
@@ -142,43 +143,39 @@ class PlotDesignMenu(object):
     def get_model_finished(self):
         self.ui.update_progress(100)
 
-        self.main_window.ui.clear_layout(self.plot_design_grid)
-
         if self.get_model_thread.model_info:
-            model_info = self.get_model_thread.model_info
-
-            pv_backend = PyVistaBackend(use_qt=True, show_qt=False)
-            pv_plotter = Plotter(backend=pv_backend)
-            plotter = pv_plotter.backend.pv_interface.scene
-
-            for element in model_info:  # pragma: no cover
-                # Decode response
-                encoded_data = model_info[element][0]
-                encoded_data_bytes = bytes(encoded_data, "utf-8")
-                decoded_data = base64.b64decode(encoded_data_bytes)
-                # Create obj file locally
-                file_path = os.path.join(self.temp_folder, element + ".obj")
-                with open(file_path, "wb") as f:
-                    f.write(decoded_data)
-                # Create PyVista object
-                if not os.path.exists(file_path):
-                    break
-
-                cad_mesh = pv.read(file_path)
-
-                plotter.add_mesh(
-                    cad_mesh, color=model_info[element][1], show_scalar_bar=False, opacity=model_info[element][2]
-                )
-
-            plotter.view_isometric()
-            plotter.set_background(color=self.main_window.ui.themes["app_color"]["bg_one"])
-            plotter.add_axes_at_origin(labels_off=True, line_width=5)
-            plotter.show_grid(color=self.main_window.ui.themes["app_color"]["dark_two"])
-
-            self.plot_design_grid.addWidget(plotter, 0, 0)
+            self.plot_model(self.get_model_thread.model_info)
 
             msg = "Model exported."
             self.ui.update_logger(msg)
         else:
+            self.main_window.ui.clear_layout(self.plot_design_grid)
             msg = f"Failed backend call: {self.main_window.url}"
             self.ui.update_logger(msg)
+
+    def preview_model(self, model_info):
+        self.ui.update_progress(50)
+        self.plot_model(model_info)
+        self.ui.update_logger("Model preview displayed.")
+
+    def plot_model(self, model_info):
+        self.main_window.ui.clear_layout(self.plot_design_grid)
+
+        pv_backend = PyVistaBackend(use_qt=True, show_qt=False)
+        pv_plotter = Plotter(backend=pv_backend)
+        plotter = pv_plotter.backend.pv_interface.scene
+
+        for element in model_info:  # pragma: no cover
+            # PyVista object built by the thread
+            cad_mesh = model_info[element][0]
+
+            plotter.add_mesh(
+                cad_mesh, color=model_info[element][1], show_scalar_bar=False, opacity=model_info[element][2]
+            )
+
+        plotter.view_isometric()
+        plotter.set_background(color=self.main_window.ui.themes["app_color"]["bg_one"])
+        plotter.add_axes_at_origin(labels_off=True, line_width=5)
+        plotter.show_grid(color=self.main_window.ui.themes["app_color"]["dark_two"])
+
+        self.plot_design_grid.addWidget(plotter, 0, 0)
@@ -22,7 +22,6 @@
 # SOFTWARE.
 
 from ansys.aedt.core.generic.file_utils import generate_unique_project_name
-import requests
 
 from ansys.aedt.toolkits.common.ui.actions_generic import FrontendGeneric
 from ansys.aedt.toolkits.common.ui.logger_handler import logger
@@ -62,7 +61,7 @@ class Frontend(FrontendGeneric):
         self.set_properties(be_properties)
 
         print("Calling:", self._url("/create_geometry"))
-        response = requests.post(self._url("/create_geometry"))
+        response = self.session.post(self._url("/create_geometry"))
 
         print("STATUS:", response.status_code)
         print("RESPONSE:", response.text)
@@ -79,7 +78,7 @@ class Frontend(FrontendGeneric):
     def close_desktop(self):
         print("Calling:", self._url("/close_aedt"))
         properties = {"close_projects": True, "close_desktop": True}
-        response = requests.post(self._url("/close_aedt"), json=properties)
+        response = self.session.post(self._url("/close_aedt"), json=properties)
 
         print("STATUS:", response.status_code)
         print("RESPONSE:", response.text)
@@ -23,50 +23,81 @@
 # SOFTWARE.
 
 import base64
+import contextlib
+import copy
+from dataclasses import asdict
 from dataclasses import dataclass
+import functools
 import gc
+import itertools
 import os
 from pathlib import Path
+import shutil
+import tempfile
+import threading
 import time
 from typing import Any
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import TYPE_CHECKING
 from typing import Tuple
 
+import psutil
 from pydantic import ValidationError
 
 from ansys.aedt.toolkits.common.backend.constants import NAME_TO_AEDT_APP
+from ansys.aedt.toolkits.common.backend.export_cache import ExportCache
+from ansys.aedt.toolkits.common.backend.installations import aedt_installations
 from ansys.aedt.toolkits.common.backend.logger_handler import logger
 from ansys.aedt.toolkits.common.backend.models import common_properties
+from ansys.aedt.toolkits.common.backend.models import field_paths
+from ansys.aedt.toolkits.common.backend.project_index import ProjectIndexCache
 from ansys.aedt.toolkits.common.backend.thread_manager import ThreadManager
+from ansys.aedt.toolkits.common.backend.tracing import TracedObject
+from ansys.aedt.toolkits.common.backend.tracing import summarize_arguments
+from ansys.aedt.toolkits.common.backend.tracing import traced
+from ansys.aedt.toolkits.common.backend.tracing import tracer
+from ansys.aedt.toolkits.common.mesh import apply_lod
+from ansys.aedt.toolkits.common.mesh import read_obj
+from ansys.aedt.toolkits.common.mesh import triangulate
+from ansys.aedt.toolkits.common.mesh import write_obj
 from ansys.aedt.toolkits.common.utils import PropertiesUpdate
 from ansys.aedt.toolkits.common.utils import ToolkitThreadStatus
 
-# isort: off
-import ansys.aedt.core
-from ansys.aedt.core import Desktop
-from ansys.aedt.core.generic.general_methods import active_sessions
-
-if ansys.aedt.core.__version__ <= "0.11.0":
-    from ansys.aedt.core.misc import list_installed_ansysem
-
-    list_installed_aedt = list_installed_ansysem()
-else:
-    from ansys.aedt.core.internal.aedt_versions import aedt_versions
-
-    list_installed_aedt = aedt_versions.list_installed_ansysem
-
-from ansys.aedt.core import generate_unique_project_name
-
-# isort: on
+if TYPE_CHECKING:  # pragma: no cover
+    from ansys.aedt.core import Desktop
+
+
+MODEL_STREAM_CHUNK_SIZE = 1024 * 1024
+"""Size in bytes of the chunks used to stream exported model files."""
+PREVIEW_TRIANGLE_BUDGET = 50000
+"""Maximum number of triangles of the model preview sent in progressive mode."""
+READ_ONLY_JOBS = frozenset(
+    {
+        "launch_aedt",
+        "connect_aedt",
+        "connect_design",
+        "open_project",
+        "save_project",
+        "release_aedt",
+        "export_aedt_model",
+        "export_aedt_mesh",
+        "export_aedt_model_stream",
+        "get_design_names",
+    }
+)
+"""Toolkit API methods that do not modify the designs, so their jobs keep the cached model exports."""
+LOD_EXPORT_PREFIX = "pyaedt_toolkits_lod_"
+"""Prefix of the temporary directories of the objects exported with a reduced level of detail."""
 
 
 @dataclass
 class ToolkitConnectionStatus:
     """Provides an enumeration of statuses for a toolkit connection."""
 
-    desktop: Optional[Desktop] = None
+    desktop: Optional["Desktop"] = None
 
     def __str__(self):
         if self.desktop:
@@ -81,6 +112,44 @@ class ToolkitConnectionStatus:
         return self.desktop is not None
 
 
+@dataclass
+class ProjectCatalogEntry:
+    """Stores the cached information of an AEDT project."""
+
+    path: str
+    child_names: Tuple[str, ...]
+    design_names: List[str]
+
+
+@dataclass
+class AEDTSessionMetrics:
+    """Provides the counters of the AEDT connections made by the toolkit."""
+
+    connections: int = 0
+    connection_time: float = 0.0
+    reused_connections: int = 0
+    design_connections: int = 0
+    design_connection_time: float = 0.0
+    reused_designs: int = 0
+    releases: int = 0
+    idle_releases: int = 0
+
+    @property
+    def time_saved(self) -> float:
+        """Estimated time in seconds saved by reusing connections instead of connecting again."""
+        time_saved = 0.0
+        if self.connections:
+            time_saved += self.reused_connections * self.connection_time / self.connections
+        if self.design_connections:
+            time_saved += self.reused_designs * self.design_connection_time / self.design_connections
+        return time_saved
+
+    def to_dict(self) -> Dict[str, Any]:
+        metrics = asdict(self)
+        metrics["time_saved"] = self.time_saved
+        return metrics
+
+
 class Common:
     """Provides the API for controlling the toolkits.
 
@@ -110,6 +179,7 @@ class Common:
             self.properties = common_properties
             self.thread_manager = ThreadManager()
         self.logger = logger
+        self.project_index = ProjectIndexCache()
 
     def get_properties(self) -> Dict[str, str]:
         """Get the toolkit properties.
@@ -126,8 +196,50 @@ class Common:
         >>> toolkit_api.get_properties()
         {"property1": value1, "property2": value2}
         """
-        res = self.properties.model_dump()
-        return res
+        return copy.deepcopy(dict(self.properties.snapshot()))
+
+    def get_serialized_properties(self) -> Tuple[int, bytes]:
+        """Get the toolkit properties serialized to JSON.
+
+        The serialized properties are cached until the next property change.
+
+        Returns
+        -------
+        tuple[int, bytes]
+            Version and JSON document of the properties.
+
+        Examples
+        --------
+        >>> from ansys.aedt.toolkits.common.backend.api import Common
+        >>> toolkit_api = Common()
+        >>> toolkit_api.get_serialized_properties()
+        (0, b'{"property1":value1,"property2":value2}')
+        """
+        return self.properties.serialized()
+
+    def get_properties_changes(self, since: int) -> Tuple[int, Dict[str, Any]]:
+        """Get the toolkit properties changed after a version.
+
+        Parameters
+        ----------
+        since : int
+            Version of the properties known by the caller.
+
+        Returns
+        -------
+        tuple[int, dict]
+            Current version and properties changed after ``since``.
+
+        Examples
+        --------
+        >>> from ansys.aedt.toolkits.common.backend.api import Common
+        >>> toolkit_api = Common()
+        >>> version, _ = toolkit_api.get_properties_changes(0)
+        >>> toolkit_api.set_properties({"property1": "value1"})
+        >>> toolkit_api.get_properties_changes(version)
+        (1, {"property1": "value1"})
+        """
+        return self.properties.changes(since)
 
     def set_properties(self, data: Dict[str, Any]):
         """Assign the passed data to the internal data model.
@@ -156,7 +268,8 @@ class Common:
             return False, msg
 
         try:
-            is_updated = self._update_properties(self.properties, data)
+            with self.properties.lock:
+                is_updated = self._update_properties(self.properties, data)
             msg = PropertiesUpdate.SUCCESS.value
             logger.debug(msg)
             return is_updated, msg
@@ -166,29 +279,105 @@ class Common:
             return False, msg
 
     def _update_properties(self, properties: Any, data: Dict[str, Any]):
-        """Helper function to update properties recursively."""
-        is_updated = False
+        """Helper function to update properties, nested models included.
+
+        The keys are resolved with the field path index of the model class. The new values are
+        validated in one pass and applied together, or not at all.
+        """
+        paths = field_paths(type(properties))
+        updates = {}
         for key, value in data.items():
-            is_updated = False
-            if hasattr(properties, key):
-                logger.debug(f"Updating '{key}' with value {value}")
-                setattr(properties, key, value)
-                is_updated = True
-            if not is_updated:
-                model_cls = type(properties)
-                if hasattr(model_cls, "model_fields"):
-                    for attr_name in model_cls.model_fields:
-                        attr = getattr(properties, attr_name)
-                        if hasattr(attr, "__dict__"):
-                            is_updated = self._update_properties(attr, data)
-                            if is_updated:
-                                break
-        return is_updated
-
-    def launch_thread(self, process, *args) -> ThreadManager:
-        """Launch the thread."""
+            if key in paths:
+                logger.debug("Updating '%s' with value %s", key, value)
+                updates[paths[key]] = value
+            else:
+                logger.debug("Property '%s' does not exist", key)
+        if updates:
+            properties.update_fields(updates)
+        return len(updates) == len(data)
+
+    def launch_thread(self, process, *args):
+        """Submit a process to the toolkit job queue.
+
+        Jobs are executed one by one in the toolkit thread, in the order they are submitted.
+
+        Parameters
+        ----------
+        process : callable
+            Process to execute.
+        *args
+            Arguments passed to the process.
+
+        Returns
+        -------
+        str or bool
+            Job ID when the job is queued, ``False`` when the queue is full.
+
+        Examples
+        --------
+        >>> from ansys.aedt.toolkits.common.backend.api import AEDTCommon
+        >>> toolkit_api = AEDTCommon()
+        >>> job_id = toolkit_api.launch_thread(toolkit_api.launch_aedt)
+        >>> toolkit_api.wait_to_be_idle()
+        >>> toolkit_api.get_job(job_id)
+        """
         return self.thread_manager.launch_thread(process, *args)
 
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get the state, result, exception, and timings of a job.
+
+        Parameters
+        ----------
+        job_id : str
+            Job ID returned by :meth:`launch_thread`.
+
+        Returns
+        -------
+        dict or None
+            Job information, ``None`` if the job does not exist.
+        """
+        return self.thread_manager.get_job(job_id)
+
+    def get_jobs(self) -> List[Dict[str, Any]]:
+        """Get the information of the queued, running, and finished jobs.
+
+        Returns
+        -------
+        list
+            List of job information.
+        """
+        return self.thread_manager.get_jobs()
+
+    def cancel_job(self, job_id: str) -> bool:
+        """Cancel a job.
+
+        A queued job is removed from the queue. A running job is notified and stops when
+        the process checks :meth:`is_cancel_requested`.
+
+        Parameters
+        ----------
+        job_id : str
+            Job ID returned by :meth:`launch_thread`.
+
+        Returns
+        -------
+        bool
+            ``True`` when the cancellation is requested, ``False`` otherwise.
+        """
+        return self.thread_manager.cancel_job(job_id)
+
+    def is_cancel_requested(self) -> bool:
+        """Check if the cancellation of the running job is requested.
+
+        Long processes should call this method regularly and return when it is ``True``.
+
+        Returns
+        -------
+        bool
+            ``True`` when the running job must stop, ``False`` otherwise.
+        """
+        return self.thread_manager.is_cancel_requested()
+
     def get_thread_status(self) -> ToolkitThreadStatus:
         """Get the toolkit thread status.
 
@@ -203,8 +392,7 @@ class Common:
         >>> toolkit_api = Common()
         >>> toolkit_api.get_thread_status()
         """
-        thread_running = self.thread_manager.is_toolkit_thread_running()
-        is_toolkit_busy = self.properties.is_toolkit_busy
+        thread_running, is_toolkit_busy = self.thread_manager.toolkit_thread_state()
         if thread_running and is_toolkit_busy:  # pragma: no cover
             res = ToolkitThreadStatus.BUSY
             logger.debug(res.value)
@@ -234,22 +422,38 @@ class Common:
         ["2024.2", "2025.1", "2025.2", "2026.1"]
         """
 
-        # Detect existing AEDT installation
-        installed_versions = []
+        # Detect existing AEDT installation, discovered once per environment
+        installed_versions = aedt_installations.installed_versions
+        logger.debug("%s", installed_versions)
+        return installed_versions
 
-        known_prefixes = ("AWP_ROOT", "ANSYSEM_PY_CLIENT_ROOT", "ANSYSEMSV_ROOT", "ANSYSEM_ROOT")
+    def get_project_index(self, project_list: Optional[List[str]] = None) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Get the designs of AEDT project files without launching AEDT.
 
-        for ver in list_installed_aedt:  # pragma: no cover
-            for prefix in known_prefixes:
-                if prefix in ver:
-                    digits = ver.replace(prefix, "")
-                    suffix = " STUDENT" if prefix == "ANSYSEMSV_ROOT" else ""
-                    installed_versions.append(f"20{digits[:2]}.{digits[-1]}{suffix}")
-                    break
+        The files are indexed once and the index is cached until the files change.
 
-        installed_versions = sorted(set(installed_versions))
-        logger.debug(str(installed_versions))
-        return installed_versions
+        Parameters
+        ----------
+        project_list : list, optional
+            Full paths of the ``.aedt`` or ``.aedtz`` files. The default is ``None``, in which case
+            the projects of the ``project_list`` property are indexed.
+
+        Returns
+        -------
+        dict
+            Dictionary of project indexes {project path: index}. The index contains the project name,
+            the number of project variables and the name, design type and number of variables of each design.
+            The index is ``None`` if the file cannot be indexed.
+
+        Examples
+        --------
+        >>> from ansys.aedt.toolkits.common.backend.api import Common
+        >>> toolkit_api = Common()
+        >>> toolkit_api.get_project_index(["path/to/project.aedt"])
+        """
+        if project_list is None:
+            project_list = self.properties.project_list
+        return {project: self.project_index.get(project) for project in project_list}
 
     def aedt_sessions(self) -> Dict[int, int]:
         """Get information for the active AEDT sessions.
@@ -269,24 +473,33 @@ class Common:
         """
 
         res = {}
-        if not self.properties.is_toolkit_busy and self.properties.aedt_version:
+        if not self.properties.is_toolkit_busy and self.properties.resolve_aedt_version():
+            from ansys.aedt.core.generic.general_methods import active_sessions
+
             res = active_sessions(
                 version=self.properties.aedt_version, student_version=False, non_graphical=self.properties.non_graphical
             )
         if res:
-            logger.debug(f"Active AEDT sessions: {res}.")
+            logger.debug("Active AEDT sessions: %s.", res)
         else:  # pragma: no cover
             logger.debug("No active sessions.")
         return res
 
-    def wait_to_be_idle(self, timeout: int = 60) -> bool:
+    def wait_to_be_idle(self, timeout: float = 60) -> bool:
         """Wait for the thread to be idle and ready to accept a new task.
 
+        The wait ends as soon as the last queued job finishes.
+
         Parameters
         ----------
-        timeout : int, optional
+        timeout : float, optional
             Time out in seconds. The default is ``60``.
 
+        Returns
+        -------
+        bool
+            ``True`` when the thread is idle, ``False`` when the timeout is exceeded.
+
         Examples
         --------
         >>> from ansys.aedt.toolkits.common.backend.api import AEDTCommon
@@ -295,16 +508,31 @@ class Common:
         >>> toolkit_api.wait_to_be_idle()
         >>> toolkit_api.get_design_names()
         """
-        time.sleep(1)
-        status = self.get_thread_status()
-        cont = 0
-        while status == ToolkitThreadStatus.BUSY:  # pragma: no cover
-            time.sleep(1)
-            cont += 1
-            status = self.get_thread_status()
-            if cont == timeout:
-                return False
-        return True
+        return self.thread_manager.wait_until_idle(timeout=timeout)
+
+    def wait_job(self, job_id: str, timeout: float = 60) -> Optional[Dict[str, Any]]:
+        """Wait for a job to finish.
+
+        Parameters
+        ----------
+        job_id : str
+            Job ID returned by :meth:`launch_thread`.
+        timeout : float, optional
+            Time out in seconds. The default is ``60``.
+
+        Returns
+        -------
+        dict or None
+            Job information, ``None`` if the job does not exist.
+
+        Examples
+        --------
+        >>> from ansys.aedt.toolkits.common.backend.api import AEDTCommon
+        >>> toolkit_api = AEDTCommon()
+        >>> job_id = toolkit_api.launch_thread(toolkit_api.launch_aedt)
+        >>> toolkit_api.wait_job(job_id)
+        """
+        return self.thread_manager.wait_job(job_id, timeout=timeout)
 
     @staticmethod
     def serialize_obj_base64(file_path):
@@ -325,6 +553,32 @@ class Common:
         encoded_data = base64.b64encode(data)
         return encoded_data
 
+    @staticmethod
+    def iter_file_chunks(file_paths, chunk_size=MODEL_STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        """Read files one chunk at a time.
+
+        Only one chunk is kept in memory, whatever the size of the files.
+
+        Parameters
+        ----------
+        file_paths : list
+            Paths of the files to read, in order.
+        chunk_size : int, optional
+            Maximum size of each chunk in bytes. The default is ``MODEL_STREAM_CHUNK_SIZE``.
+
+        Yields
+        ------
+        bytes
+            Content of the files.
+        """
+        for file_path in file_paths:
+            with open(file_path, "rb") as f:
+                while True:
+                    chunk = f.read(chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+
 
 class AEDTCommon(Common):
     """Provides common functions for controlling AEDT.
@@ -354,6 +608,100 @@ class AEDTCommon(Common):
         super().__init__(self.properties)
         self.desktop = None
         self.aedtapp = None
+        self.export_cache = ExportCache()
+        self.session_metrics = AEDTSessionMetrics()
+        self.__design_apps = {}
+        self.__session_timer = None
+        self.__session_lock = threading.RLock()
+        self.__project_catalog = {}
+        self.__catalog_process = None
+
+    def launch_thread(self, process, *args):
+        """Submit a process to the toolkit job queue.
+
+        Jobs can modify the design, so the cached model exports of the active project are invalidated
+        when they end, unless the process is one of the ``READ_ONLY_JOBS``. Changes saved to the project
+        file are detected by the cache anyway.
+
+        Parameters
+        ----------
+        process : callable
+            Process to execute.
+        *args
+            Arguments passed to the process.
+
+        Returns
+        -------
+        str or bool
+            Job ID when the job is queued, ``False`` when the queue is full.
+
+        Examples
+        --------
+        >>> from ansys.aedt.toolkits.common.backend.api import AEDTCommon
+        >>> toolkit_api = AEDTCommon()
+        >>> job_id = toolkit_api.launch_thread(toolkit_api.launch_aedt)
+        >>> toolkit_api.wait_to_be_idle()
+        """
+
+        if getattr(process, "__name__", None) in READ_ONLY_JOBS:
+            return super().launch_thread(process, *args)
+
+        @functools.wraps(process)
+        def job(*job_args):
+            # The job can change the active project, both projects are invalidated
+            project_path = self.properties.active_project
+            try:
+                return process(*job_args)
+            finally:
+                for changed_project in {project_path, self.properties.active_project}:
+                    if changed_project:
+                        self.invalidate_export_cache(changed_project)
+
+        return super().launch_thread(job, *args)
+
+    def create_session_api(self, selected_process: int = 0) -> "AEDTCommon":
+        """Create a copy of the toolkit API that controls another AEDT session.
+
+        The copy uses a copy of the properties, which does not publish events, and its own AEDT connection
+        and job queue. The exported model cache and the project index are shared. The AEDT session is kept
+        between calls.
+
+        Parameters
+        ----------
+        selected_process : int, optional
+            gRPC port or process ID of the AEDT session. The default is ``0``, in which case
+            :meth:`launch_aedt` launches a new session.
+
+        Returns
+        -------
+        :class:`AEDTCommon`
+            Toolkit API of the session.
+
+        Examples
+        --------
+        >>> from ansys.aedt.toolkits.common.backend.api import AEDTCommon
+        >>> toolkit_api = AEDTCommon()
+        >>> session_api = toolkit_api.create_session_api(50051)
+        >>> session_api.connect_aedt()
+        """
+        data = dict(self.properties.snapshot())
+        data.update(
+            selected_process=selected_process,
+            keep_aedt_session=True,
+            is_toolkit_busy=False,
+            active_project="",
+            active_design="",
+            project_list=[],
+            design_list={},
+        )
+        properties = type(self.properties).model_validate(data)
+        # The state of the session is not the state of the toolkit
+        properties.publish_events = False
+        session_api = copy.copy(self)
+        AEDTCommon.__init__(session_api, properties)
+        session_api.export_cache = self.export_cache
+        session_api.project_index = self.project_index
+        return session_api
 
     def is_aedt_connected(self) -> Tuple[bool, str]:
         """Check if AEDT is connected.
@@ -380,6 +728,7 @@ class AEDTCommon(Common):
         logger.debug(msg)
         return connected, msg
 
+    @traced
     def launch_aedt(self) -> bool:
         """Launch AEDT.
 
@@ -404,6 +753,8 @@ class AEDTCommon(Common):
             self.properties.state = msg
             self.properties.progress = 0
 
+            import ansys.aedt.core
+
             ansys.aedt.core.settings.use_grpc_api = self.properties.use_grpc
             ansys.aedt.core.settings.enable_logger = self.properties.debug
 
@@ -425,7 +776,8 @@ class AEDTCommon(Common):
             else:  # pragma: no cover
                 desktop_args["new_desktop"] = False
                 desktop_args["aedt_process_id"] = self.properties.selected_process
-            self.desktop = ansys.aedt.core.Desktop(**desktop_args)
+            with self.trace_span("Desktop", arguments=summarize_arguments((), desktop_args)):
+                self.desktop = ansys.aedt.core.Desktop(**desktop_args)
 
             if not self.desktop:  # pragma: no cover
                 msg = "AEDT not launched"
@@ -442,16 +794,17 @@ class AEDTCommon(Common):
             # Save AEDT session properties
             if self.properties.use_grpc:
                 self.properties.selected_process = self.desktop.port
-                logger.debug("Grpc port {}.".format(str(self.desktop.port)))
+                logger.debug("Grpc port %s.", self.desktop.port)
             else:  # pragma: no cover
                 self.properties.selected_process = self.desktop.aedt_process_id
-                logger.debug("Process ID {}.".format(str(self.desktop.aedt_process_id)))
+                logger.debug("Process ID %s.", self.desktop.aedt_process_id)
 
             self.__save_project_info()
 
             if self.desktop.project_list:  # pragma: no cover
                 # If there are projects not saved in the session, PyAEDT could find issues loading some properties
-                self.desktop.save_project()
+                with self.trace_span("desktop.save_project"):
+                    self.desktop.save_project()
 
             self.release_aedt(False, False)
 
@@ -461,9 +814,12 @@ class AEDTCommon(Common):
             self.properties.progress = 100
         return True
 
+    @traced
     def connect_aedt(self) -> bool:
         """Connect to an existing AEDT session.
 
+        When the toolkit is already connected, the session is reused if its AEDT process is still running.
+
         Returns
         -------
         bool
@@ -482,40 +838,56 @@ class AEDTCommon(Common):
             logger.error("Process ID is not defined.")
             return False
 
-        is_aedt_connected = self.is_aedt_connected()
-        if is_aedt_connected[0]:
-            logger.debug("Toolkit is connected to AEDT.")
-            return True
+        with self.__session_lock:
+            # The session is in use, so it must not be released while idle
+            self.__cancel_idle_release()
 
-        # Connect to AEDT
-        ansys.aedt.core.settings.use_grpc_api = self.properties.use_grpc
-        ansys.aedt.core.settings.enable_logger = self.properties.debug
-        logger.debug("Connecting AEDT.")
+            if self.desktop and not self.__is_session_alive():  # pragma: no cover
+                logger.debug("AEDT session is not available anymore.")
+                self.__drop_session()
 
-        version, is_student = self.__get_aedt_version()
+            is_aedt_connected = self.is_aedt_connected()
+            if is_aedt_connected[0]:
+                self.session_metrics.reused_connections += 1
+                logger.debug("Toolkit is connected to AEDT.")
+                return True
 
-        desktop_args = {
-            "version": version,
-            "non_graphical": self.properties.non_graphical,
-            "student_version": is_student,
-            "new_desktop": False,
-        }
-        if self.properties.use_grpc:
-            desktop_args["port"] = self.properties.selected_process
-        else:  # pragma: no cover
-            desktop_args["aedt_process_id"] = self.properties.selected_process
+            # Connect to AEDT
+            import ansys.aedt.core
 
-        gc.collect()
+            ansys.aedt.core.settings.use_grpc_api = self.properties.use_grpc
+            ansys.aedt.core.settings.enable_logger = self.properties.debug
+            logger.debug("Connecting AEDT.")
 
-        self.desktop = ansys.aedt.core.Desktop(**desktop_args)
+            version, is_student = self.__get_aedt_version()
 
-        if not self.desktop:  # pragma: no cover
-            logger.error("Toolkit is not connected to AEDT.")
-            return False
+            desktop_args = {
+                "version": version,
+                "non_graphical": self.properties.non_graphical,
+                "student_version": is_student,
+                "new_desktop": False,
+            }
+            if self.properties.use_grpc:
+                desktop_args["port"] = self.properties.selected_process
+            else:  # pragma: no cover
+                desktop_args["aedt_process_id"] = self.properties.selected_process
 
-        logger.debug("Toolkit is connected to AEDT.")
-        return True
+            gc.collect()
 
+            start = time.perf_counter()
+            with self.trace_span("Desktop", arguments=summarize_arguments((), desktop_args)):
+                self.desktop = ansys.aedt.core.Desktop(**desktop_args)
+
+            if not self.desktop:  # pragma: no cover
+                logger.error("Toolkit is not connected to AEDT.")
+                return False
+
+            self.session_metrics.connections += 1
+            self.session_metrics.connection_time += time.perf_counter() - start
+            logger.debug("Toolkit is connected to AEDT.")
+            return True
+
+    @traced
     def connect_design(self, app_name: Optional[str] = None):
         """Connect to an application design.
 
@@ -566,6 +938,8 @@ class AEDTCommon(Common):
         if self.properties.active_design:
             design_name = self.properties.active_design
 
+        import ansys.aedt.core
+
         ansys.aedt.core.settings.use_grpc_api = self.properties.use_grpc
         ansys.aedt.core.settings.enable_logger = self.properties.debug
 
@@ -577,19 +951,30 @@ class AEDTCommon(Common):
         # Select app
         aedt_app = getattr(ansys.aedt.core, NAME_TO_AEDT_APP[app_name])
 
+        if design_name != "No Design":
+            aedtapp = self.__design_apps.get((project_name, design_name))
+            if aedtapp and design_name in self.properties.design_list.get(self.get_project_name(project_name), []):
+                self.aedtapp = aedtapp
+                self.session_metrics.reused_designs += 1
+                logger.info("Toolkit is connected to AEDT design.")
+                return True
+
+        start = time.perf_counter()
         if design_name != "No Design":
             project_name = self.get_project_name(project_name)
             active_design = design_name
             if design_name in self.properties.design_list[project_name]:
                 # PyAEDT object with specified design
-                if not self.desktop.odesktop.GetActiveProject():  # pragma: no cover
-                    self.desktop.odesktop.SetActiveProject(project_name)
+                odesktop = self.__traced_object(self.desktop.odesktop, "odesktop")
+                if not odesktop.GetActiveProject():  # pragma: no cover
+                    odesktop.SetActiveProject(project_name)
 
-                self.aedtapp = self.desktop[[project_name, design_name]]
+                with self.trace_span("desktop[project, design]", project=project_name, design=design_name):
+                    self.aedtapp = self.desktop[[project_name, design_name]]
 
                 if not self.aedtapp:  # pragma: no cover
                     # Sometimes the project is not activated. Try to activate it again.
-                    self.desktop.odesktop.SetActiveProject(project_name)
+                    odesktop.SetActiveProject(project_name)
                     self.aedtapp = self.desktop[[project_name, design_name]]
 
                 if not self.aedtapp:  # pragma: no cover
@@ -628,32 +1013,51 @@ class AEDTCommon(Common):
             else:  # pragma: no cover
                 aedt_app_args["aedt_process_id"] = self.properties.selected_process
 
-            self.aedtapp = aedt_app(**aedt_app_args)
-            self.aedtapp.save_project()
-            self.__save_project_info()
+            with self.trace_span(aedt_app.__name__, arguments=summarize_arguments((), aedt_app_args)):
+                self.aedtapp = aedt_app(**aedt_app_args)
+            with self.trace_span("aedtapp.save_project"):
+                self.aedtapp.save_project()
+            self.__save_project_info(self.aedtapp.project_name)
 
         if self.aedtapp:
             project_name = Path(self.aedtapp.project_file).resolve()
             normalized_list = [Path(p).resolve() for p in self.properties.project_list]
+            project_list = self.properties.project_list
+            design_list = self.properties.design_list
             if project_name not in normalized_list:  # pragma: no cover
-                self.properties.project_list.append(str(project_name))
-                self.properties.design_list[self.aedtapp.project_name] = [active_design]
-
-            if (
-                self.aedtapp.design_list and active_design not in self.properties.design_list[self.aedtapp.project_name]
-            ):  # pragma: no cover
-                self.properties.design_list[self.aedtapp.project_name].append(active_design)
-            self.properties.active_project = str(project_name)
-            self.properties.active_design = active_design
+                project_list = project_list + [str(project_name)]
+                design_list = {**design_list, self.aedtapp.project_name: [active_design]}
+
+            project_designs = design_list.get(self.aedtapp.project_name, [])
+            if self.aedtapp.design_list and active_design not in project_designs:  # pragma: no cover
+                design_list = {**design_list, self.aedtapp.project_name: project_designs + [active_design]}
+            # Updated together so that readers do not see a partial update
+            self.properties.update_fields(
+                {
+                    ("project_list",): project_list,
+                    ("design_list",): design_list,
+                    ("active_project",): str(project_name),
+                    ("active_design",): active_design,
+                }
+            )
+            self.session_metrics.design_connections += 1
+            self.session_metrics.design_connection_time += time.perf_counter() - start
+            if self.properties.keep_aedt_session:
+                self.__design_apps[(self.properties.active_project, active_design)] = self.aedtapp
             logger.info("Toolkit is connected to AEDT design.")
             return True
         else:  # pragma: no cover
             logger.error("Toolkit is not connected to AEDT design.")
             return False
 
-    def release_aedt(self, close_projects=False, close_on_exit=False):
+    @traced
+    def release_aedt(self, close_projects=False, close_on_exit=False, force=False):
         """Release AEDT.
 
+        When the ``keep_aedt_session`` property is enabled, the AEDT session and the connected designs are
+        kept for the next calls. The session is released once it is not used during
+        ``aedt_session_idle_timeout`` seconds, or when projects or AEDT are closed or ``force`` is enabled.
+
         Parameters
         ----------
         close_projects : bool, optional
@@ -662,6 +1066,8 @@ class AEDTCommon(Common):
         close_on_exit : bool, optional
             Whether to close the active AEDT session on exiting AEDT.
             The default is ``True``.
+        force : bool, optional
+            Whether to release a kept AEDT session. The default is ``False``.
 
         Returns
         -------
@@ -676,6 +1082,15 @@ class AEDTCommon(Common):
         >>> toolkit_api.wait_to_be_idle()
         >>> toolkit_api.release_aedt(True, True)
         """
+        with self.__session_lock:
+            if self.properties.keep_aedt_session and self.desktop and not (close_projects or close_on_exit or force):
+                self.aedtapp = None
+                self.__schedule_idle_release()
+                logger.debug("AEDT session is kept.")
+                return True
+            self.__cancel_idle_release()
+            self.__design_apps.clear()
+
         released = False
         if self.desktop:
             try:
@@ -696,10 +1111,12 @@ class AEDTCommon(Common):
 
         if not released and close_projects and close_on_exit and self.connect_aedt():
             self.desktop.release_desktop(close_projects, close_on_exit)
+        self.session_metrics.releases += 1
         logger.info("AEDT is released.")
         gc.collect()
         return True
 
+    @traced
     def open_project(self, project_name=None):
         """Open an AEDT project.
 
@@ -732,24 +1149,28 @@ class AEDTCommon(Common):
         ):  # pragma: no cover
             project_name = os.path.abspath(self.properties.active_project)
         if ".aedtz" in project_name:
+            from ansys.aedt.core import generate_unique_project_name
+
             name = generate_unique_project_name()
             path = os.path.dirname(project_name)
-            self.desktop.odesktop.RestoreProjectArchive(project_name, os.path.join(path, name), True, True)
+            odesktop = self.__traced_object(self.desktop.odesktop, "odesktop")
+            odesktop.RestoreProjectArchive(project_name, os.path.join(path, name), True, True)
             time.sleep(0.5)
-            logger.debug("Project {} is opened".format(project_name))
-            self.__save_project_info()
+            logger.debug("Project %s is opened", project_name)
+            self.__save_project_info(self.get_project_name(name))
             self.release_aedt(False, False)
             return True
         elif not os.path.exists(project_name + ".lock") and self.desktop and project_name:
-            self.desktop.odesktop.OpenProject(project_name)
-            logger.debug("Project {} is opened".format(project_name))
-            self.__save_project_info()
+            self.__traced_object(self.desktop.odesktop, "odesktop").OpenProject(project_name)
+            logger.debug("Project %s is opened", project_name)
+            self.__save_project_info(self.get_project_name(project_name))
             self.release_aedt(False, False)
             return True
 
         self.release_aedt(False, False)
         return False
 
+    @traced
     def save_project(self, project_path=None, release_aedt=True):
         """Save the project.
 
@@ -782,15 +1203,19 @@ class AEDTCommon(Common):
                 old_project_name = self.get_project_name(self.properties.active_project)
                 active_project_name = self.get_project_name(self.properties.active_project)
                 self.desktop.save_project(project_path=os.path.abspath(project_path), project_name=active_project_name)
-                index = self.properties.project_list.index(self.properties.active_project)
-                self.properties.project_list.pop(index)
-                self.properties.active_project = project_path
-                self.properties.project_list.append(project_path)
-
-                new_project_name = self.get_project_name(self.properties.active_project)
-                self.properties.design_list[new_project_name] = self.properties.design_list[old_project_name]
-                if old_project_name != new_project_name:
-                    del self.properties.design_list[old_project_name]
+                project_list = list(self.properties.project_list)
+                project_list.remove(self.properties.active_project)
+
+                new_project_name = self.get_project_name(project_path)
+                design_list = dict(self.properties.design_list)
+                design_list[new_project_name] = design_list.pop(old_project_name)
+                self.properties.update_fields(
+                    {
+                        ("active_project",): project_path,
+                        ("project_list",): project_list + [project_path],
+                        ("design_list",): design_list,
+                    }
+                )
             else:
                 self.desktop.save_project()
 
@@ -800,10 +1225,10 @@ class AEDTCommon(Common):
                 if self.properties.active_design:
                     self.desktop.active_design(oproject, self.properties.active_design)
 
-            self.__save_project_info()
+            self.__save_project_info(self.get_project_name(self.properties.active_project))
             if release_aedt:
                 self.release_aedt(False, False)
-            logger.debug("Project is saved: {}".format(project_path))
+            logger.debug("Project is saved: %s", project_path)
             return True
         else:  # pragma: no cover
             logger.error("Project is not saved.")
@@ -856,11 +1281,28 @@ class AEDTCommon(Common):
 
         return design_list
 
+    @traced
     def export_aedt_model(
-        self, obj_list=None, export_path=None, export_as_multiple_objects=False, air_objects=False, encode=True
+        self,
+        obj_list=None,
+        export_path=None,
+        export_as_multiple_objects=False,
+        air_objects=False,
+        encode=True,
+        triangle_budget=None,
+        decimation_ratio=None,
+        merge_tiny_objects=None,
     ):
         """Export the model in the OBJ format and then encode the file if the ``encode`` parameter is enabled.
 
+        Exports to the working directory are cached. The cache is used until the project file changes
+        or :meth:`invalidate_export_cache` is called, without connecting to AEDT.
+
+        The level of detail parameters reduce the model before it is encoded. The reduced objects are
+        written to a new temporary directory, prefixed with ``LOD_EXPORT_PREFIX``. The directory is removed
+        once the objects are encoded. Otherwise, the caller owns it and must remove it once the files
+        are read.
+
         Parameters
         ----------
         obj_list : list, optional
@@ -876,42 +1318,396 @@ class AEDTCommon(Common):
             Whether to export air and vacuum objects. The default is ``False``.
         encode : bool, optional
             Whether to encode the file. The default is ``True``.
+        triangle_budget : int, optional
+            Maximum number of triangles of the whole model. The default is ``None``, in which case
+            the number of triangles is not limited.
+        decimation_ratio : float or dict, optional
+            Ratio between the number of triangles after and before the decimation, for all the objects
+            or per object name. The default is ``None``, in which case the objects are not decimated.
+        merge_tiny_objects : float, optional
+            Objects smaller than this fraction of the model size are merged by color and opacity.
+            The default is ``None``, in which case no object is merged.
 
         Returns
         -------
         list or dict
             List of exported OBJ files or encoded data.
         """
-        if not self.aedtapp:
-            self.connect_design()
+        # Exports to the working directory are cached, unless the project file is saved again
+        project_path = self.properties.active_project
+        design_name = self.properties.active_design
+        use_cache = export_path is None and bool(project_path) and bool(design_name)
+        export_options = {
+            "obj_list": obj_list,
+            "export_as_multiple_objects": export_as_multiple_objects,
+            "air_objects": air_objects,
+        }
+        files = None
+        if use_cache:
+            token = self.export_cache.change_token(project_path)
+            if token:
+                files = self.export_cache.get(
+                    self.export_cache.make_key(project_path, design_name, token, **export_options)
+                )
+            if files:
+                logger.debug("Model export found in cache.")
+
+        if files is None:
+            files = []
+            if not self.aedtapp:
+                self.connect_design()
+            if self.aedtapp:
+                with self.trace_span("aedtapp.save_project"):
+                    self.aedtapp.save_project()
+                with self.trace_span("post.export_model_obj", arguments=summarize_arguments((), export_options)):
+                    files = self.aedtapp.post.export_model_obj(
+                        assignment=obj_list,
+                        export_path=export_path,
+                        export_as_multiple_objects=export_as_multiple_objects,
+                        air_objects=air_objects,
+                    )
+                self.release_aedt(False, False)
+                # The token is read after saving, so that the next export finds this one
+                token = self.export_cache.change_token(project_path) if use_cache else None
+                if files and token:
+                    key = self.export_cache.make_key(project_path, design_name, token, **export_options)
+                    files = self.export_cache.put(key, project_path, files)
+        if files and (triangle_budget or decimation_ratio or merge_tiny_objects):
+            with self.export_cache.pinned(files):
+                meshes = [self.__read_mesh(element) for element in files]
+            files = self.__write_meshes(apply_lod(meshes, triangle_budget, decimation_ratio, merge_tiny_objects))
+            lod_export_dir = os.path.dirname(files[0][0]) if files else None
+        else:
+            lod_export_dir = None
+        # Plot exported files using the following code
+        # from ansys.aedt.core.generic.plot import ModelPlotter
+        # model = ModelPlotter()
+        # for file in files:
+        #     model.add_object(file[0], file[1], file[2])
+        if files and encode:
+            model_info = {}
+            try:
+                with self.export_cache.pinned(files):
+                    for element in files:
+                        element_path = element[0]
+                        encoded_obj = self.serialize_obj_base64(element_path)
+                        name = os.path.splitext(os.path.basename(element_path))[0]
+                        model_info[name] = [encoded_obj.decode("utf-8"), element[1], element[2]]
+            finally:
+                if lod_export_dir:
+                    shutil.rmtree(lod_export_dir, ignore_errors=True)
+            return model_info
+        return files
+
+    def export_aedt_mesh(
+        self,
+        obj_list=None,
+        export_as_multiple_objects=False,
+        air_objects=False,
+        triangle_budget=None,
+        decimation_ratio=None,
+        merge_tiny_objects=None,
+        progressive=False,
+        preview_triangle_budget=PREVIEW_TRIANGLE_BUDGET,
+    ):
+        """Export the model and read its meshes.
+
+        The model is exported in the OBJ format, then each object is read one at a time, unless
+        the level of detail is reduced or the progressive mode is enabled.
+
+        Parameters
+        ----------
+        obj_list : list, optional
+            List of objects to export. The default is ``None``, in which case
+            every model object except 3D, vacuum, and air objects are exported.
+        export_as_multiple_objects : bool, optional
+           Whether to export the model as multiple objects or not. Default is ``False``
+           in which case the model is exported as single object.
+        air_objects : bool, optional
+            Whether to export air and vacuum objects. The default is ``False``.
+        triangle_budget : int, optional
+            Maximum number of triangles of the whole model. The default is ``None``, in which case
+            the number of triangles is not limited.
+        decimation_ratio : float or dict, optional
+            Ratio between the number of triangles after and before the decimation, for all the objects
+            or per object name. The default is ``None``, in which case the objects are not decimated.
+        merge_tiny_objects : float, optional
+            Objects smaller than this fraction of the model size are merged by color and opacity.
+            The default is ``None``, in which case no object is merged.
+        progressive : bool, optional
+            Whether to send a coarse preview of the model before the meshes. The default is ``False``.
+        preview_triangle_budget : int, optional
+            Maximum number of triangles of the preview. The default is ``PREVIEW_TRIANGLE_BUDGET``.
+
+        Returns
+        -------
+        tuple
+            Number of objects and iterator of meshes. Each mesh is a dictionary with the ``name``,
+            ``points``, ``offsets``, ``connectivity``, ``color`` and ``opacity`` keys. Preview meshes
+            come first and have the ``preview`` key set to ``True``.
+        """
+        files = self.export_aedt_model(
+            obj_list=obj_list,
+            export_as_multiple_objects=export_as_multiple_objects,
+            air_objects=air_objects,
+            encode=False,
+        )
+        meshes = self.__pinned_iterator(files, (self.__read_mesh(element) for element in files))
+        if not (triangle_budget or decimation_ratio or merge_tiny_objects or progressive):
+            return len(files), meshes
+
+        meshes = apply_lod(list(meshes), triangle_budget, decimation_ratio, merge_tiny_objects)
+        preview = []
+        if progressive:
+            triangles = sum(len(triangulate(mesh["offsets"], mesh["connectivity"])) for mesh in meshes)
+            if triangles > preview_triangle_budget:
+                preview = [dict(mesh, preview=True) for mesh in apply_lod(meshes, preview_triangle_budget)]
+        return len(files), itertools.chain(preview, meshes)
+
+    def invalidate_export_cache(self, project_path=None):
+        """Remove the cached model exports.
+
+        Toolkit methods modifying the design must call this method, because the cache only
+        detects the changes saved to the project file.
+
+        Parameters
+        ----------
+        project_path : str, optional
+            Full path of the project whose exports are removed. The default is ``None``,
+            in which case all the exports are removed.
+
+        Returns
+        -------
+        int
+            Number of removed exports.
+        """
+        return self.export_cache.invalidate(project_path)
+
+    def export_aedt_model_stream(
+        self,
+        obj_list=None,
+        export_path=None,
+        export_as_multiple_objects=False,
+        air_objects=False,
+        chunk_size=MODEL_STREAM_CHUNK_SIZE,
+    ):
+        """Export the model in the OBJ format and stream the exported files.
+
+        Unlike :meth:`export_aedt_model`, the files are neither loaded in memory nor encoded.
+
+        Parameters
+        ----------
+        obj_list : list, optional
+            List of objects to export. The default is ``None``, in which case
+            every model object except 3D, vacuum, and air objects are exported.
+        export_path : str, optional
+            Full path of the exported OBJ file.
+            The default is ``None``, in which case the file is exported in the working directory.
+        export_as_multiple_objects : bool, optional
+           Whether to export the model as multiple objects or not. Default is ``False``
+           in which case the model is exported as single object.
+        air_objects : bool, optional
+            Whether to export air and vacuum objects. The default is ``False``.
+        chunk_size : int, optional
+            Maximum size of each chunk in bytes. The default is ``MODEL_STREAM_CHUNK_SIZE``.
+
+        Returns
+        -------
+        tuple
+            Manifest and iterator of file chunks. The manifest lists the name, size in bytes, color
+            and opacity of each object, in the order of the chunks. The manifest is empty when no
+            model is exported.
+        """
+        files = self.export_aedt_model(
+            obj_list=obj_list,
+            export_path=export_path,
+            export_as_multiple_objects=export_as_multiple_objects,
+            air_objects=air_objects,
+            encode=False,
+        )
+        manifest = []
+        with self.export_cache.pinned(files):
+            for element in files:
+                element_path = element[0]
+                manifest.append(
+                    {
+                        "name": os.path.splitext(os.path.basename(element_path))[0],
+                        "size": os.path.getsize(element_path),
+                        "color": element[1],
+                        "opacity": element[2],
+                    }
+                )
+            # The sizes are sent first, so the cached files must be kept until the last chunk is sent
+            chunks = self.__pinned_iterator(files, self.iter_file_chunks([element[0] for element in files], chunk_size))
+        return manifest, chunks
+
+    def __pinned_iterator(self, files, iterator):
+        """Pin the cached files of an export until the iterator reading them is exhausted or closed."""
+        pin = self.export_cache.pinned(files)
+        pin.__enter__()
+
+        def pinned_iterator():
+            try:
+                yield from iterator
+            finally:
+                pin.__exit__(None, None, None)
+
+        return pinned_iterator()
+
+    @staticmethod
+    def __read_mesh(element):
+        """Read an exported object."""
+        points, offsets, connectivity = read_obj(element[0])
+        return {
+            "name": os.path.splitext(os.path.basename(element[0]))[0],
+            "points": points,
+            "offsets": offsets,
+            "connectivity": connectivity,
+            "color": element[1],
+            "opacity": element[2],
+        }
+
+    @staticmethod
+    def __write_meshes(meshes):
+        """Write reduced objects to a new level of detail directory.
+
+        Each call has its own directory, so that concurrent exports do not remove each other's files.
+        """
+        export_dir = tempfile.mkdtemp(prefix=LOD_EXPORT_PREFIX)
         files = []
-        if self.aedtapp:
-            self.aedtapp.save_project()
-            files = self.aedtapp.post.export_model_obj(
-                assignment=obj_list,
-                export_path=export_path,
-                export_as_multiple_objects=export_as_multiple_objects,
-                air_objects=air_objects,
-            )
-            self.release_aedt(False, False)
-            # Plot exported files using the following code
-            # from ansys.aedt.core.generic.plot import ModelPlotter
-            # model = ModelPlotter()
-            # for file in files:
-            #     model.add_object(file[0], file[1], file[2])
-            if encode:
-                model_info = {}
-                for element in files:
-                    element_path = element[0]
-                    encoded_obj = self.serialize_obj_base64(element_path)
-                    name = os.path.splitext(os.path.basename(element_path))[0]
-                    model_info[name] = [encoded_obj.decode("utf-8"), element[1], element[2]]
-                return model_info
+        for mesh in meshes:
+            file_path = os.path.join(export_dir, mesh["name"] + ".obj")
+            write_obj(file_path, mesh["points"], mesh["offsets"], mesh["connectivity"])
+            files.append([file_path, mesh["color"], mesh["opacity"]])
         return files
 
+    def get_session_metrics(self) -> Dict[str, Any]:
+        """Get the counters of the AEDT connections.
+
+        Returns
+        -------
+        dict
+            Number and duration of the connections, reused connections, releases and estimated time saved
+            in seconds.
+
+        Examples
+        --------
+        >>> from ansys.aedt.toolkits.common.backend.api import AEDTCommon
+        >>> toolkit_api = AEDTCommon()
+        >>> toolkit_api.get_session_metrics()
+        """
+        return self.session_metrics.to_dict()
+
+    def trace_span(self, name: str, **attributes):
+        """Time an operation in the trace of the AEDT calls.
+
+        The span is nested in the traced phase that runs it, like ``connect_design``. Toolkits can use it
+        to trace their own AEDT calls.
+
+        Parameters
+        ----------
+        name : str
+            Name of the operation.
+        **attributes
+            Attributes of the operation, like the summary of its arguments.
+
+        Returns
+        -------
+        contextlib.AbstractContextManager
+            Span of the operation, or a context that does nothing if the ``trace_aedt_calls`` property
+            is disabled.
+
+        Examples
+        --------
+        >>> from ansys.aedt.toolkits.common.backend.api import AEDTCommon
+        >>> toolkit_api = AEDTCommon()
+        >>> toolkit_api.connect_design()
+        >>> with toolkit_api.trace_span("create_box"):
+        ...     toolkit_api.aedtapp.modeler.create_box([0, 0, 0], [1, 1, 1])
+        """
+        if not self.properties.trace_aedt_calls:
+            return contextlib.nullcontext()
+        return tracer.span(name, **attributes)
+
+    @staticmethod
+    def get_traces(chrome_format: bool = False):
+        """Get the last traces of the AEDT calls.
+
+        Parameters
+        ----------
+        chrome_format : bool, optional
+            Whether to get the traces in the Chrome trace format. The default is ``False``.
+
+        Returns
+        -------
+        list or dict
+            Root span of each trace with its nested spans, from the oldest to the newest,
+            or the trace events in the Chrome trace format.
+
+        Examples
+        --------
+        >>> from ansys.aedt.toolkits.common.backend.api import AEDTCommon
+        >>> toolkit_api = AEDTCommon()
+        >>> toolkit_api.set_properties({"trace_aedt_calls": True})
+        >>> toolkit_api.launch_aedt()
+        >>> toolkit_api.wait_to_be_idle()
+        >>> toolkit_api.get_traces()
+        """
+        if chrome_format:
+            return tracer.chrome_trace()
+        return tracer.traces()
+
+    def __traced_object(self, obj, name):
+        """Wrap an AEDT object to trace its calls if the ``trace_aedt_calls`` property is enabled."""
+        if obj is None or not self.properties.trace_aedt_calls or isinstance(obj, TracedObject):
+            return obj
+        return TracedObject(obj, name, tracer)
+
+    def __is_session_alive(self):
+        """Check that the connected AEDT process is the selected one and that it is still running."""
+        try:
+            selected_process = self.desktop.port if self.properties.use_grpc else self.desktop.aedt_process_id
+            process_id = self.desktop.aedt_process_id
+        except Exception:  # pragma: no cover
+            return False
+        if selected_process != self.properties.selected_process:
+            return False
+        return not process_id or psutil.pid_exists(process_id)
+
+    def __drop_session(self):
+        """Forget a session whose AEDT process is not available."""
+        self.__design_apps.clear()
+        self.desktop = None
+        self.aedtapp = None
+        gc.collect()
+
+    def __schedule_idle_release(self):
+        """Release the kept AEDT session once it is idle."""
+        self.__cancel_idle_release()
+        self.__session_timer = threading.Timer(self.properties.aedt_session_idle_timeout, self.__release_idle_session)
+        self.__session_timer.daemon = True
+        self.__session_timer.start()
+
+    def __cancel_idle_release(self):
+        """Cancel the pending release of the kept AEDT session."""
+        if self.__session_timer:
+            self.__session_timer.cancel()
+            self.__session_timer = None
+
+    def __release_idle_session(self):
+        """Release the kept AEDT session from the idle timer."""
+        with self.__session_lock:
+            # A connection cancels the timer, even if it has already fired
+            if self.__session_timer is not threading.current_thread():
+                return
+            self.__session_timer = None
+            logger.debug("Releasing idle AEDT session.")
+            if self.release_aedt(force=True):
+                self.session_metrics.idle_releases += 1
+
     def __get_aedt_version(self):
         """Get AEDT version and if the student version is used."""
-        if "STUDENT" in self.properties.aedt_version:  # pragma: no cover
+        if "STUDENT" in self.properties.resolve_aedt_version():  # pragma: no cover
             version_text = self.properties.aedt_version.split(" ")
             version = version_text[0]
             is_student = True
@@ -920,34 +1716,52 @@ class AEDTCommon(Common):
             is_student = False
         return version, is_student
 
-    def __save_project_info(self):
-        """Save the project and design information."""
+    @traced
+    def __save_project_info(self, changed_project=None):
+        """Save the project and design information.
+
+        The project information is cached. Only new projects and the changed project are read from AEDT.
+        When no project is specified, the design names of each project are read to detect the changes.
+
+        Parameters
+        ----------
+        changed_project : str, optional
+            Name of the project that changed. The default is ``None``.
+        """
         # Save project and design info
         new_properties = {}
-        project_list = self.desktop.odesktop.GetProjectList()
+        odesktop = self.__traced_object(self.desktop.odesktop, "odesktop")
+        project_list = odesktop.GetProjectList()
+
+        if self.__catalog_process != self.properties.selected_process:
+            self.__project_catalog = {}
+            self.__catalog_process = self.properties.selected_process
+
+        # Closed projects are removed from the catalog
+        for project_name in set(self.__project_catalog) - set(project_list):
+            del self.__project_catalog[project_name]
 
         if project_list:
             new_properties["project_list"] = []
-            active_project = self.desktop.active_project()
+            active_project = self.__traced_object(self.desktop.active_project(), "oproject")
             if not active_project:  # pragma: no cover
                 return False
 
             active_project_name = active_project.GetName()
             active_design = None
-            if active_project.GetChildNames():
+            active_design_names = active_project.GetChildNames()
+            if active_design_names:
                 active_design = self.desktop.active_design(active_project)
 
             # Save active design info
             if active_design:
-                active_design_name = active_design.GetName()
-                design_type = active_design.GetDesignType()
-                active_design_name = self.__design_name(active_design_name, design_type)
+                active_design_name = self.__design_name(active_design.GetName(), active_design.GetDesignType)
 
                 new_properties["active_design"] = active_design_name
 
-            elif active_project.GetChildNames():  # pragma: no cover
+            elif active_design_names:  # pragma: no cover
                 # This case covers when the project has designs but none of them are active
-                active_design_name = active_project.GetChildNames()[0]
+                active_design_name = active_design_names[0]
                 active_project.SetActiveDesign(active_design_name)
                 new_properties["active_design"] = active_design_name
 
@@ -956,37 +1770,75 @@ class AEDTCommon(Common):
             project_name = active_project_name + ".aedt"
             new_properties["active_project"] = str(Path(active_project_path) / project_name)
 
+            # Read the projects to check without activating them
+            oprojects = {}
+            if any(
+                project != active_project_name
+                and (changed_project in (None, project) or project not in self.__project_catalog)
+                for project in project_list
+            ):
+                oprojects = {
+                    oproject.GetName(): self.__traced_object(oproject, "oproject")
+                    for oproject in odesktop.GetProjects()
+                }
+
             # Save projects info
             new_properties["design_list"] = {}
             for project in project_list:
-                oproject = self.desktop.odesktop.SetActiveProject(project)
-                project_name = oproject.GetName()
-                project_path = str(Path(oproject.GetPath()))
-                logger.debug("Project name: {}".format(project_name))
-                project_name_aedt = project_name + ".aedt"
-                new_project = Path(project_path) / project_name_aedt
-                new_properties["project_list"].append(str(new_project))
-
-                new_properties["design_list"][project_name] = []
-
-                design_list = oproject.GetChildNames()
-
-                if design_list:
-                    for design_name in design_list:
-                        try:
-                            design_type = oproject.GetChildObject(design_name).GetDesignType()
-                        except Exception:
-                            design_type = "Exception"
-                        design_name = self.__design_name(design_name, design_type)
-                        new_properties["design_list"][project_name].append(design_name)
+                catalog_entry = self.__project_catalog.get(project)
+                if project == active_project_name:
+                    catalog_entry = self.__update_catalog_entry(
+                        project,
+                        active_project,
+                        catalog_entry if project != changed_project else None,
+                        active_design_names,
+                    )
+                elif not catalog_entry or project == changed_project:
+                    oproject = oprojects.get(project) or self.__traced_object(
+                        odesktop.SetActiveProject(project), "oproject"
+                    )
+                    catalog_entry = self.__update_catalog_entry(project, oproject)
+                elif changed_project is None:
+                    oproject = oprojects.get(project) or self.__traced_object(
+                        odesktop.SetActiveProject(project), "oproject"
+                    )
+                    catalog_entry = self.__update_catalog_entry(project, oproject, catalog_entry)
+                logger.debug("Project name: %s", project)
+                new_properties["project_list"].append(catalog_entry.path)
+                new_properties["design_list"][project] = list(catalog_entry.design_names)
 
         if new_properties:
             self.set_properties(new_properties)
 
+    def __update_catalog_entry(self, project_name, oproject, catalog_entry=None, child_names=None):
+        """Read the project information that changed since the catalog entry was created."""
+        if child_names is None:
+            child_names = oproject.GetChildNames()
+        child_names = tuple(child_names or ())
+        if catalog_entry and catalog_entry.child_names == child_names:
+            return catalog_entry
+
+        project_path = catalog_entry.path if catalog_entry else str(Path(oproject.GetPath()) / (project_name + ".aedt"))
+        design_names = []
+        for design_name in child_names:
+            design_names.append(
+                self.__design_name(design_name, lambda name=design_name: oproject.GetChildObject(name).GetDesignType())
+            )
+        catalog_entry = ProjectCatalogEntry(path=project_path, child_names=child_names, design_names=design_names)
+        self.__project_catalog[project_name] = catalog_entry
+        return catalog_entry
+
     @staticmethod
-    def __design_name(name, solution_type):
-        if solution_type in ["HFSS 3D Layout Design", "Circuit Design", "Maxwell Circuit", "Twin Builder", "Exception"]:
-            name = name if ";" not in name else name.split(";")[1]
+    def __design_name(name, get_design_type):
+        """Get the design name, reading the design type only when the name has a prefix."""
+        if ";" not in name:
+            return name
+        try:
+            design_type = get_design_type()
+        except Exception:
+            design_type = "Exception"
+        if design_type in ["HFSS 3D Layout Design", "Circuit Design", "Maxwell Circuit", "Twin Builder", "Exception"]:
+            name = name.split(";")[1]
         return name
 
 
@@ -1038,19 +1890,21 @@ class EDBCommon(Common):
         if not edb_path:  # pragma: no cover
             edb_path = self.properties.active_project
         if self.edb:
-            logger.error(f"Close EDB {edb_path} before loading a new project.")
+            logger.error("Close EDB %s before loading a new project.", edb_path)
             return False
 
         if os.path.exists(edb_path):
-            aedt_version = self.properties.aedt_version
+            aedt_version = self.properties.resolve_aedt_version()
+            import ansys.aedt.core
+
             ansys.aedt.core.settings.enable_logger = self.properties.debug
             ansys.aedt.core.settings.enable_debug_edb_logger = self.properties.debug
             self.properties.active_project = edb_path
             self.edb = ansys.aedt.core.Edb(edb_path, version=aedt_version)
-            logger.debug("Project {} is opened".format(edb_path))
+            logger.debug("Project %s is opened", edb_path)
             return True
         else:
-            logger.error("Project {} does not exist".format(edb_path))
+            logger.error("Project %s does not exist", edb_path)
             return False
 
     def close_edb(self):
@@ -1104,7 +1958,7 @@ class EDBCommon(Common):
                 edb_path = self.edb.edbpath
             else:
                 self.edb.save_as(edb_path)
-            logger.info("Project {} saved".format(edb_path))
+            logger.info("Project %s saved", edb_path)
             return True
         else:  # pragma: no cover
             return False
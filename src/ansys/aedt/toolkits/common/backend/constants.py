@@ -54,3 +54,22 @@ NAME_TO_AEDT_APP = {
     "Simplorer": "TwinBuilder",
     "Mechanical": "Mechanical",
 }
+
+# Mapping from the design block name in AEDT project files to the design type
+AEDT_MODEL_TO_DESIGN_TYPE = {
+    "HFSSModel": "HFSS",
+    "Q3DModel": "Q3D Extractor",
+    "2DExtractorModel": "2D Extractor",
+    "IcepakModel": "Icepak",
+    "IcepakFEAModel": "IcepakFEA",
+    "PlanarEMCircuit": "HFSS 3D Layout Design",
+    "SimplorerCircuit": "Twin Builder",
+    "RMxprtDesign": "RMxprtSolution",
+    "Maxwell3DModel": "Maxwell 3D",
+    "Maxwell2DModel": "Maxwell 2D",
+    "EMIT": "EMIT",
+    "MaxCirCircuit": "Maxwell Circuit",
+    "NexximCircuit": "Circuit Design",
+    "NexximNetlist": "Circuit Netlist",
+    "MechanicalModel": "Mechanical",
+}
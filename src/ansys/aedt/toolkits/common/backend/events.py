@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from collections import deque
+import json
+import threading
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+PUBLISHED_PROPERTIES = {"state": "state", "progress": "progress", "is_toolkit_busy": "busy"}
+"""Properties published when they change, mapped to their event name."""
+
+
+class EventSubscription:
+    """Stores the events pending for one subscriber.
+
+    When the subscriber does not keep up, the oldest events are discarded.
+
+    Parameters
+    ----------
+    max_pending_events : int, optional
+        Maximum number of events kept for the subscriber. The default is ``256``.
+    """
+
+    def __init__(self, max_pending_events: int = 256):
+        self._events: "deque[Tuple[str, Any]]" = deque(maxlen=max_pending_events)
+        self._condition = threading.Condition()
+        self.closed = False
+
+    def put(self, event: str, data: Any):
+        """Add an event and wake up the subscriber."""
+        with self._condition:
+            self._events.append((event, data))
+            self._condition.notify()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Tuple[str, Any]]:
+        """Get the next event.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time in seconds to wait for an event. The default is ``None``,
+            in which case it waits until an event is published.
+
+        Returns
+        -------
+        tuple or None
+            Event name and data, or ``None`` if no event was published before the timeout
+            or if the subscription is closed.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._events or self.closed, timeout=timeout)
+            if self._events:
+                return self._events.popleft()
+            return None
+
+    def close(self):
+        """Wake up the subscriber so that it stops waiting for events."""
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+
+
+class EventBroker:
+    """Publishes backend events to the subscribers.
+
+    Publishing never blocks the publisher: each subscriber keeps its own bounded buffer.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions: List[EventSubscription] = []
+
+    @property
+    def subscribers(self) -> int:
+        """Number of active subscribers."""
+        with self._lock:
+            return len(self._subscriptions)
+
+    def subscribe(self, max_pending_events: int = 256) -> EventSubscription:
+        """Create a new subscription.
+
+        Parameters
+        ----------
+        max_pending_events : int, optional
+            Maximum number of events kept for the subscriber. The default is ``256``.
+
+        Returns
+        -------
+        :class:`EventSubscription`
+            Subscription receiving the events published from now on.
+        """
+        subscription = EventSubscription(max_pending_events)
+        with self._lock:
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription):
+        """Remove a subscription."""
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+        subscription.close()
+
+    def publish(self, event: str, data: Any = None):
+        """Publish an event to all the subscribers.
+
+        Parameters
+        ----------
+        event : str
+            Event name.
+        data : Any, optional
+            JSON serializable event data.
+        """
+        with self._lock:
+            if not self._subscriptions:
+                return
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            subscription.put(event, data)
+
+
+def format_sse(event: str, data: Any = None) -> str:
+    """Format an event as a Server-Sent Events message.
+
+    Parameters
+    ----------
+    event : str
+        Event name.
+    data : Any, optional
+        JSON serializable event data.
+
+    Returns
+    -------
+    str
+        Message ready to be written to the ``text/event-stream`` response.
+    """
+    return "event: {}\ndata: {}\n\n".format(event, json.dumps(data))
+
+
+event_broker = EventBroker()
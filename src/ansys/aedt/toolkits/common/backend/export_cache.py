@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from collections import Counter
+from collections import OrderedDict
+import contextlib
+import getpass
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from ansys.aedt.toolkits.common.backend.logger_handler import logger
+
+DEFAULT_EXPORT_CACHE_SIZE = int(os.environ.get("PYAEDT_TOOLKIT_EXPORT_CACHE_SIZE", 512)) * 1024 * 1024
+"""Maximum size of the export cache in bytes."""
+MANIFEST_NAME = "manifest.json"
+STAGING_SUFFIX = ".staging"
+"""Suffix of the directories where the entries are written before they are added to the cache."""
+STALE_STAGING_AGE = 24 * 3600
+"""Age in seconds after which a staging directory left by a stopped backend is removed."""
+
+
+def default_export_cache_dir() -> str:
+    """Get the default directory of the export cache.
+
+    The directory is in the temporary directory and named after the user, so that the backends of
+    different users on a shared node do not remove each other's entries.
+
+    Returns
+    -------
+    str
+        Path of the directory.
+    """
+    return os.path.join(tempfile.gettempdir(), "pyaedt_toolkits_export_cache_{}".format(getpass.getuser()))
+
+
+class ExportCache:
+    """Stores exported model files on disk, evicting the least recently used entries.
+
+    Each entry is a directory containing a copy of the exported files and a manifest with the
+    project path, the object colors and opacities. The cache survives backend restarts.
+
+    Entries are written to a staging directory, then renamed, so that readers and the other backends
+    sharing the directory never see a partial entry. Entries pinned with :meth:`pinned` are neither
+    evicted nor removed from the disk until they are unpinned.
+
+    Parameters
+    ----------
+    cache_dir : str, optional
+        Cache directory. The default is ``None``, in which case :func:`default_export_cache_dir` is used.
+    max_size : int, optional
+        Maximum size of the cached files in bytes. The default is ``DEFAULT_EXPORT_CACHE_SIZE``.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_size: int = DEFAULT_EXPORT_CACHE_SIZE):
+        self.cache_dir = cache_dir or default_export_cache_dir()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._pins = Counter()
+        self._removed_pinned = set()
+        self._load()
+
+    @property
+    def size(self) -> int:
+        """Size of the cached files in bytes."""
+        with self._lock:
+            return sum(entry["size"] for entry in self._entries.values())
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    @staticmethod
+    def change_token(project_path: str) -> Optional[str]:
+        """Get a token that changes each time the project file is saved.
+
+        Parameters
+        ----------
+        project_path : str
+            Full path of the project file.
+
+        Returns
+        -------
+        str or None
+            Token built from the modification time and size of the file, ``None`` if the file does not exist.
+        """
+        try:
+            stat = os.stat(project_path)
+        except OSError:
+            return None
+        return "{}-{}".format(stat.st_mtime_ns, stat.st_size)
+
+    @staticmethod
+    def make_key(project_path: str, design: str, token: str, **export_options) -> str:
+        """Build the cache key of an export.
+
+        Parameters
+        ----------
+        project_path : str
+            Full path of the project file.
+        design : str
+            Design name.
+        token : str
+            Change token of the project. See :meth:`change_token`.
+        **export_options
+            Options of the export, for example the object list.
+
+        Returns
+        -------
+        str
+            Cache key.
+        """
+        description = json.dumps(
+            [os.path.normcase(os.path.abspath(project_path)), design, token, export_options],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(description.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[List[List[Any]]]:
+        """Get the files of a cached export.
+
+        Parameters
+        ----------
+        key : str
+            Cache key.
+
+        Returns
+        -------
+        list or None
+            File path, color and opacity of each exported object, ``None`` if the export is not cached.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not all(os.path.isfile(element[0]) for element in entry["files"]):
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        # Keep the recency across restarts
+        try:
+            os.utime(os.path.join(self.cache_dir, key, MANIFEST_NAME))
+        except OSError:  # pragma: no cover
+            pass
+        return [list(element) for element in entry["files"]]
+
+    def put(self, key: str, project_path: str, files: List[List[Any]]) -> List[List[Any]]:
+        """Add an export to the cache.
+
+        Parameters
+        ----------
+        key : str
+            Cache key.
+        project_path : str
+            Full path of the project file, used by :meth:`invalidate`.
+        files : list
+            File path, color and opacity of each exported object.
+
+        Returns
+        -------
+        list
+            File path, color and opacity of each cached object. The original files are returned
+            if the export cannot be cached.
+        """
+        entry_dir = os.path.join(self.cache_dir, key)
+        staging_dir = None
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            staging_dir = tempfile.mkdtemp(prefix=key + ".", suffix=STAGING_SUFFIX, dir=self.cache_dir)
+            cached_files = []
+            size = 0
+            for element in files:
+                file_name = os.path.basename(element[0])
+                shutil.copyfile(element[0], os.path.join(staging_dir, file_name))
+                size += os.path.getsize(os.path.join(staging_dir, file_name))
+                cached_files.append([os.path.join(entry_dir, file_name)] + list(element[1:]))
+            entry = {"project": os.path.normcase(os.path.abspath(project_path)), "files": cached_files, "size": size}
+            with open(os.path.join(staging_dir, MANIFEST_NAME), "w") as f:
+                json.dump(entry, f)
+        except OSError as e:
+            logger.debug("Export not cached: %s", e)
+            if staging_dir:
+                shutil.rmtree(staging_dir, ignore_errors=True)
+            return files
+
+        with self._lock:
+            if key in self._removed_pinned:
+                # The removed entry is still read, its directory cannot be replaced yet
+                shutil.rmtree(staging_dir, ignore_errors=True)
+                return files
+            existing = self._entries.get(key) or self._read_manifest(key)
+            if existing is not None and all(os.path.isfile(element[0]) for element in existing["files"]):
+                # Another writer, maybe another backend, added the same export first
+                shutil.rmtree(staging_dir, ignore_errors=True)
+                self._entries[key] = existing
+                self._entries.move_to_end(key)
+                self._evict(keep=key)
+                return [list(element) for element in existing["files"]]
+            self._entries.pop(key, None)
+            try:
+                shutil.rmtree(entry_dir, ignore_errors=True)
+                os.replace(staging_dir, entry_dir)
+            except OSError as e:  # pragma: no cover
+                logger.debug("Export not cached: %s", e)
+                shutil.rmtree(staging_dir, ignore_errors=True)
+                return files
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._evict(keep=key)
+        return [list(element) for element in cached_files]
+
+    @contextlib.contextmanager
+    def pinned(self, files: List[List[Any]]):
+        """Keep the cached files of an export on the disk while they are read.
+
+        Parameters
+        ----------
+        files : list
+            File path, color and opacity of each exported object, as returned by :meth:`get`
+            or :meth:`put`. Files outside the cache are ignored.
+        """
+        cache_dir = os.path.normcase(os.path.abspath(self.cache_dir))
+        keys = set()
+        for element in files:
+            entry_dir = os.path.dirname(os.path.normcase(os.path.abspath(element[0])))
+            if os.path.dirname(entry_dir) == cache_dir:
+                keys.add(os.path.basename(entry_dir))
+        with self._lock:
+            self._pins.update(keys)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._pins.subtract(keys)
+                for key in keys:
+                    if self._pins[key] <= 0:
+                        del self._pins[key]
+                        if key in self._removed_pinned:
+                            self._removed_pinned.discard(key)
+                            shutil.rmtree(os.path.join(self.cache_dir, key), ignore_errors=True)
+
+    def invalidate(self, project_path: Optional[str] = None) -> int:
+        """Remove cached exports.
+
+        Parameters
+        ----------
+        project_path : str, optional
+            Full path of the project whose exports are removed. The default is ``None``,
+            in which case all the exports are removed.
+
+        Returns
+        -------
+        int
+            Number of removed exports.
+        """
+        project = os.path.normcase(os.path.abspath(project_path)) if project_path else None
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if project is None or entry["project"] == project]
+            for key in keys:
+                self._remove(key)
+        if keys:
+            logger.debug("%s cached exports invalidated.", len(keys))
+        return len(keys)
+
+    def _evict(self, keep: Optional[str]):
+        total_size = sum(entry["size"] for entry in self._entries.values())
+        for key in list(self._entries):
+            if total_size <= self.max_size:
+                break
+            if key == keep or key in self._pins:
+                continue
+            total_size -= self._entries[key]["size"]
+            self._remove(key)
+
+    def _remove(self, key: str):
+        self._entries.pop(key, None)
+        if key in self._pins:
+            # The directory is removed once the entry is not read anymore
+            self._removed_pinned.add(key)
+        else:
+            shutil.rmtree(os.path.join(self.cache_dir, key), ignore_errors=True)
+
+    def _read_manifest(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(os.path.join(self.cache_dir, key, MANIFEST_NAME)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _load(self):
+        """Load the entries left by previous backends, oldest first.
+
+        Nothing is removed but the staging directories left by stopped backends, because other running
+        backends can share the directory. The size limit is applied on the next :meth:`put`.
+        """
+        if not os.path.isdir(self.cache_dir):
+            return
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            entry_dir = os.path.join(self.cache_dir, name)
+            if name.endswith(STAGING_SUFFIX):
+                try:
+                    if time.time() - os.path.getmtime(entry_dir) > STALE_STAGING_AGE:
+                        shutil.rmtree(entry_dir, ignore_errors=True)
+                except OSError:  # pragma: no cover
+                    pass
+                continue
+            entry = self._read_manifest(name)
+            if entry is None:
+                logger.debug("Export cache entry %s skipped.", name)
+                continue
+            try:
+                entries.append((os.path.getmtime(os.path.join(entry_dir, MANIFEST_NAME)), name, entry))
+            except OSError:  # pragma: no cover
+                pass
+        for _, key, entry in sorted(entries, key=lambda item: item[0]):
+            self._entries[key] = entry
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Discovery of the AEDT installations.
+
+AEDT installations are found from the ``ANSYSEM*`` and ``AWP_ROOT*`` environment variables through PyAEDT.
+Importing PyAEDT is the slowest part of the backend startup, so the discovery only runs on first use. Its
+result is kept in memory and in a JSON file of the per-user runtime directory, keyed on these environment
+variables, so a backend started with the same environment neither imports PyAEDT nor searches again.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from ansys.aedt.toolkits.common.utils import get_runtime_dir
+
+INSTALLATIONS_FILE_NAME = "aedt_installations.json"
+"""Name of the installation cache file in the per-user runtime directory."""
+INSTALLATION_VARIABLE_PREFIXES = ("ANSYSEM", "AWP_ROOT")
+"""Prefixes of the environment variables the installations are found from."""
+KNOWN_PREFIXES = ("AWP_ROOT", "ANSYSEM_PY_CLIENT_ROOT", "ANSYSEMSV_ROOT", "ANSYSEM_ROOT")
+"""Prefixes of the environment variables of an AEDT installation, followed by the version digits."""
+
+
+def installation_environment() -> Dict[str, str]:
+    """Get the environment variables the AEDT installations are found from.
+
+    Returns
+    -------
+    dict
+        Name and value of the ``ANSYSEM*`` and ``AWP_ROOT*`` environment variables.
+    """
+    return {
+        name: value for name, value in os.environ.items() if name.upper().startswith(INSTALLATION_VARIABLE_PREFIXES)
+    }
+
+
+def environment_key(environment: Optional[Dict[str, str]] = None) -> str:
+    """Get the key of the installation cache for an environment.
+
+    Parameters
+    ----------
+    environment : dict, optional
+        Environment variables of the installations. The default is the current ones.
+
+    Returns
+    -------
+    str
+        Hash of the sorted environment variables.
+    """
+    if environment is None:
+        environment = installation_environment()
+    return hashlib.sha256(json.dumps(sorted(environment.items())).encode("utf-8")).hexdigest()
+
+
+def versions_from_variables(variables: List[str]) -> List[str]:
+    """Convert the environment variables of the AEDT installations to AEDT versions.
+
+    Parameters
+    ----------
+    variables : list
+        Names of the environment variables, for instance ``["ANSYSEM_ROOT252", "ANSYSEMSV_ROOT251"]``.
+
+    Returns
+    -------
+    list
+        Sorted AEDT versions, for instance ``["2025.1 STUDENT", "2025.2"]``.
+    """
+    installed_versions = []
+    for ver in variables:
+        for prefix in KNOWN_PREFIXES:
+            if prefix in ver:
+                digits = ver.replace(prefix, "")
+                suffix = " STUDENT" if prefix == "ANSYSEMSV_ROOT" else ""
+                installed_versions.append(f"20{digits[:2]}.{digits[-1]}{suffix}")
+                break
+    return sorted(set(installed_versions))
+
+
+def discover_installations() -> Dict[str, Any]:
+    """Find the AEDT installations through PyAEDT.
+
+    Returns
+    -------
+    dict
+        Environment variables of the installations and current AEDT version.
+    """
+    import ansys.aedt.core
+
+    if ansys.aedt.core.__version__ <= "0.11.0":  # pragma: no cover
+        from ansys.aedt.core.misc import current_version
+        from ansys.aedt.core.misc import list_installed_ansysem
+
+        variables = list_installed_ansysem()
+        version = current_version()
+    else:
+        from ansys.aedt.core.internal.aedt_versions import aedt_versions
+
+        variables = aedt_versions.list_installed_ansysem
+        version = aedt_versions.current_version
+    return {"variables": list(variables), "current_version": version or ""}
+
+
+class AEDTInstallations:
+    """Provides the AEDT installations, discovered once per environment.
+
+    Parameters
+    ----------
+    cache_file : str, optional
+        Cache file. The default is ``INSTALLATIONS_FILE_NAME`` in the per-user runtime directory.
+    """
+
+    def __init__(self, cache_file: Optional[str] = None):
+        self.cache_file = cache_file
+        self.discoveries = 0
+        self._lock = threading.Lock()
+        self._key: Optional[str] = None
+        self._installations: Optional[Dict[str, Any]] = None
+
+    @property
+    def installed_versions(self) -> List[str]:
+        """Installed AEDT versions."""
+        return versions_from_variables(self.get()["variables"])
+
+    @property
+    def current_version(self) -> str:
+        """Latest installed AEDT version, or an empty string if AEDT is not installed."""
+        return self.get()["current_version"]
+
+    def get(self) -> Dict[str, Any]:
+        """Get the AEDT installations of the current environment.
+
+        The installations are read from memory, then from the cache file, and only discovered through
+        PyAEDT when the environment variables changed.
+
+        Returns
+        -------
+        dict
+            Environment variables of the installations and current AEDT version.
+        """
+        key = environment_key()
+        with self._lock:
+            if self._key == key:
+                return self._installations
+            installations = self._load(key)
+            if installations is None:
+                installations = discover_installations()
+                self.discoveries += 1
+                self._save(key, installations)
+            self._key = key
+            self._installations = installations
+            return installations
+
+    def clear(self):
+        """Clear the installations kept in memory."""
+        with self._lock:
+            self._key = None
+            self._installations = None
+
+    def _cache_path(self) -> str:
+        """Get the path of the cache file."""
+        return self.cache_file or os.path.join(get_runtime_dir(), INSTALLATIONS_FILE_NAME)
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load the installations of an environment from the cache file."""
+        try:
+            with open(self._cache_path(), "r") as f:
+                entry = json.load(f)
+            if entry["key"] == key:
+                return {"variables": list(entry["variables"]), "current_version": str(entry["current_version"])}
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+    def _save(self, key: str, installations: Dict[str, Any]):
+        """Save the installations of an environment in the cache file."""
+        try:
+            cache_file = self._cache_path()
+            temp_file = "{}.{}.tmp".format(cache_file, threading.get_ident())
+            with open(temp_file, "w") as f:
+                json.dump(dict(installations, key=key), f)
+            os.replace(temp_file, cache_file)
+        except OSError:  # pragma: no cover
+            # The installations are discovered again by the next backend
+            pass
+
+
+aedt_installations = AEDTInstallations()
+"""AEDT installations of the backend."""
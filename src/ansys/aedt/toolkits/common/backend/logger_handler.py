@@ -22,51 +22,174 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+"""Backend logger.
+
+Records are put in a queue by the threads that log them, and written to the console and to the log file by
+a listener thread, so disk writes are not on the request path. The log file is rotated when it reaches
+``log_max_bytes`` bytes or after ``log_rotation_interval`` seconds, and ``log_format = "json"`` writes one
+JSON object per line, with the ID of the request and of the job the record was logged from.
+"""
+
+import atexit
+import contextvars
+import copy
+from datetime import datetime
+import json
 import logging
+from logging.handlers import QueueHandler
+from logging.handlers import QueueListener
+from logging.handlers import RotatingFileHandler
 import os.path
+import queue
 import tempfile
+import time
 
 from ansys.aedt.toolkits.common.backend.models import common_properties
 
-debug = common_properties.debug
-log_file = common_properties.log_file
+request_id_var = contextvars.ContextVar("request_id", default=None)
+"""ID of the request handled by the current thread."""
+job_id_var = contextvars.ContextVar("job_id", default=None)
+"""ID of the job run by the current thread."""
 
-# Create a logger
-logger = logging.getLogger(__name__)
-if log_file:
-    toolkit_name = common_properties.toolkit_name
-    log_file_name = toolkit_name + "_" + log_file
-    temp_dir = os.path.join(tempfile.gettempdir(), log_file_name)
 
-    if not os.path.exists(temp_dir):  # pragma: no cover
-        file = open(temp_dir, "w")
-        file.close()
+class ContextQueueHandler(QueueHandler):
+    """Puts the records in a queue, with the request ID and job ID of the thread that logs them."""
+
+    def prepare(self, record):
+        # The message is merged here, since its arguments may change once the record is queued
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        record.request_id = request_id_var.get()
+        record.job_id = job_id_var.get()
+        return record
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formats the records as JSON objects, one per line."""
+
+    def format(self, record):
+        entry = {
+            "time": datetime.fromtimestamp(record.created).astimezone().isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+            # Records formatted by the thread that logs them are not prepared by the queue handler
+            "request_id": getattr(record, "request_id", request_id_var.get()),
+            "job_id": getattr(record, "job_id", job_id_var.get()),
+        }
+        if record.exc_info and not record.exc_text:  # pragma: no cover
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class SizeTimedRotatingFileHandler(RotatingFileHandler):
+    """Rotates the log file when it reaches a size or when a time interval elapsed.
+
+    Parameters
+    ----------
+    filename : str
+        Log file.
+    max_bytes : int, optional
+        Size in bytes the file is rotated at. The default is ``0``, in which case the size is not checked.
+    interval : float, optional
+        Seconds after which the file is rotated. The default is ``0``, in which case the time is not checked.
+    backup_count : int, optional
+        Number of rotated files kept. The default is ``5``.
+    """
+
+    def __init__(self, filename, max_bytes=0, interval=0, backup_count=5):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, delay=True)
+        self.interval = interval
+        self.rollover_at = time.time() + interval if interval else None
+
+    def shouldRollover(self, record):
+        if self.rollover_at is not None and time.time() >= self.rollover_at:
+            return True
+        return bool(super().shouldRollover(record))
 
-    log_file = temp_dir
+    def doRollover(self):
+        super().doRollover()
+        if self.interval:
+            self.rollover_at = time.time() + self.interval
 
-    file_handler = logging.FileHandler(log_file)
 
-    # Set the log format
-    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-    file_handler.setFormatter(formatter)
+def create_handlers(properties):
+    """Create the handlers that write the backend records.
 
-    # Add the file handler to the logger
-    logger.addHandler(file_handler)
+    Parameters
+    ----------
+    properties : CommonProperties
+        Backend properties with the log file, format, and rotation settings.
 
-if debug:
+    Returns
+    -------
+    list
+        Console handler, followed by the file handler if ``properties.log_file`` is set.
+    """
+    if properties.log_format == "json":
+        formatter = JsonLinesFormatter()
+        file_formatter = formatter
+    else:
+        formatter = logging.Formatter("%(levelname)s - %(message)s")
+        file_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+
+    # Create a stream handler for logging to the console
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
+    handlers = [console_handler]
+
+    if properties.log_file:
+        log_file = os.path.join(tempfile.gettempdir(), properties.toolkit_name + "_" + properties.log_file)
+        file_handler = SizeTimedRotatingFileHandler(
+            log_file,
+            max_bytes=properties.log_max_bytes,
+            interval=properties.log_rotation_interval,
+            backup_count=properties.log_backup_count,
+        )
+        file_handler.setFormatter(file_formatter)
+        handlers.append(file_handler)
+    return handlers
+
+
+def setup_logger(logger, handlers):
+    """Send the records of a logger to handlers through a queue.
+
+    Parameters
+    ----------
+    logger : logging.Logger
+        Logger.
+    handlers : list
+        Handlers run by the listener thread.
+
+    Returns
+    -------
+    logging.handlers.QueueListener
+        Started listener. Stopping it writes the queued records.
+    """
+    log_queue = queue.SimpleQueue()
+    queue_handler = ContextQueueHandler(log_queue)
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+    logger.addHandler(queue_handler)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+# Create a logger
+logger = logging.getLogger(__name__)
+if common_properties.debug:
     # Set log level (e.g., DEBUG, INFO, WARNING, ERROR)
     logger.setLevel(logging.DEBUG)
-    # Create a file handler for the logger
 else:
     logger.setLevel(logging.INFO)
 
-
-# Create a stream handler for logging to the console
-console_handler = logging.StreamHandler()
-
-# Set the log format
-formatter = logging.Formatter("%(levelname)s - %(message)s")
-console_handler.setFormatter(formatter)
-
-# Add the console handler to the logger
-logger.addHandler(console_handler)
+log_listener = setup_logger(logger, create_handlers(common_properties))
+atexit.register(log_listener.stop)
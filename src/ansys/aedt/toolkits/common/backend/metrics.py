@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Backend metrics in the Prometheus text exposition format.
+
+Recording a value only takes a lock and a few additions. The text is built when ``/metrics`` is
+requested, and gauges are read from callbacks at that time, so metrics nobody scrapes cost almost nothing.
+"""
+
+from bisect import bisect_left
+import math
+import threading
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+"""Content type of the text exposition format."""
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+"""Upper bounds in seconds of the default histogram buckets."""
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Tuple[str, ...], values: Tuple, extra: str = "") -> str:
+    pairs = ['{}="{}"'.format(name, _escape(value)) for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Counts events, optionally split by label values.
+
+    Parameters
+    ----------
+    name : str
+        Metric name.
+    documentation : str
+        Help text of the metric.
+    labelnames : tuple, optional
+        Label names. The default is ``()``.
+    """
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple, float] = {}
+
+    def inc(self, *labelvalues, amount: float = 1):
+        """Increment the counter of the label values."""
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def value(self, *labelvalues) -> float:
+        """Get the counter of the label values."""
+        with self._lock:
+            return self._values.get(labelvalues, 0)
+
+    def samples(self) -> List[str]:
+        """Get the sample lines of the metric."""
+        with self._lock:
+            values = sorted(self._values.items())
+        return [
+            "{}_total{} {}".format(self.name, _labels(self.labelnames, key), _number(value)) for key, value in values
+        ]
+
+
+class Histogram:
+    """Counts observed values in buckets, optionally split by label values.
+
+    Parameters
+    ----------
+    name : str
+        Metric name.
+    documentation : str
+        Help text of the metric.
+    labelnames : tuple, optional
+        Label names. The default is ``()``.
+    buckets : tuple, optional
+        Sorted upper bounds of the buckets. The default is ``DEFAULT_BUCKETS``.
+    """
+
+    metric_type = "histogram"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Tuple[str, ...] = (), buckets: Tuple[float, ...] = None
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets or DEFAULT_BUCKETS)
+        self._lock = threading.Lock()
+        # Per label values: count of each bucket, the last one being +Inf, and sum of the values
+        self._values: Dict[Tuple, List] = {}
+
+    def observe(self, value: float, *labelvalues):
+        """Add a value to the histogram of the label values."""
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labelvalues)
+            if entry is None:
+                entry = self._values[labelvalues] = [[0] * (len(self.buckets) + 1), 0.0]
+            entry[0][index] += 1
+            entry[1] += value
+
+    def count(self, *labelvalues) -> int:
+        """Get the number of values observed for the label values."""
+        with self._lock:
+            entry = self._values.get(labelvalues)
+            return sum(entry[0]) if entry else 0
+
+    def samples(self) -> List[str]:
+        """Get the sample lines of the metric."""
+        with self._lock:
+            values = sorted((key, (list(counts), total)) for key, (counts, total) in self._values.items())
+        lines = []
+        for key, (counts, total) in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                le = 'le="{}"'.format(_number(bound))
+                lines.append("{}_bucket{} {}".format(self.name, _labels(self.labelnames, key, le), cumulative))
+            lines.append("{}_sum{} {}".format(self.name, _labels(self.labelnames, key), _number(total)))
+            lines.append("{}_count{} {}".format(self.name, _labels(self.labelnames, key), cumulative))
+        return lines
+
+
+class CallbackMetric:
+    """Metric whose values are read from a callback when the metrics are rendered.
+
+    Parameters
+    ----------
+    name : str
+        Metric name. A counter name does not include the ``_total`` suffix.
+    documentation : str
+        Help text of the metric.
+    callback : callable
+        Function returning a number, or a dictionary of numbers keyed on the label values.
+    labelnames : tuple, optional
+        Label names. The default is ``()``.
+    metric_type : str, optional
+        ``"gauge"`` or ``"counter"``. The default is ``"gauge"``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable,
+        labelnames: Tuple[str, ...] = (),
+        metric_type: str = "gauge",
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.callback = callback
+        self.labelnames = tuple(labelnames)
+        self.metric_type = metric_type
+
+    def samples(self) -> List[str]:
+        """Get the sample lines of the metric."""
+        values = self.callback()
+        if not isinstance(values, dict):
+            values = {(): values}
+        suffix = "_total" if self.metric_type == "counter" else ""
+        return [
+            "{}{}{} {}".format(self.name, suffix, _labels(self.labelnames, key), _number(value))
+            for key, value in sorted(values.items())
+        ]
+
+
+class MetricsRegistry:
+    """Stores the backend metrics and renders them in the text exposition format."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, object] = {}
+
+    def register(self, metric):
+        """Register a metric, replacing a metric with the same name.
+
+        Parameters
+        ----------
+        metric : Counter, Histogram, or CallbackMetric
+            Metric.
+
+        Returns
+        -------
+        Counter, Histogram, or CallbackMetric
+            Registered metric.
+        """
+        with self._lock:
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        """Register a counter."""
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames: Tuple[str, ...] = (), buckets: Tuple[float, ...] = None
+    ) -> Histogram:
+        """Register a histogram."""
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def callback(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable,
+        labelnames: Tuple[str, ...] = (),
+        metric_type: str = "gauge",
+    ) -> CallbackMetric:
+        """Register a metric read from a callback when the metrics are rendered."""
+        return self.register(CallbackMetric(name, documentation, callback, labelnames, metric_type))
+
+    def render(self) -> str:
+        """Render the metrics in the text exposition format.
+
+        Returns
+        -------
+        str
+            Metrics, sorted by name.
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.items())
+        lines = []
+        for name, metric in metrics:
+            # The samples of a counter are named with the _total suffix, and so must be its family
+            if metric.metric_type == "counter":
+                name += "_total"
+            lines.append("# HELP {} {}".format(name, metric.documentation.replace("\\", "\\\\").replace("\n", "\\n")))
+            lines.append("# TYPE {} {}".format(name, metric.metric_type))
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+"""Metrics of the backend."""
@@ -22,28 +22,82 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from functools import lru_cache
 import os
 import sys
+import threading
+from types import MappingProxyType
 
 if sys.version_info >= (3, 11):  # pragma: no cover
     import tomllib
 else:
     import tomli as tomllib
 
+from typing import Any
 from typing import Dict
 from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Tuple
 
-from ansys.aedt.core.internal.aedt_versions import aedt_versions
 from pydantic import BaseModel
 from pydantic import Field
+from pydantic import PrivateAttr
 
-DEFAULT_AEDT_VERSION = aedt_versions.current_version
+from ansys.aedt.toolkits.common.backend.events import PUBLISHED_PROPERTIES
+from ansys.aedt.toolkits.common.backend.events import event_broker
+from ansys.aedt.toolkits.common.backend.installations import aedt_installations
+
+
+@lru_cache(maxsize=None)
+def field_paths(model_cls: type) -> Dict[str, Tuple[str, ...]]:
+    """Get the path of each field of a model class, nested models included.
+
+    The index is built once per model class. A field of the model itself takes
+    precedence over a nested field with the same name. Between nested fields,
+    the first one found in the field order wins.
+
+    Parameters
+    ----------
+    model_cls : type
+        Pydantic model class.
+
+    Returns
+    -------
+    dict
+        Field paths keyed on the field name. The dictionary is shared and must not be modified.
+    """
+    paths = {name: (name,) for name in model_cls.model_fields}
+    for name, field in model_cls.model_fields.items():
+        annotation = field.annotation
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            for key, path in field_paths(annotation).items():
+                paths.setdefault(key, (name,) + path)
+    return paths
+
+
+def _updated_value(model: BaseModel, name: str, updates: Dict[Tuple[str, ...], Any]) -> Any:
+    """Get the new value of a field, with the updates of its nested fields applied.
+
+    The updated nested models are returned as dictionaries so that they are validated again.
+    The other nested models are passed as they are. A new value for the whole field takes
+    precedence over the updates of its nested fields.
+    """
+    if () in updates:
+        return updates[()]
+    values = dict(getattr(model, name).__dict__)
+    nested = {}
+    for path, value in updates.items():
+        nested.setdefault(path[0], {})[path[1:]] = value
+    for nested_name, nested_updates in nested.items():
+        values[nested_name] = _updated_value(getattr(model, name), nested_name, nested_updates)
+    return values
 
 
 class CommonProperties(BaseModel):
     """Stores common AEDT properties."""
 
-    aedt_version: str = DEFAULT_AEDT_VERSION
+    aedt_version: str = ""
     non_graphical: bool = False
     active_project: str = ""
     active_design: str = ""
@@ -54,11 +108,184 @@ class CommonProperties(BaseModel):
     is_toolkit_busy: bool = False
     url: str = "127.0.0.1"
     port: int = 5001
+    unix_socket: str = ""
     debug: bool = True
     toolkit_name: str = "common"
     log_file: str = "common_backend.log"
+    log_format: str = "text"
+    log_max_bytes: int = 10 * 1024 * 1024
+    log_backup_count: int = 5
+    log_rotation_interval: float = 24 * 3600
     state: str = ""
     progress: int = 0
+    keep_aedt_session: bool = False
+    aedt_session_idle_timeout: float = 300
+    trace_aedt_calls: bool = False
+    max_traces: int = 20
+    trace_file: str = "aedt_traces.json"
+
+    _lock: threading.RLock = PrivateAttr(default_factory=threading.RLock)
+    _publish_events: bool = PrivateAttr(default=True)
+    _version: int = PrivateAttr(default=0)
+    _field_versions: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _snapshot: Tuple[int, Optional[Mapping[str, Any]]] = PrivateAttr(default=(-1, None))
+    _serialized: Tuple[int, bytes] = PrivateAttr(default=(-1, b""))
+
+    def __setattr__(self, name: str, value: Any):
+        if name.startswith("_") or name not in type(self).model_fields:
+            super().__setattr__(name, value)
+            return
+        event = PUBLISHED_PROPERTIES.get(name) if self._publish_events else None
+        with self._lock:
+            previous = getattr(self, name, None)
+            super().__setattr__(name, value)
+            self._mark_changed(name)
+            if event and getattr(self, name) != previous:
+                event_broker.publish(event, getattr(self, name))
+
+    def _mark_changed(self, *names: str):
+        """Increase the version and record it as the last change of the given fields.
+
+        Must be called with the lock held. Readers compare the version of their cached view
+        with this version, without the lock, to know if the view is still current.
+        """
+        self._version += 1
+        for name in names:
+            self._field_versions[name] = self._version
+
+    def resolve_aedt_version(self) -> str:
+        """Get the AEDT version, set to the latest installed version if it is not defined yet.
+
+        The default version is resolved on first use rather than when the properties are created,
+        so that importing the backend does not discover the AEDT installations.
+
+        Returns
+        -------
+        str
+            AEDT version, or an empty string if AEDT is not installed.
+        """
+        if not self.aedt_version:
+            version = aedt_installations.current_version
+            with self._lock:
+                if version and not self.aedt_version:
+                    self.aedt_version = version
+        return self.aedt_version
+
+    @property
+    def lock(self) -> threading.RLock:
+        """Lock held while the properties are modified."""
+        return self._lock
+
+    @property
+    def publish_events(self) -> bool:
+        """Whether the changes of the state, progress and busy properties are published."""
+        return self._publish_events
+
+    @publish_events.setter
+    def publish_events(self, value: bool):
+        self._publish_events = value
+
+    @property
+    def version(self) -> int:
+        """Version of the properties, increased each time a property is assigned.
+
+        Changes made in place, to a list, a dictionary or a nested model, are not counted.
+        Assign the field again, or use ``Common.set_properties``, to record them.
+        """
+        return self._version
+
+    def snapshot(self) -> Mapping[str, Any]:
+        """Get a consistent, read-only view of the properties.
+
+        The view is built once per version and shared by all the readers. Readers only wait
+        for the lock when the properties changed since the last view was built.
+
+        Returns
+        -------
+        mapping
+            Properties serialized while no writer was modifying them. The view and the
+            values it contains must not be modified.
+        """
+        version, snapshot = self._snapshot
+        if version == self._version:
+            return snapshot
+        with self._lock:
+            if self._snapshot[0] != self._version:
+                self._snapshot = (self._version, MappingProxyType(self.model_dump()))
+            return self._snapshot[1]
+
+    def serialized(self) -> Tuple[int, bytes]:
+        """Get the properties serialized to JSON.
+
+        The serialized properties are cached until the next change and read without
+        the lock, like :meth:`snapshot`.
+
+        Returns
+        -------
+        tuple[int, bytes]
+            Version and JSON document of the properties.
+        """
+        serialized = self._serialized
+        if serialized[0] == self._version:
+            return serialized
+        with self._lock:
+            if self._serialized[0] != self._version:
+                self._serialized = (self._version, self.model_dump_json().encode())
+            return self._serialized
+
+    def changes(self, since: int) -> Tuple[int, Dict[str, Any]]:
+        """Get the properties assigned after a version.
+
+        Parameters
+        ----------
+        since : int
+            Version known by the caller. All the properties are returned if it is newer
+            than the current version, for example after a restart of the backend.
+
+        Returns
+        -------
+        tuple[int, dict]
+            Current version and properties assigned after ``since``.
+        """
+        with self._lock:
+            if since > self._version:
+                return self._version, self.model_dump()
+            names = {name for name, version in self._field_versions.items() if version > since}
+            return self._version, self.model_dump(include=names) if names else {}
+
+    def update_fields(self, updates: Dict[Tuple[str, ...], Any]):
+        """Update several properties at once.
+
+        Each modified field is validated once, with its nested updates, on a copy of the
+        model. The modified fields are replaced only if all of them are valid.
+
+        Parameters
+        ----------
+        updates : dict
+            New values keyed on the field path, as given by :func:`field_paths`.
+
+        Raises
+        ------
+        pydantic.ValidationError
+            If a value is not valid. No property is modified.
+        """
+        fields = {}
+        for path, value in updates.items():
+            fields.setdefault(path[0], {})[path[1:]] = value
+        with self._lock:
+            updated = self.model_copy()
+            for name, field_updates in fields.items():
+                value = _updated_value(self, name, field_updates)
+                self.__pydantic_validator__.validate_assignment(updated, name, value)
+            self._mark_changed(*fields)
+            for name in fields:
+                previous = self.__dict__[name]
+                value = updated.__dict__[name]
+                self.__dict__[name] = value
+                self.__pydantic_fields_set__.add(name)
+                event = PUBLISHED_PROPERTIES.get(name) if self._publish_events else None
+                if event and value != previous:
+                    event_broker.publish(event, value)
 
 
 class Properties(CommonProperties, validate_assignment=True):
@@ -22,12 +22,18 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import fnmatch
+import os
 import queue
 import socket
 import socketserver
 import threading
+import time
 import wsgiref.simple_server
 
+from ansys.aedt.toolkits.common.backend.metrics import registry
+from ansys.aedt.toolkits.common.utils import remove_unix_socket
+
 # techniques described here are taken from:
 # https://gist.github.com/coffeesnake/3093598
 # https://bottlepy.org/docs/dev/recipes.html
@@ -38,14 +44,201 @@ import wsgiref.simple_server
 # The contents of this file are copyrighted by their respective owners.
 
 
+KEEP_ALIVE_TIMEOUT = 75
+"""Seconds an idle persistent connection is kept open by the server."""
+
+
 class ThreadingWSGIServer(socketserver.ThreadingMixIn, wsgiref.simple_server.WSGIServer):
-    pass
+    # Threads of idle persistent connections must not block the server shutdown
+    daemon_threads = True
+
+
+class UnixWSGIServer(ThreadingWSGIServer):
+    """WSGI server listening on a Unix domain socket instead of a TCP port.
+
+    A socket file left by a previous server is replaced, and the file is removed when the server
+    is closed. Only the user running the server can connect to it.
+
+    Parameters
+    ----------
+    path : str
+        Path of the socket file.
+    handler_class : type
+        Request handler class.
+    """
+
+    address_family = getattr(socket, "AF_UNIX", None)
+
+    def server_bind(self):
+        remove_unix_socket(self.server_address)
+        socketserver.TCPServer.server_bind(self)
+        os.chmod(self.server_address, 0o600)
+        # Used by wsgiref to fill the WSGI environment
+        self.server_name = "localhost"
+        self.server_port = 0
+        self.setup_environ()
+
+    def get_request(self):
+        connection, _ = self.socket.accept()
+        # Unix domain socket clients have no address, wsgiref expects a host and a port
+        return connection, ("localhost", 0)
+
+    def server_close(self):
+        super().server_close()
+        remove_unix_socket(self.server_address)
+
+
+class RequestBody:
+    """Request body limited to the length given by the client.
+
+    The rest of the body is discarded after the response so that the next request sent
+    on the same connection is read from its beginning.
+
+    Parameters
+    ----------
+    stream : file-like
+        Input stream of the connection.
+    length : int
+        Length of the body in bytes.
+    """
+
+    def __init__(self, stream, length):
+        self._stream = stream
+        self.remaining = length
+
+    def read(self, size=-1):
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self._stream.read(size) if size else b""
+        self.remaining -= len(data)
+        return data
+
+    def readline(self, size=-1):
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self._stream.readline(size) if size else b""
+        self.remaining -= len(data)
+        return data
+
+    def readlines(self, hint=-1):
+        return list(iter(self.readline, b""))
+
+    def __iter__(self):
+        return iter(self.readline, b"")
+
+    def drain(self):
+        """Discard the unread part of the body."""
+        while self.read(65536):
+            pass
+
+
+class KeepAliveServerHandler(wsgiref.simple_server.ServerHandler):
+    """WSGI handler answering with HTTP/1.1 and keeping the connection open when possible."""
+
+    http_version = "1.1"
+
+    def cleanup_headers(self):
+        super().cleanup_headers()
+        request_handler = self.request_handler
+        # Without length, the client finds the end of the body when the connection is closed
+        if "Content-Length" not in self.headers:
+            request_handler.close_connection = True
+        if request_handler.close_connection:
+            self.headers["Connection"] = "close"
+        elif request_handler.request_version == "HTTP/1.0":
+            self.headers["Connection"] = "keep-alive"
+
+    def handle_error(self):
+        # The response may be incomplete, so the connection can not be used again
+        self.request_handler.close_connection = True
+        super().handle_error()
+
+
+class KeepAliveWSGIRequestHandler(wsgiref.simple_server.WSGIRequestHandler):
+    """Request handler serving several requests on the same connection.
+
+    ``wsgiref`` closes the connection after each request, so every call of a client opens a
+    new connection. This handler keeps HTTP/1.1 connections open, and HTTP/1.0 connections
+    that ask for it, until the client closes them or stays idle for ``KEEP_ALIVE_TIMEOUT``.
+    """
+
+    protocol_version = "HTTP/1.1"
+    timeout = KEEP_ALIVE_TIMEOUT
+    # Status line, headers and body are sent together, see handle_one_request
+    wbufsize = -1
+
+    def setup(self):
+        super().setup()
+        if self.connection.family in (socket.AF_INET, socket.AF_INET6):
+            # Small responses are not delayed waiting for the acknowledgment of the previous one
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def handle(self):
+        self.close_connection = True
+        self.handle_one_request()
+        while not self.close_connection:
+            self.handle_one_request()
+
+    def handle_one_request(self):
+        """Handle a single HTTP request of the connection."""
+        try:
+            self.raw_requestline = self.rfile.readline(65537)
+        except (TimeoutError, ConnectionError):
+            self.close_connection = True
+            return
+        if not self.raw_requestline:
+            self.close_connection = True
+            return
+        if len(self.raw_requestline) > 65536:
+            self.requestline = ""
+            self.request_version = ""
+            self.command = ""
+            self.send_error(414)
+            self.wfile.flush()
+            return
+        try:
+            self.run_application()
+        finally:
+            self.wfile.flush()
+
+    def handle_expect_100(self):
+        result = super().handle_expect_100()
+        # The client waits for this answer before sending the body
+        self.wfile.flush()
+        return result
+
+    def run_application(self):
+        """Parse the request and run the application."""
+        if not self.parse_request():  # An error code has been sent, just exit
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            self.send_error(400, "Invalid Content-Length")
+            return
+        if self.headers.get("Transfer-Encoding"):
+            # Chunked bodies are not decoded, the end of the request is not known
+            self.close_connection = True
+        body = RequestBody(self.rfile, length)
+
+        handler = KeepAliveServerHandler(body, self.wfile, self.get_stderr(), self.get_environ(), multithread=False)
+        handler.request_handler = self  # backpointer for logging
+        handler.run(self.server.get_app())
+        if not self.close_connection:
+            body.drain()
+
+
+executor_wait_time = registry.histogram(
+    "aedt_toolkit_executor_wait_seconds", "Time the requests that can touch AEDT wait in the main thread queue."
+)
 
 
 class Invoker:
     def __init__(self, func):
         self._func = func
         self._event = threading.Event()
+        self.submitted_time = time.perf_counter()
 
     def invoke(self):
         self._result = self._func()
@@ -56,12 +249,79 @@ class Invoker:
         return self._result
 
 
+DEFAULT_CONCURRENT_ROUTES = frozenset(
+    {
+        ("GET", "/health"),
+        ("GET", "/status"),
+        ("GET", "/wait_thread"),
+        ("GET", "/events"),
+        ("GET", "/properties"),
+        ("GET", "/installed_versions"),
+        ("GET", "/aedt_sessions"),
+        ("GET", "/project_index"),
+        ("GET", "/design_names"),
+        ("GET", "/jobs"),
+        ("GET", "/jobs/*"),
+        ("POST", "/jobs/*/cancel"),
+        ("GET", "/sessions"),
+        ("GET", "/sessions/jobs"),
+        ("GET", "/sessions/jobs/*"),
+        ("POST", "/sessions/jobs/*/cancel"),
+        ("GET", "/metrics"),
+        ("GET", "/debug/traces"),
+    }
+)
+"""Routes served concurrently, outside the main thread queue, because they do not touch AEDT.
+
+Paths can contain ``*`` wildcards to match dynamic route segments.
+"""
+
+
 class SingleThreadResponseExecutor(object):
-    def __init__(self, app):
+    """Run WSGI requests on the main thread, except for side-effect-free routes.
+
+    Requests that can touch AEDT keep main thread affinity and are executed one by one.
+    Requests whose method and path are in ``concurrent_routes`` only read the toolkit
+    properties, so they are served directly on the thread of their connection and never queue
+    behind a long call. Routes that block, like ``/wait_thread`` and ``/events``, only hold their
+    own connection thread.
+
+    Parameters
+    ----------
+    app : callable
+        WSGI application.
+    concurrent_routes : set, optional
+        Set of ``(method, path)`` tuples served concurrently. Paths can contain ``*`` wildcards.
+        The default is ``None``, in which case ``DEFAULT_CONCURRENT_ROUTES`` is used.
+    """
+
+    def __init__(self, app, concurrent_routes=None):
         self._app = app
         self._queue = queue.Queue()
+        if concurrent_routes is None:
+            concurrent_routes = DEFAULT_CONCURRENT_ROUTES
+        self._concurrent_routes = frozenset(route for route in concurrent_routes if "*" not in route[1])
+        self._concurrent_patterns = [route for route in concurrent_routes if "*" in route[1]]
+        registry.callback(
+            "aedt_toolkit_executor_queue_depth",
+            "Number of requests waiting in the main thread queue.",
+            self._queue.qsize,
+        )
+
+    def is_concurrent(self, environ):
+        """Check if the request can be served outside the main thread."""
+        method = environ.get("REQUEST_METHOD", "GET").upper()
+        path = environ.get("PATH_INFO", "").rstrip("/") or "/"
+        if (method, path) in self._concurrent_routes:
+            return True
+        return any(
+            method == pattern_method and fnmatch.fnmatchcase(path, pattern_path)
+            for pattern_method, pattern_path in self._concurrent_patterns
+        )
 
     def __call__(self, environ, start_response):
+        if self.is_concurrent(environ):
+            return self._app(environ, start_response)
         invoker = Invoker(lambda: self._app(environ, start_response))
         self._queue.put(invoker)
         return invoker.get_result()
@@ -70,25 +330,96 @@ class SingleThreadResponseExecutor(object):
         print("Press ctrl+c to terminate.")
         while True:
             try:
-                self._queue.get().invoke()
+                invoker = self._queue.get()
+                if invoker is None:
+                    break
+                executor_wait_time.observe(time.perf_counter() - invoker.submitted_time)
+                invoker.invoke()
             except KeyboardInterrupt:
                 print("Got keyboard interrupt.")
                 break
 
+    def shutdown(self):
+        """Stop executing responses on the main thread."""
+        self._queue.put(None)
+
+
+class InProcessServer(SingleThreadResponseExecutor):
+    """Serve a WSGI application to clients running in the same process.
+
+    There is no socket and no second process: the client calls the server as a WSGI application,
+    for instance through ``ansys.aedt.toolkits.common.ui.actions_generic.InProcessAdapter``.
+    Requests that can touch AEDT are executed one by one on a dedicated thread, as the main thread
+    of ``MultithreadingServer`` does. Requests of the concurrent routes are executed directly on
+    the thread of the client.
+
+    Parameters
+    ----------
+    app : callable
+        WSGI application.
+    concurrent_routes : set, optional
+        Set of ``(method, path)`` tuples served on the thread of the client. Paths can contain ``*``
+        wildcards. The default is ``None``, in which case ``DEFAULT_CONCURRENT_ROUTES`` is used.
+    """
+
+    def __init__(self, app, concurrent_routes=None):
+        super().__init__(app, concurrent_routes=concurrent_routes)
+        self._thread = None
+
+    def start(self):
+        """Start the thread executing the requests that can touch AEDT."""
+        if self._thread is None or not self._thread.is_alive():
+            # Daemon thread, so that the requests sent at exit to release AEDT are still served
+            self._thread = threading.Thread(
+                target=self.execute_responses_on_this_thread, name="AEDT_Worker", daemon=True
+            )
+            self._thread.start()
+
+    def shutdown(self):
+        """Stop the thread once the queued requests are executed."""
+        super().shutdown()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
 
 class MultithreadingServer:
-    def run(self, host, port, app):
-        executor = SingleThreadResponseExecutor(app)
-        server_cls = ThreadingWSGIServer
-        if ":" in host:  # Fix wsgiref for IPv6 addresses.
-            if getattr(server_cls, "address_family") == socket.AF_INET:
+    def run(self, host, port, app, concurrent_routes=None, unix_socket=None):
+        """Serve the application until the process is interrupted.
+
+        Parameters
+        ----------
+        host : str
+            Host name or IP address to listen on.
+        port : int
+            Port to listen on.
+        app : callable
+            WSGI application.
+        concurrent_routes : set, optional
+            Set of ``(method, path)`` tuples served concurrently. The default is ``None``,
+            in which case ``DEFAULT_CONCURRENT_ROUTES`` is used.
+        unix_socket : str, optional
+            Path of a Unix domain socket to listen on instead of ``host`` and ``port``.
+            The default is ``None``, in which case the server listens on TCP.
+        """
+        executor = SingleThreadResponseExecutor(app, concurrent_routes=concurrent_routes)
+        if unix_socket:
+            httpd = UnixWSGIServer(unix_socket, KeepAliveWSGIRequestHandler)
+            httpd.set_app(executor)
+            print("Listening on {}.".format(unix_socket))
+        else:
+            server_cls = ThreadingWSGIServer
+            if ":" in host:  # Fix wsgiref for IPv6 addresses.
+                if getattr(server_cls, "address_family") == socket.AF_INET:
 
-                class server_cls(server_cls):
-                    address_family = socket.AF_INET6
+                    class server_cls(server_cls):
+                        address_family = socket.AF_INET6
 
-        httpd = wsgiref.simple_server.make_server(host, port, app=executor, server_class=server_cls)
+            httpd = wsgiref.simple_server.make_server(
+                host, port, app=executor, server_class=server_cls, handler_class=KeepAliveWSGIRequestHandler
+            )
+            print("Listening on {}:{}.".format(host, port))
 
-        print("Listening on {}:{}.".format(host, port))
         server_thread = threading.Thread(target=httpd.serve_forever)
         # ensure thread dies on termination
         # normally this would be dodgy but this thread doesn't hold anything other than sockets
@@ -97,4 +428,7 @@ class MultithreadingServer:
         server_thread.daemon = True
         server_thread.start()
 
-        executor.execute_responses_on_this_thread()
+        try:
+            executor.execute_responses_on_this_thread()
+        finally:
+            httpd.server_close()
@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Index of AEDT project files read without AEDT.
+
+AEDT project files are text files made of nested ``$begin 'Name'`` and ``$end 'Name'`` blocks indented
+with tabs. Designs are blocks of the project block, so they are found by searching the block tags of the
+first level in a memory map of the file, without reading the geometry of the designs line by line.
+"""
+
+from collections import OrderedDict
+import json
+import mmap
+import os
+import shutil
+import tempfile
+import threading
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+import zipfile
+
+from ansys.aedt.toolkits.common.backend.constants import AEDT_MODEL_TO_DESIGN_TYPE
+from ansys.aedt.toolkits.common.backend.logger_handler import logger
+from ansys.aedt.toolkits.common.utils import get_runtime_dir
+
+PROJECT_INDEX_FILE_NAME = "project_index.json"
+"""Name of the project index cache file in the per-user runtime directory."""
+DESIGN_HEADER_SIZE = 4096
+"""Number of bytes after the start of a design block where its name is searched."""
+
+
+def _block_end(data, position: int, name: bytes, depth: int) -> int:
+    """Find the end tag of a block."""
+    end = data.find(b"\n" + b"\t" * depth + b"$end '" + name + b"'", position)
+    return len(data) if end < 0 else end
+
+
+def _count_variables(data, start: int, end: int, depth: int) -> int:
+    """Count the variables of the ``Properties`` block of a block."""
+    begin = data.find(b"\n" + b"\t" * depth + b"$begin 'Properties'", start, end)
+    if begin < 0:
+        return 0
+    return data[begin : _block_end(data, begin, b"Properties", depth)].count(b"VariableProp(")
+
+
+def _design_name(data, start: int, end: int) -> Optional[str]:
+    """Read the ``Name`` attribute at the start of a design block."""
+    tag = b"\n\t\tName='"
+    position = data.find(tag, start, min(end, start + DESIGN_HEADER_SIZE))
+    if position < 0:
+        return None
+    position += len(tag)
+    return data[position : data.find(b"'", position)].decode("utf-8", errors="replace")
+
+
+def scan_project(data) -> Dict[str, Any]:
+    """Index the content of an AEDT project file.
+
+    Parameters
+    ----------
+    data : bytes or mmap.mmap
+        Content of the project file.
+
+    Returns
+    -------
+    dict
+        Number of project variables and list of designs with their name, design type and number of variables.
+    """
+    designs: List[Dict[str, Any]] = []
+    variables = 0
+    begin_tag = b"\n\t$begin '"
+    position = data.find(begin_tag)
+    while position >= 0:
+        name_start = position + len(begin_tag)
+        name_end = data.find(b"'", name_start)
+        if name_end < 0:  # pragma: no cover
+            break
+        block = data[name_start:name_end]
+        end = _block_end(data, name_end, block, 1)
+        design_type = AEDT_MODEL_TO_DESIGN_TYPE.get(block.decode("utf-8", errors="replace"))
+        if design_type:
+            designs.append(
+                {
+                    "name": _design_name(data, name_end, end) or block.decode("utf-8", errors="replace"),
+                    "design_type": design_type,
+                    "variables": _count_variables(data, name_end, end, 2),
+                }
+            )
+        elif block == b"Properties":
+            variables = data[name_end:end].count(b"VariableProp(")
+        position = data.find(begin_tag, end + 1)
+    return {"variables": variables, "designs": designs}
+
+
+def _scan_file(file_path: str) -> Dict[str, Any]:
+    """Index an AEDT project file through a memory map."""
+    with open(file_path, "rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            return scan_project(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return scan_project(data)
+
+
+def index_project(project_path: str) -> Dict[str, Any]:
+    """Index an AEDT project or archive file.
+
+    The project file of an ``.aedtz`` archive is extracted to a temporary file first.
+
+    Parameters
+    ----------
+    project_path : str
+        Full path of the ``.aedt`` or ``.aedtz`` file.
+
+    Returns
+    -------
+    dict
+        Project name and path, number of project variables and list of designs.
+    """
+    name = os.path.splitext(os.path.basename(project_path))[0]
+    if os.path.splitext(project_path)[1].lower() == ".aedtz":
+        with zipfile.ZipFile(project_path) as archive:
+            members = [member for member in archive.namelist() if member.lower().endswith(".aedt")]
+            if not members:
+                raise ValueError("No project file in archive {}.".format(project_path))
+            member = min(members, key=lambda member: member.count("/"))
+            name = os.path.splitext(os.path.basename(member))[0]
+            with tempfile.TemporaryDirectory() as temp_dir:
+                file_path = os.path.join(temp_dir, os.path.basename(member))
+                with archive.open(member) as source, open(file_path, "wb") as target:
+                    shutil.copyfileobj(source, target, 1024 * 1024)
+                index = _scan_file(file_path)
+    else:
+        index = _scan_file(project_path)
+    index.update(name=name, path=project_path)
+    return index
+
+
+class ProjectIndexCache:
+    """Stores the index of AEDT project files, keyed on their path and modification time.
+
+    The cache is saved in a JSON file, so it survives backend restarts.
+
+    Parameters
+    ----------
+    cache_file : str, optional
+        Cache file. The default is ``None``, in which case the ``PROJECT_INDEX_FILE_NAME`` file
+        of the per-user runtime directory is used.
+    max_entries : int, optional
+        Maximum number of indexed projects. The default is ``256``.
+    """
+
+    def __init__(self, cache_file: Optional[str] = None, max_entries: int = 256):
+        self.cache_file = cache_file
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._load()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, project_path: str) -> Optional[Dict[str, Any]]:
+        """Get the index of a project, indexing the file if it changed.
+
+        Parameters
+        ----------
+        project_path : str
+            Full path of the ``.aedt`` or ``.aedtz`` file.
+
+        Returns
+        -------
+        dict or None
+            Project index, ``None`` if the file does not exist or cannot be indexed.
+        """
+        key = os.path.normcase(os.path.abspath(project_path))
+        try:
+            stat = os.stat(key)
+        except OSError:
+            return None
+        token = [stat.st_mtime_ns, stat.st_size]
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry["token"] == token:
+                self._entries.move_to_end(key)
+                return entry["index"]
+
+        try:
+            index = index_project(project_path)
+        except (OSError, ValueError, zipfile.BadZipFile) as e:
+            logger.error("Project %s not indexed: %s", project_path, e)
+            return None
+
+        with self._lock:
+            self._entries[key] = {"token": token, "index": index}
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._save()
+        return index
+
+    def _cache_path(self) -> str:
+        """Get the path of the cache file."""
+        return self.cache_file or os.path.join(get_runtime_dir(), PROJECT_INDEX_FILE_NAME)
+
+    def _load(self):
+        """Load the cache file."""
+        try:
+            with open(self._cache_path(), "r") as f:
+                self._entries = OrderedDict(json.load(f))
+        except (OSError, ValueError):
+            self._entries = OrderedDict()
+
+    def _save(self):
+        """Save the cache file."""
+        try:
+            cache_file = self._cache_path()
+            temp_file = "{}.{}.tmp".format(cache_file, threading.get_ident())
+            with open(temp_file, "w") as f:
+                json.dump(self._entries, f)
+            os.replace(temp_file, cache_file)
+        except OSError as e:  # pragma: no cover
+            logger.debug("Project index cache not saved: %s", e)
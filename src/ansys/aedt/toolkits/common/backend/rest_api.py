@@ -23,12 +23,26 @@
 # SOFTWARE.
 
 from enum import Enum
+import json
+import time
+import uuid
 
 from flask import Flask
+from flask import Response
+from flask import g
 from flask import jsonify
 from flask import request
 
+from ansys.aedt.toolkits.common.backend.events import PUBLISHED_PROPERTIES
+from ansys.aedt.toolkits.common.backend.events import event_broker
+from ansys.aedt.toolkits.common.backend.events import format_sse
 from ansys.aedt.toolkits.common.backend.logger_handler import logger
+from ansys.aedt.toolkits.common.backend.logger_handler import request_id_var
+from ansys.aedt.toolkits.common.backend.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+from ansys.aedt.toolkits.common.backend.metrics import registry
+from ansys.aedt.toolkits.common.backend.session_pool import AEDTSessionPool
+from ansys.aedt.toolkits.common.mesh import MESH_MIMETYPE
+from ansys.aedt.toolkits.common.mesh import iter_mesh_stream
 from ansys.aedt.toolkits.common.utils import ToolkitThreadStatus
 
 
@@ -39,6 +53,16 @@ class BodyErrorMessage(str, Enum):
     INCORRECT_CONTENT = "Body content is not correct."
 
 
+EVENTS_KEEP_ALIVE = 15
+"""Seconds between two keep-alive comments in the event stream."""
+
+PROPERTIES_ETAG_PREFIX = uuid.uuid4().hex
+"""Prefix of the properties ETag, so that the versions of a previous backend process do not match."""
+
+REQUEST_ID_HEADER = "X-Request-ID"
+"""Header of the request ID, which is generated when the client does not send one."""
+
+
 try:  # pragma: no cover
     from api import ToolkitBackend
 
@@ -49,8 +73,72 @@ except ImportError:
 
     toolkit_api = AEDTCommon()
 
+session_pool = AEDTSessionPool(toolkit_api)
+
 app = Flask(__name__)
 
+request_count = registry.counter(
+    "aedt_toolkit_http_requests", "Number of HTTP requests handled.", ("method", "route", "status")
+)
+request_duration = registry.histogram(
+    "aedt_toolkit_http_request_duration_seconds",
+    "Time to handle the HTTP requests, until the response headers.",
+    ("method", "route", "status"),
+)
+
+
+def aedt_session_counter(field: str):
+    """Get a callback summing a counter of the AEDT session metrics of the toolkit API and of the session pool."""
+
+    def counter():
+        apis = [toolkit_api] + session_pool.get_session_apis()
+        return sum(getattr(api.session_metrics, field) for api in apis if hasattr(api, "session_metrics"))
+
+    return counter
+
+
+for name, field, documentation in (
+    ("aedt_toolkit_aedt_connections", "connections", "Number of connections to AEDT."),
+    ("aedt_toolkit_aedt_reused_connections", "reused_connections", "Number of AEDT connections reused."),
+    ("aedt_toolkit_aedt_connection_seconds", "connection_time", "Time spent connecting to AEDT."),
+    ("aedt_toolkit_aedt_design_connections", "design_connections", "Number of connections to AEDT designs."),
+    ("aedt_toolkit_aedt_reused_designs", "reused_designs", "Number of AEDT design connections reused."),
+    ("aedt_toolkit_aedt_releases", "releases", "Number of AEDT releases."),
+    ("aedt_toolkit_aedt_idle_releases", "idle_releases", "Number of AEDT releases after the idle timeout."),
+):
+    registry.callback(name, documentation, aedt_session_counter(field), metric_type="counter")
+
+
+@app.before_request
+def set_request_id():
+    g.start_time = time.perf_counter()
+    # The records logged while handling the request, and by the jobs it queues, carry its ID
+    g.request_id = request.headers.get(REQUEST_ID_HEADER, "")[:64] or uuid.uuid4().hex
+    g.request_id_token = request_id_var.set(g.request_id)
+
+
+@app.after_request
+def add_request_id(response):
+    response.headers[REQUEST_ID_HEADER] = g.request_id
+    # Routes are labeled with their rule, so the dynamic segments do not create new series
+    labels = (request.method, request.url_rule.rule if request.url_rule else "unmatched", str(response.status_code))
+    request_count.inc(*labels)
+    request_duration.observe(time.perf_counter() - g.start_time, *labels)
+    return response
+
+
+@app.teardown_request
+def reset_request_id(exception=None):
+    token = g.pop("request_id_token", None)
+    if token is not None:
+        request_id_var.reset(token)
+
+
+@app.route("/metrics", methods=["GET"])
+def get_metrics():
+    logger.debug("[GET] /metrics (get the backend metrics).")
+    return Response(registry.render(), content_type=METRICS_CONTENT_TYPE)
+
 
 @app.route("/health", methods=["GET"])
 def get_health():
@@ -78,7 +166,12 @@ def wait_thread():
         msg = BodyErrorMessage.EMPTY.value
         logger.error(msg)
         return jsonify(msg), 500
-    timeout = int(body.decode())
+    try:
+        timeout = float(body.decode())
+    except ValueError:
+        msg = BodyErrorMessage.INCORRECT_CONTENT.value
+        logger.error(msg)
+        return jsonify(msg), 500
 
     response = toolkit_api.wait_to_be_idle(timeout=timeout)
     if response:
@@ -87,11 +180,46 @@ def wait_thread():
         return jsonify(f"Timeout ({timeout} seconds) exceeded"), 500
 
 
+@app.route("/events", methods=["GET"])
+def get_events():
+    logger.info("[GET] /events (stream backend events).")
+    subscription = event_broker.subscribe()
+    properties = toolkit_api.get_properties()
+
+    def stream():
+        try:
+            # Current values first, so that the client does not need to request them
+            for name, event in PUBLISHED_PROPERTIES.items():
+                yield format_sse(event, properties[name])
+            while not subscription.closed:
+                event = subscription.get(timeout=EVENTS_KEEP_ALIVE)
+                if event is None:
+                    yield ": keep-alive\n\n"
+                else:
+                    yield format_sse(*event)
+        finally:
+            event_broker.unsubscribe(subscription)
+
+    return Response(stream(), mimetype="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
 @app.route("/properties", methods=["GET"])
 def get_properties():
     logger.info("[GET] /properties (get toolkit properties).")
-    response = toolkit_api.get_properties()
-    return jsonify(response), 200
+
+    since = request.args.get("since")
+    if since is None:
+        version, data = toolkit_api.get_serialized_properties()
+        response = Response(data, mimetype="application/json")
+    else:
+        try:
+            version, changes = toolkit_api.get_properties_changes(int(since))
+        except ValueError:
+            return jsonify(BodyErrorMessage.INCORRECT_CONTENT.value), 400
+        response = jsonify({"version": version, "properties": changes})
+    response.set_etag(f"{PROPERTIES_ETAG_PREFIX}-{version}")
+    # Answers 304 without body when the client already has this version
+    return response.make_conditional(request)
 
 
 @app.route("/properties", methods=["PUT"])
@@ -109,6 +237,8 @@ def set_properties():
 def installed_aedt_version():
     logger.info("[GET] /version (get the version)")
     response = toolkit_api.installed_aedt_version()
+    # The installations are known now, so the default version is set for the UI
+    toolkit_api.properties.resolve_aedt_version()
     return jsonify(response), 200
 
 
@@ -122,17 +252,142 @@ def aedt_sessions():
         return jsonify(response), 500
 
 
+@app.route("/project_index", methods=["GET"])
+def get_project_index():
+    logger.info("[GET] /project_index (designs of the project files).")
+
+    body = request.get_json(silent=True) or {}
+    project_list = body.get("project_list")
+    if project_list is not None and (
+        not isinstance(project_list, list) or not all(isinstance(project, str) for project in project_list)
+    ):
+        msg = BodyErrorMessage.INCORRECT_CONTENT.value
+        logger.error(msg)
+        return jsonify(msg), 500
+
+    return jsonify(toolkit_api.get_project_index(project_list)), 200
+
+
 @app.route("/launch_aedt", methods=["POST"])
 def launch_aedt():
     logger.info("[POST] /launch_aedt (launch or connect AEDT).")
 
-    response = toolkit_api.launch_thread(toolkit_api.launch_aedt)
-    if response:
-        return jsonify("AEDT properties loaded"), 200
+    job_id = toolkit_api.launch_thread(toolkit_api.launch_aedt)
+    if job_id:
+        return jsonify({"message": "AEDT launch queued", "job_id": job_id}), 200
     else:  # pragma: no cover
         return jsonify("Fail to launch to AEDT"), 500
 
 
+@app.route("/jobs", methods=["GET"])
+def get_jobs():
+    logger.info("[GET] /jobs (get the toolkit jobs).")
+    response = toolkit_api.get_jobs()
+    return jsonify(response), 200
+
+
+@app.route("/jobs/<job_id>", methods=["GET"])
+def get_job(job_id):
+    logger.info("[GET] /jobs/%s (get the job state and result).", job_id)
+    response = toolkit_api.get_job(job_id)
+    if response:
+        return jsonify(response), 200
+    else:
+        return jsonify("Job {} not found".format(job_id)), 404
+
+
+@app.route("/jobs/<job_id>/cancel", methods=["POST"])
+def cancel_job(job_id):
+    logger.info("[POST] /jobs/%s/cancel (cancel the job).", job_id)
+    response = toolkit_api.cancel_job(job_id)
+    if response:
+        return jsonify("Job {} cancellation requested".format(job_id)), 200
+    else:
+        return jsonify("Job {} not found or already finished".format(job_id)), 404
+
+
+@app.route("/sessions", methods=["GET"])
+def get_sessions():
+    logger.info("[GET] /sessions (get the AEDT sessions of the pool).")
+    return jsonify(session_pool.get_sessions()), 200
+
+
+@app.route("/sessions", methods=["POST"])
+def add_session():
+    logger.info("[POST] /sessions (launch or attach AEDT sessions in the pool).")
+
+    body = request.get_json(silent=True) or {}
+    if body.get("attach"):
+        return jsonify(session_pool.attach_sessions()), 200
+
+    session_id = session_pool.add_session(body.get("selected_process", 0))
+    if session_id:
+        return jsonify(session_id), 200
+    else:
+        return jsonify("AEDT session already in the pool"), 500
+
+
+@app.route("/sessions/<session_id>", methods=["DELETE"])
+def remove_session(session_id):
+    logger.info("[DELETE] /sessions/%s (release the AEDT session).", session_id)
+
+    body = request.get_json(silent=True) or {}
+    if session_pool.remove_session(session_id, body.get("close_on_exit", False)):
+        return jsonify("AEDT session {} removed".format(session_id)), 200
+    else:
+        return jsonify("AEDT session {} not found".format(session_id)), 404
+
+
+@app.route("/sessions/jobs", methods=["POST"])
+def launch_session_job():
+    logger.info("[POST] /sessions/jobs (queue a job in the session pool).")
+
+    body = request.get_json(silent=True) or {}
+    process = body.get("process")
+    args = body.get("args", [])
+    if not isinstance(process, str) or process not in session_pool.job_methods or not isinstance(args, list):
+        msg = BodyErrorMessage.INCORRECT_CONTENT.value
+        logger.error(msg)
+        return jsonify(msg), 500
+
+    job_id = session_pool.launch_thread(
+        process,
+        *args,
+        project=body.get("project"),
+        design=body.get("design"),
+        session_id=body.get("session_id"),
+    )
+    if job_id:
+        return jsonify({"message": "Job queued", "job_id": job_id}), 200
+    else:  # pragma: no cover
+        return jsonify("Fail to queue the job"), 500
+
+
+@app.route("/sessions/jobs", methods=["GET"])
+def get_session_jobs():
+    logger.info("[GET] /sessions/jobs (get the session pool jobs).")
+    return jsonify(session_pool.get_jobs()), 200
+
+
+@app.route("/sessions/jobs/<job_id>", methods=["GET"])
+def get_session_job(job_id):
+    logger.info("[GET] /sessions/jobs/%s (get the job state and result).", job_id)
+    response = session_pool.get_job(job_id)
+    if response:
+        return jsonify(response), 200
+    else:
+        return jsonify("Job {} not found".format(job_id)), 404
+
+
+@app.route("/sessions/jobs/<job_id>/cancel", methods=["POST"])
+def cancel_session_job(job_id):
+    logger.info("[POST] /sessions/jobs/%s/cancel (cancel the job).", job_id)
+    if session_pool.cancel_job(job_id):
+        return jsonify("Job {} cancellation requested".format(job_id)), 200
+    else:
+        return jsonify("Job {} not found or already finished".format(job_id)), 404
+
+
 @app.route("/get_aedt_model", methods=["GET"])
 def get_aedt_model():
     logger.info("[GET] /get_aedt_model (Get 3D model in AEDT)")
@@ -146,6 +401,9 @@ def get_aedt_model():
         "export_as_multiple_objects": False,
         "air_objects": False,
         "encode": True,
+        "triangle_budget": None,
+        "decimation_ratio": None,
+        "merge_tiny_objects": None,
     }
 
     # Extract values from the request body
@@ -159,6 +417,68 @@ def get_aedt_model():
         return jsonify("No model exported"), 500
 
 
+@app.route("/get_aedt_model_stream", methods=["GET"])
+def get_aedt_model_stream():
+    logger.info("[GET] /get_aedt_model_stream (Stream 3D model in AEDT)")
+
+    body = request.get_json(silent=True) or {}
+
+    # Default values
+    default_values = {
+        "obj_list": None,
+        "export_path": None,
+        "export_as_multiple_objects": False,
+        "air_objects": False,
+    }
+
+    # Extract values from the request body
+    params = {key: body.get(key, default_values[key]) for key in default_values}
+
+    manifest, chunks = toolkit_api.export_aedt_model_stream(**params)
+
+    if not manifest:
+        return jsonify("No model exported"), 500
+
+    # The body is the manifest on the first line, followed by the raw content of each object
+    header = (json.dumps(manifest) + "\n").encode("utf-8")
+
+    def stream():
+        yield header
+        yield from chunks
+
+    content_length = len(header) + sum(element["size"] for element in manifest)
+    return Response(stream(), mimetype="application/octet-stream", headers={"Content-Length": str(content_length)})
+
+
+@app.route("/get_aedt_mesh", methods=["GET"])
+def get_aedt_mesh():
+    logger.info("[GET] /get_aedt_mesh (Get 3D model meshes in AEDT)")
+
+    body = request.get_json(silent=True) or {}
+
+    # Default values
+    default_values = {
+        "obj_list": None,
+        "export_as_multiple_objects": False,
+        "air_objects": False,
+        "triangle_budget": None,
+        "decimation_ratio": None,
+        "merge_tiny_objects": None,
+        "progressive": False,
+    }
+
+    # Extract values from the request body
+    params = {key: body.get(key, default_values[key]) for key in default_values}
+
+    object_count, meshes = toolkit_api.export_aedt_mesh(**params)
+
+    if not object_count:
+        return jsonify("No model exported"), 500
+
+    # Meshes are read and packed one at a time while the response is sent
+    return Response(iter_mesh_stream(meshes), mimetype=MESH_MIMETYPE)
+
+
 @app.route("/open_project", methods=["POST"])
 def open_project():
     logger.info("[POST] /open_project (open AEDT project).")
@@ -196,7 +516,8 @@ def close_aedt():
 
     close_projects = body["close_projects"]
     close_desktop = body["close_desktop"]
-    response = toolkit_api.release_aedt(close_projects, close_desktop)
+    # A kept AEDT session is released too
+    response = toolkit_api.release_aedt(close_projects, close_desktop, force=True)
 
     if response:
         return jsonify("AEDT correctly released"), 200
@@ -204,6 +525,21 @@ def close_aedt():
         return jsonify("AEDT is not connected"), 500
 
 
+@app.route("/session_metrics", methods=["GET"])
+def get_session_metrics():
+    logger.info("[GET] /session_metrics (AEDT connection counters).")
+    return jsonify(toolkit_api.get_session_metrics()), 200
+
+
+@app.route("/debug/traces", methods=["GET"])
+def get_traces():
+    logger.debug("[GET] /debug/traces (get the last traces of the AEDT calls).")
+    trace_format = request.args.get("format", "json")
+    if trace_format not in ("json", "chrome"):
+        return jsonify("Trace format must be 'json' or 'chrome'."), 400
+    return jsonify(toolkit_api.get_traces(chrome_format=trace_format == "chrome")), 200
+
+
 @app.route("/connect_design", methods=["POST"])
 def connect_design():
     logger.info("[POST] /connect_design (connect or create a design).")
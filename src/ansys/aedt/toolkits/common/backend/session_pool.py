@@ -0,0 +1,361 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import os
+import threading
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+import uuid
+
+from ansys.aedt.toolkits.common.backend.logger_handler import logger
+from ansys.aedt.toolkits.common.backend.thread_manager import Job
+from ansys.aedt.toolkits.common.backend.thread_manager import ThreadManager
+
+
+def normalize_project(project_path: str) -> str:
+    """Normalize a project path to compare the projects of the sessions."""
+    return os.path.normcase(os.path.abspath(project_path))
+
+
+@dataclass
+class SessionJob(Job):
+    """Stores a job of the session pool.
+
+    The process is a method name of the toolkit API, resolved on the API of the session running the job,
+    or a callable receiving the API of the session as first argument.
+    """
+
+    project: Optional[str] = None
+    design: Optional[str] = None
+    session_id: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the job information."""
+        info = super().to_dict()
+        info.update(project=self.project, design=self.design, session_id=self.session_id)
+        return info
+
+
+class AEDTSession:
+    """Stores an AEDT session of the pool and the toolkit API controlling it.
+
+    Parameters
+    ----------
+    api : :class:`ansys.aedt.toolkits.common.backend.api.AEDTCommon`
+        Toolkit API of the session.
+    """
+
+    def __init__(self, api):
+        self.session_id = uuid.uuid4().hex
+        self.api = api
+        self.job: Optional[SessionJob] = None
+        self.projects = set()
+        self.removed = False
+        self.worker: Optional[threading.Thread] = None
+
+    def update_projects(self):
+        """Update the projects open in the session from its properties."""
+        self.projects = {normalize_project(project) for project in self.api.properties.project_list}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the session information."""
+        return {
+            "session_id": self.session_id,
+            "selected_process": self.api.properties.selected_process,
+            "projects": sorted(self.projects),
+            "active_project": self.api.properties.active_project,
+            "active_design": self.api.properties.active_design,
+            "job_id": self.job.job_id if self.job else None,
+        }
+
+
+class AEDTSessionPool(ThreadManager):
+    """Dispatches toolkit jobs to a pool of AEDT sessions.
+
+    Each session is controlled by a copy of the toolkit API and runs its jobs one by one in its own thread.
+    Jobs are executed in submission order by the first free session, except that a job targeting a project
+    is only executed by the session where the project is open, if any. Sessions are launched or attached
+    with gRPC.
+
+    Parameters
+    ----------
+    toolkit_api : :class:`ansys.aedt.toolkits.common.backend.api.AEDTCommon`
+        Toolkit API copied for each session.
+    max_queued_jobs : int, optional
+        Maximum number of jobs waiting to be executed. The default is ``32``.
+    max_finished_jobs : int, optional
+        Maximum number of finished jobs kept in the history. The default is ``100``.
+
+    Attributes
+    ----------
+    job_methods : frozenset
+        Names of the toolkit API methods that can be queued through the REST API. Toolkits exposing their
+        own methods extend it in a subclass.
+
+    Examples
+    --------
+    >>> from ansys.aedt.toolkits.common.backend.api import AEDTCommon
+    >>> from ansys.aedt.toolkits.common.backend.session_pool import AEDTSessionPool
+    >>> session_pool = AEDTSessionPool(AEDTCommon())
+    >>> session_pool.add_session()
+    >>> session_pool.add_session()
+    >>> job_id = session_pool.launch_thread("export_aedt_model", project="path/to/project.aedt", design="HFSS")
+    >>> session_pool.wait_job(job_id)
+    """
+
+    toolkit_thread_name = "Toolkit_Session_Thread"
+    job_methods = frozenset(
+        {
+            "connect_design",
+            "export_aedt_mesh",
+            "export_aedt_model",
+            "get_design_names",
+            "open_project",
+            "save_project",
+        }
+    )
+
+    def __init__(self, toolkit_api, max_queued_jobs=32, max_finished_jobs=100):
+        super().__init__(toolkit_api.properties, max_queued_jobs, max_finished_jobs)
+        self.toolkit_api = toolkit_api
+        self._sessions: "OrderedDict[str, AEDTSession]" = OrderedDict()
+
+    def add_session(self, selected_process: int = 0) -> Optional[str]:
+        """Add an AEDT session to the pool.
+
+        Parameters
+        ----------
+        selected_process : int, optional
+            gRPC port of an existing AEDT session. The default is ``0``, in which case a new session is launched.
+
+        Returns
+        -------
+        str or None
+            Session ID, ``None`` when the session is already in the pool.
+        """
+        with self._condition:
+            if selected_process and any(
+                session.api.properties.selected_process == selected_process for session in self._sessions.values()
+            ):
+                logger.error("AEDT session %s is already in the pool.", selected_process)
+                return None
+            session = AEDTSession(self.toolkit_api.create_session_api(selected_process))
+            self._sessions[session.session_id] = session
+            # The first job launches or connects AEDT and loads the projects of the session
+            job = self._create_job("launch_aedt", (), session_id=session.session_id)
+            self._queue.appendleft(job)
+            self._jobs[job.job_id] = job
+            session.worker = threading.Thread(
+                target=self._run_session,
+                args=(session,),
+                name="{}_{}".format(self.toolkit_thread_name, len(self._sessions)),
+                daemon=True,
+            )
+            session.worker.start()
+        logger.debug("AEDT session %s added to the pool.", session.session_id)
+        return session.session_id
+
+    def attach_sessions(self) -> List[str]:
+        """Add the running AEDT gRPC sessions to the pool.
+
+        Returns
+        -------
+        list
+            IDs of the added sessions.
+        """
+        session_ids = []
+        for port in self.toolkit_api.aedt_sessions().values():
+            if port and port > 0:
+                session_id = self.add_session(port)
+                if session_id:
+                    session_ids.append(session_id)
+        return session_ids
+
+    def remove_session(self, session_id: str, close_on_exit: bool = False) -> bool:
+        """Release an AEDT session and remove it from the pool once its queued jobs are executed.
+
+        Parameters
+        ----------
+        session_id : str
+            Session ID.
+        close_on_exit : bool, optional
+            Whether to close the AEDT session. The default is ``False``.
+
+        Returns
+        -------
+        bool
+            ``True`` when the session is removed, ``False`` when it does not exist.
+        """
+        with self._condition:
+            session = self._sessions.get(session_id)
+            if not session or session.removed:
+                return False
+            job = self._create_job("release_aedt", (close_on_exit, close_on_exit, True), session_id=session_id)
+            self._queue.append(job)
+            self._jobs[job.job_id] = job
+            session.removed = True
+            self._condition.notify_all()
+        logger.debug("AEDT session %s removed from the pool.", session_id)
+        return True
+
+    def get_sessions(self) -> List[Dict[str, Any]]:
+        """Get the information of the sessions in the pool."""
+        with self._condition:
+            return [session.to_dict() for session in self._sessions.values() if not session.removed]
+
+    def get_session_apis(self) -> List[Any]:
+        """Get the toolkit APIs of the sessions in the pool."""
+        with self._condition:
+            return [session.api for session in self._sessions.values()]
+
+    def launch_thread(self, process, *args, project=None, design=None, session_id=None):
+        """Submit a process to the session pool.
+
+        Parameters
+        ----------
+        process : str or callable
+            Method name of the toolkit API, or callable receiving the API of the session as first argument.
+        *args
+            Arguments passed to the process.
+        project : str, optional
+            Project the process works on. The default is ``None``. The project is opened in the session and
+            set as active project before the process is executed.
+        design : str, optional
+            Design set as active design before the process is executed. The default is ``None``.
+        session_id : str, optional
+            Session executing the process. The default is ``None``, in which case the process is
+            dispatched to a free session.
+
+        Returns
+        -------
+        str or bool
+            Job ID when the job is queued, ``False`` when the queue is full or the session does not exist.
+        """
+        with self._condition:
+            if len(self._queue) >= self.max_queued_jobs:  # pragma: no cover
+                logger.error("Job queue is full.")
+                return False
+            if session_id and (session_id not in self._sessions or self._sessions[session_id].removed):
+                logger.error("AEDT session %s is not in the pool.", session_id)
+                return False
+            job = self._create_job(process, args, project, design, session_id)
+            self._queue.append(job)
+            self._jobs[job.job_id] = job
+            self._prune_jobs()
+            self._condition.notify_all()
+        logger.debug("Job %s (%s) queued in the session pool.", job.job_id, job.name)
+        return job.job_id
+
+    def wait_until_idle(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued job is executed.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Time out in seconds. The default is ``None``, in which case the wait does not time out.
+
+        Returns
+        -------
+        bool
+            ``True`` when the sessions are idle, ``False`` when the timeout is exceeded.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._queue and all(session.job is None for session in self._sessions.values()),
+                timeout=timeout,
+            )
+
+    def _create_job(self, process, args, project=None, design=None, session_id=None):
+        """Create a job of the session pool."""
+        return SessionJob(process=process, args=args, project=project, design=design, session_id=session_id)
+
+    def _next_job(self, session):
+        """Get the first queued job that the session can execute."""
+        # Projects open or being opened in the other sessions
+        other_projects = set()
+        for other in self._sessions.values():
+            if other is not session:
+                other_projects.update(other.projects)
+                if other.job and other.job.project:
+                    other_projects.add(normalize_project(other.job.project))
+        for job in self._queue:
+            if job.session_id:
+                if job.session_id == session.session_id:
+                    return job
+            elif session.removed:
+                continue
+            elif not job.project or normalize_project(job.project) not in other_projects:
+                return job
+        return None
+
+    def _run_session(self, session):
+        """Execute the jobs dispatched to a session until the session is removed."""
+        while True:
+            with self._condition:
+                job = self._next_job(session)
+                while job is None:
+                    if session.removed:
+                        del self._sessions[session.session_id]
+                        self._condition.notify_all()
+                        return
+                    self._condition.wait()
+                    job = self._next_job(session)
+                self._queue.remove(job)
+                job.session_id = session.session_id
+                session.job = job
+            self.process_exe(job)
+            with self._condition:
+                session.update_projects()
+                session.job = None
+                self._condition.notify_all()
+
+    def _execute(self, job):
+        """Call the process of a job with the API of its session."""
+        session = self._sessions[job.session_id]
+        # Cancellation requests are checked by the process through the API of the session
+        return session.api.thread_manager.run_inline(job, self._run_process, session, job)
+
+    def _run_process(self, session, job):
+        """Open the project and design of a job in its session, then call its process."""
+        api = session.api
+        if job.project:
+            project = normalize_project(job.project)
+            if project not in session.projects:
+                # The process must not run on the project that is active instead
+                if not api.open_project(job.project):
+                    raise RuntimeError(
+                        "Project {} could not be opened in session {}.".format(job.project, job.session_id)
+                    )
+                with self._condition:
+                    session.projects.add(project)
+            api.properties.active_project = job.project
+        if job.design:
+            api.properties.active_design = job.design
+        if isinstance(job.process, str):
+            return getattr(api, job.process)(*job.args)
+        return job.process(api, *job.args)
@@ -22,64 +22,331 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from collections import OrderedDict
+from collections import deque
+from dataclasses import dataclass
+from dataclasses import field
 import threading
 import time
+from typing import Any
+from typing import Callable
+from typing import Dict
 from typing import List
+from typing import Optional
+import uuid
 
+from ansys.aedt.toolkits.common.backend.events import event_broker
+from ansys.aedt.toolkits.common.backend.logger_handler import job_id_var
 from ansys.aedt.toolkits.common.backend.logger_handler import logger
+from ansys.aedt.toolkits.common.backend.logger_handler import request_id_var
+from ansys.aedt.toolkits.common.backend.metrics import registry
 from ansys.aedt.toolkits.common.backend.models import common_properties
+from ansys.aedt.toolkits.common.utils import ToolkitJobState
+
+job_wait_time = registry.histogram(
+    "aedt_toolkit_job_wait_seconds", "Time the toolkit jobs wait in the queue before they run.", ("job",)
+)
+job_duration = registry.histogram(
+    "aedt_toolkit_job_duration_seconds", "Run time of the toolkit jobs.", ("job", "state")
+)
+
+
+@dataclass
+class Job:
+    """Stores a toolkit job and its outcome."""
+
+    process: Callable
+    args: tuple = ()
+    job_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    state: ToolkitJobState = ToolkitJobState.QUEUED
+    result: Any = None
+    exception: Optional[str] = None
+    submitted_time: float = field(default_factory=time.time)
+    start_time: Optional[float] = None
+    end_time: Optional[float] = None
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+    request_id: Optional[str] = field(default_factory=request_id_var.get)
+
+    @property
+    def name(self) -> str:
+        """Name of the process executed by the job."""
+        return getattr(self.process, "__name__", str(self.process))
+
+    @property
+    def is_done(self) -> bool:
+        """Whether the job reached a final state."""
+        return self.state in (ToolkitJobState.FINISHED, ToolkitJobState.FAILED, ToolkitJobState.CANCELLED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the job information."""
+        result = self.result
+        if not isinstance(result, (str, int, float, bool, list, dict, type(None))):  # pragma: no cover
+            result = repr(result)
+        timings = {"submitted": self.submitted_time, "started": self.start_time, "finished": self.end_time}
+        if self.start_time:
+            timings["queued_duration"] = self.start_time - self.submitted_time
+        if self.start_time and self.end_time:
+            timings["run_duration"] = self.end_time - self.start_time
+        return {
+            "job_id": self.job_id,
+            "name": self.name,
+            "state": self.state.value,
+            "result": result,
+            "exception": self.exception,
+            "cancel_requested": self.cancel_event.is_set(),
+            "timings": timings,
+        }
 
 
 class ThreadManager(object):
     """Controls toolkit threads.
 
+    Processes are submitted as jobs to a bounded FIFO queue and are executed one by one in the toolkit thread.
+
     Parameters
     ----------
     backend_properties : :class:`backend.models.Properties`
         Updated properties.
+    max_queued_jobs : int, optional
+        Maximum number of jobs waiting to be executed. The default is ``32``.
+    max_finished_jobs : int, optional
+        Maximum number of finished jobs kept in the history. The default is ``100``.
 
     """
 
     toolkit_thread_name = "Toolkit_Thread"
 
-    def __init__(self, backend_properties=None):
+    def __init__(self, backend_properties=None, max_queued_jobs=32, max_finished_jobs=100):
         self.properties = common_properties
         if backend_properties:
             self.properties = backend_properties
+        self.max_queued_jobs = max_queued_jobs
+        self.max_finished_jobs = max_finished_jobs
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._queue: "deque[Job]" = deque()
+        self._condition = threading.Condition()
+        # Running job of each thread, so that a job run inline by another executor does not replace it
+        self._running_jobs: Dict[int, Job] = {}
+        self._worker: Optional[threading.Thread] = None
 
-    def process_exe(self, process, *args):
-        """Execute process."""
-        # Set the variable at process start
-        self.properties.is_toolkit_busy = True
+    def process_exe(self, job):
+        """Execute job."""
+        with self._condition:
+            job.state = ToolkitJobState.RUNNING
+            job.start_time = time.time()
+            self._running_jobs[threading.get_ident()] = job
+        # The records of the job carry its ID and the ID of the request that queued it
+        job_token = job_id_var.set(job.job_id)
+        request_token = request_id_var.set(job.request_id)
+        logger.debug("Running job %s (%s).", job.job_id, job.name)
 
         # Start
-        process(*args)
+        try:
+            job.result = self._execute(job)
+            state = ToolkitJobState.CANCELLED if job.cancel_event.is_set() else ToolkitJobState.FINISHED
+        except Exception as e:
+            logger.error("Job %s (%s) failed: %s", job.job_id, job.name, e)
+            job.exception = repr(e)
+            state = ToolkitJobState.FAILED
+        finally:
+            request_id_var.reset(request_token)
+            job_id_var.reset(job_token)
+
+        with self._condition:
+            job.end_time = time.time()
+            job.state = state
+            self._running_jobs.pop(threading.get_ident(), None)
+            self._condition.notify_all()
+        job_wait_time.observe(job.start_time - job.submitted_time, job.name)
+        job_duration.observe(job.end_time - job.start_time, job.name, state.value)
+        event_broker.publish("job", job.to_dict())
 
-        # Waits for the thread closure
-        time.sleep(0.5)
+    def _execute(self, job):
+        """Call the process of a job."""
+        return job.process(*job.args)
 
-        # Set the variable at process end
-        self.properties.is_toolkit_busy = False
+    def run_inline(self, job, process, *args):
+        """Call a process on the calling thread as part of a job executed by another executor.
+
+        While the process runs, :meth:`is_cancel_requested` reports the cancellation of the job to the
+        calls made from this thread. The state and the history of the jobs of this manager are not changed.
+
+        Parameters
+        ----------
+        job : :class:`Job`
+            Job executed by the other executor, for example a session pool.
+        process : callable
+            Process to call.
+        *args
+            Arguments passed to the process.
+
+        Returns
+        -------
+        Any
+            Result of the process.
+        """
+        thread_id = threading.get_ident()
+        with self._condition:
+            previous_job = self._running_jobs.get(thread_id)
+            self._running_jobs[thread_id] = job
+        try:
+            return process(*args)
+        finally:
+            with self._condition:
+                if previous_job is None:
+                    self._running_jobs.pop(thread_id, None)
+                else:
+                    self._running_jobs[thread_id] = previous_job
+
+    def _run_jobs(self):
+        """Execute queued jobs until the queue is empty."""
+        while True:
+            with self._condition:
+                if not self._queue:
+                    # Set the variable at process end
+                    self._worker = None
+                    self.properties.is_toolkit_busy = False
+                    self._condition.notify_all()
+                    return
+                job = self._queue.popleft()
+            self.process_exe(job)
 
     def launch_thread(self, process, *args):
-        """Launch process."""
-        if not self.properties.is_toolkit_busy:
-            # Multithreading fails with COM
-            logger.debug("Starting thread: {}".format(self.toolkit_thread_name))
-            common_properties.is_toolkit_busy = True
-            running_thread = threading.Thread(
-                target=self.process_exe,
-                name=self.toolkit_thread_name,
-                args=(
-                    process,
-                    *args,
-                ),
-                daemon=True,
-            )
-            running_thread.start()
-            return True
-        else:  # pragma: no cover
-            return False
+        """Submit a process to the job queue.
+
+        Returns
+        -------
+        str or bool
+            Job ID when the job is queued, ``False`` when the queue is full.
+        """
+        with self._condition:
+            if len(self._queue) >= self.max_queued_jobs:  # pragma: no cover
+                logger.error("Job queue is full.")
+                return False
+            job = Job(process=process, args=args)
+            self._queue.append(job)
+            self._jobs[job.job_id] = job
+            self._prune_jobs()
+            # Set the variable at process start
+            self.properties.is_toolkit_busy = True
+            if self._worker is None:
+                # Multithreading fails with COM
+                logger.debug("Starting thread: %s", self.toolkit_thread_name)
+                self._worker = threading.Thread(target=self._run_jobs, name=self.toolkit_thread_name, daemon=True)
+                self._worker.start()
+        logger.debug("Job %s (%s) queued.", job.job_id, job.name)
+        return job.job_id
+
+    def _prune_jobs(self):
+        """Remove the oldest finished jobs from the history."""
+        finished = [job_id for job_id, job in self._jobs.items() if job.is_done]
+        for job_id in finished[: max(0, len(finished) - self.max_finished_jobs)]:
+            del self._jobs[job_id]
+
+    def wait_until_idle(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued job is executed.
+
+        The waiter is woken up as soon as the last job finishes.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Time out in seconds. The default is ``None``, in which case the wait does not time out.
+
+        Returns
+        -------
+        bool
+            ``True`` when the toolkit is idle, ``False`` when the timeout is exceeded.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._worker is None, timeout=timeout)
+
+    def wait_job(self, job_id, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Wait until a job reaches a final state.
+
+        Parameters
+        ----------
+        job_id : str
+            Job ID.
+        timeout : float, optional
+            Time out in seconds. The default is ``None``, in which case the wait does not time out.
+
+        Returns
+        -------
+        dict or None
+            Job information, ``None`` if the job does not exist.
+        """
+        with self._condition:
+            job = self._jobs.get(job_id)
+            if not job:
+                return None
+            self._condition.wait_for(lambda: job.is_done, timeout=timeout)
+            return job.to_dict()
+
+    def get_job(self, job_id) -> Optional[Dict[str, Any]]:
+        """Get the job information.
+
+        Parameters
+        ----------
+        job_id : str
+            Job ID.
+
+        Returns
+        -------
+        dict or None
+            Job information, ``None`` if the job does not exist.
+        """
+        with self._condition:
+            job = self._jobs.get(job_id)
+            return job.to_dict() if job else None
+
+    def get_jobs(self) -> List[Dict[str, Any]]:
+        """Get the information of all the jobs in the history."""
+        with self._condition:
+            return [job.to_dict() for job in self._jobs.values()]
+
+    def cancel_job(self, job_id) -> bool:
+        """Cancel a job.
+
+        Queued jobs are removed from the queue. Running jobs are notified, and the process
+        must check :meth:`is_cancel_requested` to stop.
+
+        Parameters
+        ----------
+        job_id : str
+            Job ID.
+
+        Returns
+        -------
+        bool
+            ``True`` when the cancellation is requested, ``False`` when the job does not exist or is done.
+        """
+        with self._condition:
+            job = self._jobs.get(job_id)
+            if not job or job.is_done:
+                return False
+            job.cancel_event.set()
+            if job.state == ToolkitJobState.QUEUED:
+                self._queue.remove(job)
+                job.state = ToolkitJobState.CANCELLED
+                job.end_time = time.time()
+                self._condition.notify_all()
+        if job.is_done:
+            event_broker.publish("job", job.to_dict())
+        logger.debug("Job %s cancellation requested.", job_id)
+        return True
+
+    def is_cancel_requested(self) -> bool:
+        """Check if the cancellation of the running job is requested.
+
+        The job is the one running in the calling thread or, for calls made from other threads,
+        the one running in the toolkit thread.
+        """
+        job = self._running_jobs.get(threading.get_ident())
+        if job is None:
+            worker = self._worker
+            job = self._running_jobs.get(worker.ident) if worker is not None else None
+        return bool(job and job.cancel_event.is_set())
 
     @staticmethod
     def running_threads() -> List[threading.Thread]:
@@ -87,8 +354,18 @@ class ThreadManager(object):
         threads_list = [thread for thread in threading.enumerate() if type(thread) == threading.Thread]
         return threads_list
 
-    @classmethod
     def is_toolkit_thread_running(self) -> bool:
         """Check if the thread associated with the toolkit is running."""
-        running_threads_names = [t.name for t in self.running_threads()]
-        return self.toolkit_thread_name in running_threads_names
+        worker = self._worker
+        return worker is not None and worker.is_alive()
+
+    def toolkit_thread_state(self):
+        """Get the toolkit thread running flag and the busy flag at the same time.
+
+        Returns
+        -------
+        tuple[bool, bool]
+            Whether the toolkit thread is running and whether the toolkit is busy.
+        """
+        with self._condition:
+            return self.is_toolkit_thread_running(), self.properties.is_toolkit_busy
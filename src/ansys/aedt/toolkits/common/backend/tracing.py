@@ -0,0 +1,397 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tracing of the AEDT calls made by the toolkit API.
+
+Each traced phase of the API, like ``connect_design``, opens a span, and the spans opened while it runs,
+including the raw ``odesktop`` and ``oproject`` calls, are nested in it. Once the root span finishes, the
+trace is kept in memory and written to a JSON file that the Chrome trace viewer (``chrome://tracing``) and
+Perfetto can load.
+
+Tracing is enabled with the ``trace_aedt_calls`` property. When it is disabled, the traced methods only
+read this property, and the AEDT objects are not wrapped.
+"""
+
+from collections import deque
+import contextlib
+import contextvars
+import functools
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+MAX_SUMMARY_LENGTH = 200
+"""Maximum length of the summary of an argument or a result."""
+
+
+def _truncate(text: str, max_length: int) -> str:
+    return text[: max_length - 3] + "..." if len(text) > max_length else text
+
+
+def summarize(value: Any, max_length: int = MAX_SUMMARY_LENGTH) -> str:
+    """Get a short representation of a value.
+
+    Parameters
+    ----------
+    value : Any
+        Value to summarize.
+    max_length : int, optional
+        Maximum length of the summary. The default is ``MAX_SUMMARY_LENGTH``.
+
+    Returns
+    -------
+    str
+        Representation of the value, truncated to ``max_length`` characters.
+    """
+    try:
+        text = repr(value)
+    except Exception:
+        text = "<{}>".format(type(value).__name__)
+    return _truncate(text, max_length)
+
+
+def summarize_arguments(args: tuple, kwargs: dict) -> str:
+    """Get a short representation of the arguments of a call."""
+    arguments = [summarize(arg) for arg in args]
+    arguments.extend("{}={}".format(key, summarize(value)) for key, value in kwargs.items())
+    return _truncate(", ".join(arguments), MAX_SUMMARY_LENGTH * 2)
+
+
+class Span:
+    """Timed operation of a trace.
+
+    Parameters
+    ----------
+    name : str
+        Name of the operation.
+    attributes : dict, optional
+        Attributes of the operation, like the summary of its arguments.
+    """
+
+    __slots__ = ("name", "attributes", "start_time", "start", "duration", "outcome", "children", "thread_id")
+
+    def __init__(self, name: str, attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.attributes = attributes or {}
+        self.start_time = time.time()
+        self.start = time.perf_counter()
+        self.duration = None
+        self.outcome = "ok"
+        self.children = []
+        self.thread_id = threading.get_ident()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the span and its children as a dictionary.
+
+        Returns
+        -------
+        dict
+            Name, start time, duration in seconds, attributes, outcome, and children of the span.
+        """
+        return {
+            "name": self.name,
+            "start_time": self.start_time,
+            "duration": self.duration,
+            "attributes": dict(self.attributes),
+            "outcome": self.outcome,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+    def chrome_events(self, pid: int, time_origin: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Get the complete events of the span and its children in the Chrome trace format.
+
+        Parameters
+        ----------
+        pid : int
+            Process ID of the events.
+        time_origin : float, optional
+            Pair of wall clock and performance counter times of the root span. The default is ``None``,
+            in which case the times of this span are used.
+
+        Returns
+        -------
+        list
+            Complete events, in microseconds.
+        """
+        if time_origin is None:
+            time_origin = (self.start_time, self.start)
+        start_time = time_origin[0] + self.start - time_origin[1]
+        events = [
+            {
+                "name": self.name,
+                "cat": "aedt",
+                "ph": "X",
+                "ts": round(start_time * 1e6, 3),
+                "dur": round((self.duration or 0.0) * 1e6, 3),
+                "pid": pid,
+                "tid": self.thread_id,
+                "args": {**self.attributes, "outcome": self.outcome},
+            }
+        ]
+        for child in self.children:
+            events.extend(child.chrome_events(pid, time_origin))
+        return events
+
+
+class Tracer:
+    """Recorder of the last traces.
+
+    Parameters
+    ----------
+    max_traces : int, optional
+        Number of traces to keep. The default is ``20``.
+    trace_file : str, optional
+        JSON file in the Chrome trace format where the traces are written. The default is ``None``,
+        in which case the traces are only kept in memory.
+    """
+
+    def __init__(self, max_traces: int = 20, trace_file: Optional[str] = None):
+        self.trace_file = trace_file
+        self._traces = deque(maxlen=max_traces)
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._current_span = contextvars.ContextVar("aedt_trace_span", default=None)
+
+    @property
+    def max_traces(self) -> int:
+        """Number of traces to keep."""
+        return self._traces.maxlen
+
+    def configure(self, max_traces: Optional[int] = None, trace_file: Optional[str] = None):
+        """Change the number of traces to keep and the trace file.
+
+        Parameters
+        ----------
+        max_traces : int, optional
+            Number of traces to keep. The default is ``None``, in which case it is not changed.
+        trace_file : str, optional
+            JSON file where the traces are written. The default is ``None``, in which case it is not changed.
+        """
+        with self._lock:
+            if max_traces is not None and max_traces != self._traces.maxlen:
+                self._traces = deque(self._traces, maxlen=max(max_traces, 1))
+            if trace_file is not None:
+                self.trace_file = trace_file
+
+    @contextlib.contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Span]:
+        """Time an operation.
+
+        The span is nested in the span opened in the same context, if any. Otherwise, it is the root
+        span of a new trace, which is recorded once the span finishes.
+
+        Parameters
+        ----------
+        name : str
+            Name of the operation.
+        **attributes
+            Attributes of the operation.
+
+        Yields
+        ------
+        :class:`Span`
+            Span of the operation. Attributes can be added while it runs.
+        """
+        parent = self._current_span.get()
+        span = Span(name, attributes)
+        token = self._current_span.set(span)
+        try:
+            yield span
+        except BaseException as error:
+            span.outcome = "error: {}".format(summarize(error))
+            raise
+        finally:
+            span.duration = time.perf_counter() - span.start
+            self._current_span.reset(token)
+            if parent is None:
+                self._record(span)
+            else:
+                parent.children.append(span)
+
+    @property
+    def current_span(self) -> Optional[Span]:
+        """Span opened in the current context, if any."""
+        return self._current_span.get()
+
+    def traces(self) -> List[Dict[str, Any]]:
+        """Get the last traces, from the oldest to the newest.
+
+        Returns
+        -------
+        list
+            Root span of each trace, as a dictionary.
+        """
+        with self._lock:
+            traces = list(self._traces)
+        return [trace.to_dict() for trace in traces]
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Get the last traces in the Chrome trace format.
+
+        Returns
+        -------
+        dict
+            Trace events of the last traces.
+        """
+        with self._lock:
+            traces = list(self._traces)
+        pid = os.getpid()
+        events = []
+        for trace in traces:
+            events.extend(trace.chrome_events(pid))
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def clear(self):
+        """Remove the recorded traces."""
+        with self._lock:
+            self._traces.clear()
+
+    def _record(self, span: Span):
+        with self._lock:
+            self._traces.append(span)
+        if self.trace_file:
+            self.write(self.trace_file)
+
+    def write(self, trace_file: str):
+        """Write the last traces in the Chrome trace format.
+
+        The file is replaced at once, so that it can be read while traces are recorded.
+
+        Parameters
+        ----------
+        trace_file : str
+            Path of the JSON file.
+        """
+        with self._write_lock:
+            temp_file = "{}.{}.tmp".format(trace_file, os.getpid())
+            try:
+                with open(temp_file, "w", encoding="utf-8") as file:
+                    json.dump(self.chrome_trace(), file)
+                os.replace(temp_file, trace_file)
+            except OSError:  # pragma: no cover
+                with contextlib.suppress(OSError):
+                    os.remove(temp_file)
+
+
+class TracedObject:
+    """Proxy of an AEDT object, like ``odesktop``, that traces the calls of its methods.
+
+    Parameters
+    ----------
+    obj : object
+        AEDT object.
+    name : str
+        Name of the object in the span names.
+    tracer : :class:`Tracer`
+        Tracer of the calls.
+    """
+
+    __slots__ = ("_obj", "_name", "_tracer")
+
+    def __init__(self, obj: Any, name: str, tracer: Tracer):
+        self._obj = obj
+        self._name = name
+        self._tracer = tracer
+
+    def __getattr__(self, attribute: str):
+        value = getattr(self._obj, attribute)
+        if not callable(value):
+            return value
+        span_name = "{}.{}".format(self._name, attribute)
+
+        @functools.wraps(value)
+        def traced_call(*args, **kwargs):
+            with self._tracer.span(span_name, arguments=summarize_arguments(args, kwargs)) as span:
+                result = value(*args, **kwargs)
+                span.attributes["result"] = summarize(result)
+                return result
+
+        return traced_call
+
+    def __bool__(self):
+        return bool(self._obj)
+
+    def __repr__(self):
+        return "TracedObject({!r})".format(self._obj)
+
+
+def default_trace_file(properties) -> str:
+    """Get the trace file of the toolkit in the temporary directory.
+
+    Parameters
+    ----------
+    properties : :class:`ansys.aedt.toolkits.common.backend.models.Properties`
+        Toolkit properties.
+
+    Returns
+    -------
+    str
+        Path of the trace file.
+    """
+    return os.path.join(tempfile.gettempdir(), properties.toolkit_name + "_" + properties.trace_file)
+
+
+def traced(method):
+    """Trace the calls of a method of the toolkit API.
+
+    The method is traced when the ``trace_aedt_calls`` property of the API is enabled. When the method
+    starts a new trace, the tracer uses the ``max_traces`` and ``trace_file`` properties of the API.
+
+    Parameters
+    ----------
+    method : callable
+        Method of the toolkit API.
+
+    Returns
+    -------
+    callable
+        Traced method.
+    """
+    name = method.__name__.lstrip("_")
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        properties = self.properties
+        if not getattr(properties, "trace_aedt_calls", False):
+            return method(self, *args, **kwargs)
+        if tracer.current_span is None:
+            tracer.configure(properties.max_traces, default_trace_file(properties))
+        with tracer.span(name, arguments=summarize_arguments(args, kwargs)) as span:
+            result = method(self, *args, **kwargs)
+            span.attributes["result"] = summarize(result)
+            return result
+
+    return wrapper
+
+
+tracer = Tracer()
+"""Tracer of the AEDT calls of the toolkit APIs."""
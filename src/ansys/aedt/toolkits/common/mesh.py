@@ -0,0 +1,523 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Binary mesh format shared by the backend and the UI.
+
+A mesh stream starts with ``MESH_MAGIC`` and contains one frame per object. Each frame is a
+little-endian ``uint32`` header length, a JSON header and the raw mesh arrays:
+
+- points: ``float32`` array of shape ``(n_points, 3)``,
+- offsets: ``int32`` array of ``n_cells + 1`` offsets into the connectivity,
+- connectivity: ``int32`` array of point indices.
+
+The arrays follow the VTK cell array layout, so they can be used without any conversion.
+"""
+
+import json
+import re
+import struct
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+
+MESH_MAGIC = b"AEDTMSH1"
+"""First bytes of a mesh stream. The last byte is the format version."""
+MESH_MIMETYPE = "application/x-aedt-mesh"
+"""MIME type of a mesh stream."""
+_HEADER_LENGTH = struct.Struct("<I")
+_FACE_INDEX_SUFFIX = re.compile(rb"/\S*")
+_DECIMATION_ITERATIONS = 8
+_DECIMATION_TOLERANCE = 0.85
+
+
+def read_obj(file_path: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Read the vertices and faces of an OBJ file.
+
+    Texture coordinates, normals, groups and materials are ignored. Negative face indices are
+    considered relative to the end of the vertex list.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the OBJ file.
+
+    Returns
+    -------
+    tuple
+        Points, offsets and connectivity arrays.
+    """
+    with open(file_path, "rb") as f:
+        data = f.read()
+    if not data.endswith(b"\n"):
+        data += b"\n"
+
+    # Consecutive lines of the same kind are parsed at once by NumPy
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    line_ends = np.flatnonzero(buffer == ord("\n"))
+    line_starts = np.concatenate(([0], line_ends[:-1] + 1))
+    second_chars = buffer[np.minimum(line_starts + 1, len(buffer) - 1)]
+    is_space = second_chars == ord(" ")
+
+    vertex_blocks = _line_blocks(data, line_starts, line_ends, is_space & (buffer[line_starts] == ord("v")))
+    points = _parse_numbers(b" ".join(block.replace(b"v ", b" ") for block in vertex_blocks), np.float32)
+    points = points.reshape(-1, 3)
+
+    is_face = is_space & (buffer[line_starts] == ord("f"))
+    face_count = int(np.count_nonzero(is_face))
+    face_blocks = [block.replace(b"f ", b" ") for block in _line_blocks(data, line_starts, line_ends, is_face)]
+    face_values = b" ".join(_FACE_INDEX_SUFFIX.sub(b"", block) if b"/" in block else block for block in face_blocks)
+    connectivity = _parse_numbers(face_values, np.int64)
+
+    if len(connectivity) == 3 * face_count:
+        # Faces have at least three vertices, so they are all triangles
+        offsets = np.arange(0, len(connectivity) + 1, 3, dtype=np.int32)
+    else:
+        sizes = [len(line.split()) for line in face_values.splitlines() if line.strip()]
+        offsets = np.zeros(len(sizes) + 1, dtype=np.int32)
+        np.cumsum(sizes, out=offsets[1:])
+
+    # OBJ indices start at 1, negative indices count from the end
+    connectivity = np.where(connectivity > 0, connectivity - 1, connectivity + len(points)).astype(np.int32)
+    return points, offsets, connectivity
+
+
+def _line_blocks(data: bytes, line_starts: np.ndarray, line_ends: np.ndarray, selected: np.ndarray) -> List[bytes]:
+    """Get the runs of consecutive selected lines."""
+    changes = np.flatnonzero(np.diff(np.concatenate(([False], selected, [False])).astype(np.int8)))
+    return [data[line_starts[start] : line_ends[end - 1] + 1] for start, end in zip(changes[::2], changes[1::2])]
+
+
+def _parse_numbers(values: bytes, dtype) -> np.ndarray:
+    if not values.strip():
+        return np.zeros(0, dtype=dtype)
+    return np.fromstring(values, dtype=dtype, sep=" ")
+
+
+def pack_mesh(name: str, points, offsets, connectivity, color=None, opacity=1.0, preview=False) -> bytes:
+    """Pack a mesh in a frame of the mesh stream.
+
+    Parameters
+    ----------
+    name : str
+        Object name.
+    points : :class:`numpy.ndarray`
+        Points of shape ``(n_points, 3)``.
+    offsets : :class:`numpy.ndarray`
+        Offsets of each cell in the connectivity, followed by the connectivity size.
+    connectivity : :class:`numpy.ndarray`
+        Point indices of the cells.
+    color : list, optional
+        Object color.
+    opacity : float, optional
+        Object opacity. The default is ``1.0``.
+    preview : bool, optional
+        Whether the mesh is a coarse preview, sent before the full mesh. The default is ``False``.
+
+    Returns
+    -------
+    bytes
+        Frame.
+    """
+    points = np.ascontiguousarray(points, dtype="<f4")
+    offsets = np.ascontiguousarray(offsets, dtype="<i4")
+    connectivity = np.ascontiguousarray(connectivity, dtype="<i4")
+    header = json.dumps(
+        {
+            "name": name,
+            "color": color,
+            "opacity": opacity,
+            "points": len(points),
+            "cells": len(offsets) - 1,
+            "connectivity": len(connectivity),
+            "preview": preview,
+        }
+    ).encode("utf-8")
+    return b"".join(
+        [_HEADER_LENGTH.pack(len(header)), header, points.tobytes(), offsets.tobytes(), connectivity.tobytes()]
+    )
+
+
+def iter_mesh_stream(meshes: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """Create a mesh stream.
+
+    Parameters
+    ----------
+    meshes : iterable
+        Meshes with the ``name``, ``points``, ``offsets``, ``connectivity``, ``color`` and ``opacity`` keys,
+        and optionally the ``preview`` key. They are packed one at a time, so a generator keeps a single
+        mesh in memory.
+
+    Yields
+    ------
+    bytes
+        Stream content.
+    """
+    yield MESH_MAGIC
+    for mesh in meshes:
+        yield pack_mesh(**mesh)
+
+
+def read_mesh_stream(data) -> List[Dict[str, Any]]:
+    """Read the meshes of a mesh stream.
+
+    The arrays are read-only views on ``data``: they are not copied.
+
+    Parameters
+    ----------
+    data : bytes
+        Mesh stream.
+
+    Returns
+    -------
+    list
+        Meshes with the ``name``, ``points``, ``offsets``, ``connectivity``, ``color``, ``opacity``
+        and ``preview`` keys.
+    """
+    data = memoryview(data)
+    if bytes(data[: len(MESH_MAGIC)]) != MESH_MAGIC:
+        raise ValueError("Not a mesh stream.")
+    position = len(MESH_MAGIC)
+    meshes = []
+    while position < len(data):
+        header = _read_frame_header(data, position)
+        if header is None or position + header["frame_size"] > len(data):
+            raise ValueError("Mesh stream is truncated.")
+        meshes.append(_read_frame(data, position, header))
+        position += header["frame_size"]
+    return meshes
+
+
+def iter_mesh_frames(chunks: Iterable[bytes]) -> Iterator[Dict[str, Any]]:
+    """Read the meshes of a mesh stream while it is received.
+
+    Each mesh is yielded as soon as its frame is complete. Its arrays are views on a copy of the frame.
+
+    Parameters
+    ----------
+    chunks : iterable
+        Chunks of the mesh stream.
+
+    Yields
+    ------
+    dict
+        Mesh with the ``name``, ``points``, ``offsets``, ``connectivity``, ``color``, ``opacity``
+        and ``preview`` keys.
+    """
+    buffer = bytearray()
+    chunks = iter(chunks)
+    magic_checked = False
+    while True:
+        if not magic_checked and len(buffer) >= len(MESH_MAGIC):
+            if bytes(buffer[: len(MESH_MAGIC)]) != MESH_MAGIC:
+                raise ValueError("Not a mesh stream.")
+            del buffer[: len(MESH_MAGIC)]
+            magic_checked = True
+        header = _read_frame_header(buffer, 0) if magic_checked else None
+        if header is not None and len(buffer) >= header["frame_size"]:
+            frame = bytes(buffer[: header["frame_size"]])
+            del buffer[: header["frame_size"]]
+            yield _read_frame(frame, 0, header)
+            continue
+        chunk = next(chunks, None)
+        if chunk is None:
+            if buffer or not magic_checked:
+                raise ValueError("Mesh stream is truncated.")
+            return
+        buffer += chunk
+
+
+def _read_frame_header(data, position: int) -> Optional[Dict[str, Any]]:
+    """Read a frame header, ``None`` if it is not complete."""
+    if position + _HEADER_LENGTH.size > len(data):
+        return None
+    (header_length,) = _HEADER_LENGTH.unpack_from(data, position)
+    header_end = position + _HEADER_LENGTH.size + header_length
+    if header_end > len(data):
+        return None
+    header = json.loads(bytes(data[position + _HEADER_LENGTH.size : header_end]))
+    header["data_offset"] = _HEADER_LENGTH.size + header_length
+    header["frame_size"] = header["data_offset"] + 4 * (
+        3 * header["points"] + header["cells"] + 1 + header["connectivity"]
+    )
+    return header
+
+
+def _read_frame(data, position: int, header: Dict[str, Any]) -> Dict[str, Any]:
+    position += header["data_offset"]
+    arrays = {}
+    for key, dtype, count in (
+        ("points", "<f4", header["points"] * 3),
+        ("offsets", "<i4", header["cells"] + 1),
+        ("connectivity", "<i4", header["connectivity"]),
+    ):
+        arrays[key] = np.frombuffer(data, dtype=dtype, count=count, offset=position)
+        position += count * 4
+    return {
+        "name": header["name"],
+        "points": arrays["points"].reshape(-1, 3),
+        "offsets": arrays["offsets"],
+        "connectivity": arrays["connectivity"],
+        "color": header["color"],
+        "opacity": header["opacity"],
+        "preview": header.get("preview", False),
+    }
+
+
+def write_obj(file_path: str, points, offsets, connectivity):
+    """Write the vertices and faces of a mesh to an OBJ file.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the OBJ file.
+    points : :class:`numpy.ndarray`
+        Points of shape ``(n_points, 3)``.
+    offsets : :class:`numpy.ndarray`
+        Offsets of each cell in the connectivity, followed by the connectivity size.
+    connectivity : :class:`numpy.ndarray`
+        Point indices of the cells.
+    """
+    offsets = np.asarray(offsets)
+    connectivity = np.asarray(connectivity, dtype=np.int64) + 1
+    with open(file_path, "w") as f:
+        np.savetxt(f, np.asarray(points), fmt="v %.9g %.9g %.9g")
+        sizes = np.diff(offsets)
+        if len(sizes) and np.all(sizes == 3):
+            np.savetxt(f, connectivity.reshape(-1, 3), fmt="f %d %d %d")
+        else:
+            for start, end in zip(offsets[:-1], offsets[1:]):
+                f.write("f " + " ".join(map(str, connectivity[start:end])) + "\n")
+
+
+def triangulate(offsets, connectivity) -> np.ndarray:
+    """Split the cells in triangles.
+
+    Parameters
+    ----------
+    offsets : :class:`numpy.ndarray`
+        Offsets of each cell in the connectivity, followed by the connectivity size.
+    connectivity : :class:`numpy.ndarray`
+        Point indices of the cells.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Point indices of the triangles, of shape ``(n_triangles, 3)``. Cells with fewer than
+        three points are dropped, polygons are split in fans.
+    """
+    offsets = np.asarray(offsets, dtype=np.int64)
+    connectivity = np.asarray(connectivity)
+    sizes = np.diff(offsets)
+    if np.all(sizes == 3):
+        return connectivity.reshape(-1, 3)
+    counts = np.clip(sizes - 2, 0, None)
+    starts = np.repeat(offsets[:-1], counts)
+    local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return np.stack([connectivity[starts], connectivity[starts + local + 1], connectivity[starts + local + 2]], axis=1)
+
+
+def decimate(points, offsets, connectivity, ratio: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Reduce the number of triangles of a mesh by vertex clustering.
+
+    Points are snapped to a regular grid and merged with the points of the same grid cell.
+    The grid resolution is adjusted so that the number of triangles gets close to the target,
+    without exceeding it.
+
+    Parameters
+    ----------
+    points : :class:`numpy.ndarray`
+        Points of shape ``(n_points, 3)``.
+    offsets : :class:`numpy.ndarray`
+        Offsets of each cell in the connectivity, followed by the connectivity size.
+    connectivity : :class:`numpy.ndarray`
+        Point indices of the cells.
+    ratio : float
+        Target ratio between the number of triangles after and before the decimation.
+
+    Returns
+    -------
+    tuple
+        Points, offsets and connectivity arrays of the triangulated mesh.
+    """
+    points = np.asarray(points, dtype=np.float32)
+    triangles = triangulate(offsets, connectivity)
+    target = max(int(len(triangles) * ratio), 1)
+    if ratio >= 1 or len(triangles) <= target:
+        return _triangle_mesh(points, triangles)
+
+    lower = points.min(axis=0)
+    extent = float((points.max(axis=0) - lower).max()) or 1.0
+    best = None
+    # The number of triangles of a surface grows with the square of the resolution
+    resolution = max(1.0, np.sqrt(target))
+    for _ in range(_DECIMATION_ITERATIONS):
+        candidate = _cluster(points, triangles, lower, extent / resolution)
+        count = len(candidate[1])
+        if count <= target and (best is None or count > len(best[1])):
+            best = candidate
+            if count >= _DECIMATION_TOLERANCE * target:
+                break
+        resolution = max(1.0, resolution * np.sqrt(target / max(count, 1)) * (0.97 if count > target else 1.0))
+    if best is None:
+        best = _cluster(points, triangles, lower, 2 * extent)
+    return _triangle_mesh(*best)
+
+
+def _cluster(points, triangles, lower, cell_size):
+    cells = np.floor((points - lower) / cell_size).astype(np.int64)
+    shape = cells.max(axis=0) + 1
+    keys = cells[:, 0] + shape[0] * (cells[:, 1] + shape[1] * cells[:, 2])
+    _, cluster_ids, cluster_sizes = np.unique(keys, return_inverse=True, return_counts=True)
+    cluster_points = np.stack(
+        [np.bincount(cluster_ids, weights=points[:, axis], minlength=len(cluster_sizes)) for axis in range(3)],
+        axis=1,
+    )
+    cluster_points /= cluster_sizes[:, None]
+
+    clustered = cluster_ids[triangles]
+    valid = (
+        (clustered[:, 0] != clustered[:, 1])
+        & (clustered[:, 1] != clustered[:, 2])
+        & (clustered[:, 0] != clustered[:, 2])
+    )
+    clustered = clustered[valid]
+    # Triangles collapsed on the same points are kept once
+    ordered = np.sort(clustered, axis=1)
+    count = len(cluster_sizes)
+    if count < 2**21:
+        triangle_keys = (ordered[:, 0] * count + ordered[:, 1]) * count + ordered[:, 2]
+        _, unique_rows = np.unique(triangle_keys, return_index=True)
+    else:  # pragma: no cover
+        _, unique_rows = np.unique(ordered, axis=0, return_index=True)
+    clustered = clustered[np.sort(unique_rows)]
+
+    # Remove the points of collapsed triangles
+    used, connectivity = np.unique(clustered, return_inverse=True)
+    return cluster_points[used].astype(np.float32), connectivity.reshape(-1, 3)
+
+
+def _triangle_mesh(points, triangles):
+    offsets = np.arange(0, 3 * len(triangles) + 1, 3, dtype=np.int32)
+    return points, offsets, np.asarray(triangles, dtype=np.int32).reshape(-1)
+
+
+def merge_meshes(meshes: List[Dict[str, Any]], name: str) -> Dict[str, Any]:
+    """Merge meshes in a single mesh, using the color and opacity of the first one.
+
+    Parameters
+    ----------
+    meshes : list
+        Meshes with the ``name``, ``points``, ``offsets``, ``connectivity``, ``color`` and ``opacity`` keys.
+    name : str
+        Name of the merged mesh.
+
+    Returns
+    -------
+    dict
+        Merged mesh.
+    """
+    point_offsets = np.cumsum([0] + [len(mesh["points"]) for mesh in meshes])
+    connectivity_offsets = np.cumsum([0] + [len(mesh["connectivity"]) for mesh in meshes])
+    return {
+        "name": name,
+        "points": np.concatenate([mesh["points"] for mesh in meshes]).astype(np.float32),
+        "offsets": np.concatenate(
+            [mesh["offsets"][:-1] + shift for mesh, shift in zip(meshes, connectivity_offsets)]
+            + [connectivity_offsets[-1:]]
+        ).astype(np.int32),
+        "connectivity": np.concatenate(
+            [mesh["connectivity"] + shift for mesh, shift in zip(meshes, point_offsets)]
+        ).astype(np.int32),
+        "color": meshes[0]["color"],
+        "opacity": meshes[0]["opacity"],
+    }
+
+
+def apply_lod(
+    meshes: List[Dict[str, Any]],
+    triangle_budget: Optional[int] = None,
+    decimation_ratio=None,
+    merge_tiny_objects: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """Reduce the level of detail of a model.
+
+    Parameters
+    ----------
+    meshes : list
+        Meshes with the ``name``, ``points``, ``offsets``, ``connectivity``, ``color`` and ``opacity`` keys.
+    triangle_budget : int, optional
+        Maximum number of triangles of the whole model. The default is ``None``, in which case
+        the number of triangles is not limited.
+    decimation_ratio : float or dict, optional
+        Ratio between the number of triangles after and before the decimation, for all the objects
+        or per object name. The default is ``None``, in which case the objects are not decimated.
+    merge_tiny_objects : float, optional
+        Objects smaller than this fraction of the model size are merged by color and opacity.
+        The default is ``None``, in which case no object is merged.
+
+    Returns
+    -------
+    list
+        Meshes of the model.
+    """
+    meshes = [mesh for mesh in meshes if len(mesh["points"])]
+    if not meshes:
+        return meshes
+
+    if merge_tiny_objects:
+        lowers = np.array([mesh["points"].min(axis=0) for mesh in meshes])
+        uppers = np.array([mesh["points"].max(axis=0) for mesh in meshes])
+        model_size = float(np.linalg.norm(uppers.max(axis=0) - lowers.min(axis=0)))
+        sizes = np.linalg.norm(uppers - lowers, axis=1)
+        tiny_groups: Dict[str, List[Dict[str, Any]]] = {}
+        kept = []
+        for mesh, size in zip(meshes, sizes):
+            if size < merge_tiny_objects * model_size:
+                tiny_groups.setdefault(json.dumps([mesh["color"], mesh["opacity"]]), []).append(mesh)
+            else:
+                kept.append(mesh)
+        for index, group in enumerate(tiny_groups.values()):
+            kept.append(group[0] if len(group) == 1 else merge_meshes(group, "merged_objects_{}".format(index)))
+        meshes = kept
+
+    triangle_counts = [int(np.clip(np.diff(mesh["offsets"]) - 2, 0, None).sum()) for mesh in meshes]
+    budget_ratio = 1.0
+    if triangle_budget and sum(triangle_counts) > triangle_budget:
+        budget_ratio = triangle_budget / sum(triangle_counts)
+
+    reduced = []
+    for mesh in meshes:
+        ratio = decimation_ratio.get(mesh["name"], 1.0) if isinstance(decimation_ratio, dict) else decimation_ratio
+        ratio = min(ratio or 1.0, budget_ratio)
+        if ratio < 1.0:
+            points, offsets, connectivity = decimate(mesh["points"], mesh["offsets"], mesh["connectivity"], ratio)
+            mesh = dict(mesh, points=points, offsets=offsets, connectivity=connectivity)
+        reduced.append(mesh)
+    return reduced
@@ -22,13 +22,34 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+import io
+import json
 import os
+import queue
+import socket
+import threading
 import time
 from typing import Optional
+from urllib.parse import urlsplit
 
 from PySide6 import QtWidgets
+from PySide6.QtCore import QObject
+from PySide6.QtCore import QThread
+from PySide6.QtCore import Signal
 import requests
-
+from requests.adapters import BaseAdapter
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.exceptions import NewConnectionError
+from urllib3.util.retry import Retry
+
+from ansys.aedt.toolkits.common.mesh import iter_mesh_frames
+from ansys.aedt.toolkits.common.mesh import read_mesh_stream
 from ansys.aedt.toolkits.common.ui.logger_handler import logger
 from ansys.aedt.toolkits.common.ui.models import general_settings
 from ansys.aedt.toolkits.common.utils import ToolkitThreadStatus
@@ -38,11 +59,545 @@ DEFAULT_REQUESTS_TIMEOUT = int(os.environ.get("PYAEDT_TOOLKIT_REQUESTS_TIMEOUT",
 MSG_TK_RUNNING = "Please wait, toolkit running"
 DEFAULT_AEDT_SESSION_VALUE = "New Session"
 """Default value for AEDT session selection in the UI."""
+MODEL_STREAM_CHUNK_SIZE = 1024 * 1024
+"""Size in bytes of the chunks read from the model stream."""
+EVENTS_READ_TIMEOUT = 60
+"""Seconds without any message, keep-alive included, before the event stream is reconnected."""
+EXPORT_REQUESTS_TIMEOUT = int(os.environ.get("PYAEDT_TOOLKIT_EXPORT_REQUESTS_TIMEOUT", 600))
+"""Timeout in seconds of the requests that save the project and export the model from AEDT."""
+ENDPOINT_TIMEOUTS = {
+    "/health": 5,
+    "/status": 5,
+    "/properties": 10,
+    "/installed_versions": 10,
+    "/aedt_sessions": 10,
+    "/get_aedt_model": EXPORT_REQUESTS_TIMEOUT,
+    "/get_aedt_model_stream": EXPORT_REQUESTS_TIMEOUT,
+    "/get_aedt_mesh": EXPORT_REQUESTS_TIMEOUT,
+}
+"""Timeout in seconds of the requests to the endpoints answered without waiting for AEDT,
+and of the requests exporting from AEDT, which take longer than the default timeout."""
+REQUESTS_POOL_SIZE = 8
+"""Maximum number of connections kept open with the backend."""
+REQUESTS_RETRIES = 3
+"""Maximum number of retries of a request to the backend."""
+REQUESTS_BACKOFF_FACTOR = 0.2
+"""Backoff factor in seconds of the retries, the delay doubles after each failed retry."""
+IN_PROCESS_STREAM_CHUNKS = 16
+"""Maximum number of chunks of an in-process streamed response produced ahead of the reader."""
+
+
+class BackendEventListener(QThread):
+    """Receives the backend events and emits them as Qt signals.
+
+    The listener keeps a connection to the ``/events`` stream and reconnects when the
+    backend is not reachable.
+
+    Parameters
+    ----------
+    url : str
+        Backend URL.
+    reconnect_interval : float, optional
+        Seconds to wait before reconnecting. The default is ``1``.
+    session : requests.Session, optional
+        Session reading the event stream. The default is ``None``, in which case
+        a new connection is opened for each stream.
+    """
+
+    event_received = Signal(str, object)
+    state_changed = Signal(str)
+    progress_changed = Signal(int)
+    busy_changed = Signal(bool)
+    job_finished = Signal(dict)
+
+    def __init__(self, url: str, reconnect_interval: float = 1, session: Optional[requests.Session] = None):
+        super().__init__()
+        self.url = url
+        self.reconnect_interval = reconnect_interval
+        self.session = session
+        self._stop_event = threading.Event()
+        self._response = None
+
+    def run(self):
+        """Read the event stream until the listener is stopped."""
+        while not self._stop_event.is_set():
+            try:
+                with (self.session or requests).get(
+                    self.url + "/events", stream=True, timeout=(DEFAULT_REQUESTS_TIMEOUT, EVENTS_READ_TIMEOUT)
+                ) as response:
+                    self._response = response
+                    if response.ok:
+                        self._read_stream(response)
+            except (requests.exceptions.RequestException, AttributeError, ValueError) as e:
+                # AttributeError and ValueError are raised when the stream is closed while reading
+                if not self._stop_event.is_set():
+                    logger.debug(f"Event stream interrupted: {e}")
+            finally:
+                self._response = None
+            self._stop_event.wait(self.reconnect_interval)
+
+    def stop(self):
+        """Stop the listener and close the event stream."""
+        self._stop_event.set()
+        response = self._response
+        if response is not None:
+            # Closing the response does not interrupt a blocking read, shutting down the socket does
+            shutdown = getattr(response.raw, "shutdown", response.close)
+            shutdown()
+        self.wait()
+
+    def _read_stream(self, response):
+        event, data = None, []
+        # Events are small: read byte by byte so that each event is dispatched as soon as it arrives
+        for line in response.iter_lines(chunk_size=1, decode_unicode=True):
+            if self._stop_event.is_set():
+                return
+            if line is None or line.startswith(":"):
+                continue
+            if not line:
+                if event:
+                    self._dispatch(event, json.loads("\n".join(data)) if data else None)
+                event, data = None, []
+            elif line.startswith("event:"):
+                event = line[len("event:") :].strip()
+            elif line.startswith("data:"):
+                data.append(line[len("data:") :].strip())
+
+    def _dispatch(self, event, data):
+        self.event_received.emit(event, data)
+        if event == "state":
+            self.state_changed.emit(data)
+        elif event == "progress":
+            self.progress_changed.emit(data)
+        elif event == "busy":
+            self.busy_changed.emit(data)
+        elif event == "job":
+            self.job_finished.emit(data)
+
+
+class InProcessResponseStream:
+    """Body of a streamed in-process response, read while the application produces it.
+
+    The application iterator is consumed by a separate thread, so that :meth:`shutdown` interrupts
+    a blocking read as shutting down the socket does over HTTP.
+
+    Parameters
+    ----------
+    app_iter : iterable
+        Response body returned by the WSGI application.
+    """
+
+    def __init__(self, app_iter):
+        self._app_iter = app_iter
+        self._chunks = queue.Queue(maxsize=IN_PROCESS_STREAM_CHUNKS)
+        self._buffer = b""
+        self._stopped = threading.Event()
+        self._ended = False
+        threading.Thread(target=self._produce, name="In_Process_Stream", daemon=True).start()
+
+    def _produce(self):
+        try:
+            for chunk in self._app_iter:
+                while chunk and not self._stopped.is_set():
+                    try:
+                        self._chunks.put(chunk, timeout=0.1)
+                        break
+                    except queue.Full:
+                        pass
+                if self._stopped.is_set():
+                    break
+        except Exception as e:
+            logger.debug(f"In-process stream interrupted: {e}")
+        finally:
+            close = getattr(self._app_iter, "close", None)
+            if close is not None:
+                close()
+            self._end()
+
+    def _end(self):
+        try:
+            self._chunks.put_nowait(None)
+        except queue.Full:
+            # The reader is not blocked, it finds the end once the chunks are read
+            self._stopped.set()
+
+    def read(self, size=-1):
+        """Read up to ``size`` bytes, or the whole body when ``size`` is negative."""
+        if size is None or size < 0:
+            return b"".join(iter(lambda: self.read(MODEL_STREAM_CHUNK_SIZE), b""))
+        while not self._buffer and not self._ended:
+            if self._stopped.is_set() and self._chunks.empty():
+                self._ended = True
+                break
+            chunk = self._chunks.get()
+            if chunk is None:
+                self._ended = True
+            else:
+                self._buffer = chunk
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def shutdown(self):
+        """Stop reading the body, a blocked read returns immediately."""
+        self._stopped.set()
+        self._buffer = b""
+        self._ended = True
+        self._end()
+
+    def close(self):
+        """Stop reading the body."""
+        self.shutdown()
+
+
+class InProcessAdapter(BaseAdapter):
+    """Transport adapter sending the requests to a WSGI application running in the same process.
+
+    The requests do not go through sockets, an HTTP parser or a second process, but reach the same
+    routes as over HTTP. Timeouts are not applied.
+
+    Parameters
+    ----------
+    app : callable
+        WSGI application, usually an
+        :class:`ansys.aedt.toolkits.common.backend.multithreading_server.InProcessServer`.
+    """
+
+    def __init__(self, app):
+        super().__init__()
+        self.app = app
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        """Send a prepared request to the application.
+
+        Parameters
+        ----------
+        request : requests.PreparedRequest
+            Request to send.
+        stream : bool, optional
+            Whether to read the body while the application produces it. The default is ``False``.
+        timeout : float or tuple, optional
+            Ignored.
+        verify : bool or str, optional
+            Ignored.
+        cert : str or tuple, optional
+            Ignored.
+        proxies : dict, optional
+            Ignored.
+
+        Returns
+        -------
+        requests.Response
+            Response of the application.
+        """
+        from werkzeug.test import EnvironBuilder
+        from werkzeug.test import run_wsgi_app
+
+        url = urlsplit(request.url)
+        body = request.body or b""
+        if hasattr(body, "read"):
+            body = body.read()
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        builder = EnvironBuilder(
+            path=url.path,
+            base_url=f"{url.scheme}://{url.netloc}",
+            query_string=url.query,
+            method=request.method,
+            headers=[(name, value) for name, value in request.headers.items() if name.lower() != "content-length"],
+            data=body,
+        )
+        try:
+            environ = builder.get_environ()
+        finally:
+            builder.close()
+        app_iter, status, headers = run_wsgi_app(self.app, environ, buffered=False)
+
+        response = requests.Response()
+        status_code, _, response.reason = status.partition(" ")
+        response.status_code = int(status_code)
+        response.headers = CaseInsensitiveDict(headers.to_wsgi_list())
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        if stream:
+            response.raw = InProcessResponseStream(app_iter)
+        else:
+            try:
+                response.raw = io.BytesIO(b"".join(app_iter))
+            finally:
+                close = getattr(app_iter, "close", None)
+                if close is not None:
+                    close()
+        return response
+
+    def close(self):
+        """Nothing to close, there is no connection."""
+
+
+class UnixSocketConnection(HTTPConnection):
+    """HTTP connection over a Unix domain socket."""
+
+    socket_path = ""
+
+    def _new_conn(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout if isinstance(self.timeout, (int, float)) else None)
+        try:
+            sock.connect(self.socket_path)
+        except OSError as e:
+            sock.close()
+            raise NewConnectionError(self, f"Failed to connect to {self.socket_path}: {e}") from e
+        return sock
+
+
+class UnixSocketConnectionPool(HTTPConnectionPool):
+    """Pool of HTTP connections over a Unix domain socket.
+
+    Parameters
+    ----------
+    host : str
+        Host name of the URLs, sent in the ``Host`` header only.
+    port : int, optional
+        Port of the URLs, sent in the ``Host`` header only.
+    socket_path : str
+        Path of the socket.
+    **kwargs
+        Arguments of ``urllib3.HTTPConnectionPool``.
+    """
+
+    ConnectionCls = UnixSocketConnection
+
+    def __init__(self, host, port=None, socket_path="", **kwargs):
+        super().__init__(host, port, **kwargs)
+        self.socket_path = socket_path
+
+    def _new_conn(self):
+        connection = super()._new_conn()
+        connection.socket_path = self.socket_path
+        return connection
+
+
+class UnixSocketAdapter(HTTPAdapter):
+    """Transport adapter sending the requests over a Unix domain socket.
+
+    The host and port of the URLs are ignored, all the requests reach the server listening on the socket.
+
+    Parameters
+    ----------
+    socket_path : str
+        Path of the socket.
+    **kwargs
+        Arguments of ``requests.adapters.HTTPAdapter``.
+    """
+
+    def __init__(self, socket_path, **kwargs):
+        self.socket_path = socket_path
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {"http": self._new_pool, "https": self._new_pool}
+
+    def _new_pool(self, host, port=None, **kwargs):
+        return UnixSocketConnectionPool(host, port, socket_path=self.socket_path, **kwargs)
+
+
+class BackendSession(requests.Session):
+    """HTTP session keeping its connections with the backend open between requests.
+
+    Requests without a timeout use the timeout of their endpoint in ``ENDPOINT_TIMEOUTS``, or
+    ``DEFAULT_REQUESTS_TIMEOUT``. Requests that fail to connect are retried with an exponential
+    backoff. Requests that reached the backend are never sent again, even idempotent ones, because
+    routes such as ``/get_aedt_model`` queue a new AEDT export each time they are received.
+
+    Parameters
+    ----------
+    pool_size : int, optional
+        Maximum number of connections kept open. The default is ``REQUESTS_POOL_SIZE``.
+    retries : int, optional
+        Maximum number of retries of a request. The default is ``REQUESTS_RETRIES``.
+    backoff_factor : float, optional
+        Backoff factor in seconds of the retries, as defined by ``urllib3.util.Retry``.
+        The default is ``REQUESTS_BACKOFF_FACTOR``.
+    app : callable, optional
+        WSGI application of a backend running in the same process. The default is ``None``,
+        in which case the backend is reached over HTTP.
+    unix_socket : str, optional
+        Path of the Unix domain socket the backend listens on. The default is ``None``,
+        in which case the backend is reached over TCP.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = REQUESTS_POOL_SIZE,
+        retries: int = REQUESTS_RETRIES,
+        backoff_factor: float = REQUESTS_BACKOFF_FACTOR,
+        app=None,
+        unix_socket: Optional[str] = None,
+    ):
+        super().__init__()
+        if app is not None:
+            # Requests reach the application without connections, so there is nothing to retry,
+            # and no proxy to read from the environment
+            adapter = InProcessAdapter(app)
+            self.trust_env = False
+        else:
+            retry = Retry(
+                total=retries,
+                connect=retries,
+                # Read errors are raised at once, as timeouts, instead of being retried
+                read=False,
+                backoff_factor=backoff_factor,
+                raise_on_status=False,
+            )
+            if unix_socket:
+                adapter = UnixSocketAdapter(unix_socket, pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+                # The environment proxies apply to TCP connections only
+                self.trust_env = False
+            else:
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+
+    def request(self, method, url, *args, **kwargs):
+        if "timeout" not in kwargs:
+            endpoint = urlsplit(url).path.rstrip("/")
+            kwargs["timeout"] = ENDPOINT_TIMEOUTS.get(endpoint, DEFAULT_REQUESTS_TIMEOUT)
+        return super().request(method, url, *args, **kwargs)
+
+
+class AsyncBackendClient(QObject):
+    """Runs the calls to the backend in a worker thread and delivers their results to the GUI thread.
+
+    The calls are run one at a time, in the order they are submitted, so that they reach the backend
+    in the same order as when they were made from the GUI thread. The callbacks are called in the
+    thread where the client was created, which must run a Qt event loop.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        Number of worker threads. The default is ``1``, in which case the calls are run in order.
+    """
+
+    _call_done = Signal(object, object, object)
+    _gui_call = Signal(object, object)
+
+    def __init__(self, max_workers: int = 1):
+        super().__init__()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="Backend_Call")
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._call_done.connect(self._deliver)
+        self._gui_call.connect(self._run)
+
+    def submit(self, function, *args, callback=None, error_callback=None, **kwargs):
+        """Call a function in the worker thread.
+
+        A call must not wait for the result of another call, as it would wait for itself.
+
+        Parameters
+        ----------
+        function : callable
+            Function to call.
+        *args
+            Positional arguments of the function.
+        callback : callable, optional
+            Function called in the GUI thread with the returned value. The default is ``None``.
+        error_callback : callable, optional
+            Function called in the GUI thread with the raised exception. The default is ``None``,
+            in which case the exception is logged.
+        **kwargs
+            Keyword arguments of the function.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future of the returned value.
+        """
+        future = self._executor.submit(function, *args, **kwargs)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(lambda done: self._call_finished(done, callback, error_callback))
+        return future
+
+    def run_in_gui_thread(self, function, *args):
+        """Call a function in the GUI thread.
+
+        The function is called immediately from the GUI thread, and as soon as the event loop
+        processes the call from any other thread.
+
+        Parameters
+        ----------
+        function : callable
+            Function to call.
+        *args
+            Arguments of the function.
+        """
+        self._gui_call.emit(function, args)
+
+    def wait(self, timeout: Optional[float] = None):
+        """Wait until the submitted calls are finished.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Time out in seconds. The default is ``None``, in which case there is no time out.
+
+        Returns
+        -------
+        bool
+            ``True`` when all the calls are finished, ``False`` otherwise.
+        """
+        with self._lock:
+            pending = list(self._pending)
+        _, not_done = wait(pending, timeout)
+        return not not_done
+
+    def shutdown(self, cancel_pending: bool = False):
+        """Stop accepting calls.
+
+        The calls already submitted are still run unless they are canceled.
+
+        Parameters
+        ----------
+        cancel_pending : bool, optional
+            Whether to cancel the calls that are not started. The default is ``False``.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=cancel_pending)
+
+    def _call_finished(self, future, callback, error_callback):
+        with self._lock:
+            self._pending.discard(future)
+        try:
+            self._call_done.emit(future, callback, error_callback)
+        except RuntimeError:
+            # The client was deleted with its window
+            pass
+
+    def _deliver(self, future, callback, error_callback):
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            if error_callback is not None:
+                error_callback(error)
+            else:
+                logger.error(f"Backend call failed: {error}")
+        elif callback is not None:
+            callback(future.result())
+
+    @staticmethod
+    def _run(function, args):
+        function(*args)
 
 
 class FrontendGeneric:
     """This class provides a generic frontend for controlling the toolkit."""
 
+    backend_app = None
+    """WSGI application of a backend running in the same process, or ``None`` to reach it over HTTP."""
+
     def __init__(self):
         logger.info("Frontend initialization...")
 
@@ -51,12 +606,21 @@ class FrontendGeneric:
         port = general_settings.backend_port
         self.url = f"http://{url}:{port}"
         self.logger = logger
+        self.event_listener = None
+        self._properties_cache = (None, b"")
+        # Release requested to the backend when the window is closed, sent once
+        self.__close_properties = {"close_projects": False, "close_desktop": False}
+        self.__release_future = None
+        # Connections are reused between the calls to the backend
+        self.session = BackendSession(app=self.backend_app, unix_socket=general_settings.backend_unix_socket)
+        # Calls to the backend made from the GUI are run in a worker thread
+        self.backend_client = AsyncBackendClient()
 
         # Load toolkit icon
         self.images_path = os.path.join(os.path.dirname(__file__), "images")
 
     @staticmethod
-    def poll_url(url: str, timeout: int = 10, interval: float = 0.5):
+    def poll_url(url: str, timeout: int = 10, interval: float = 0.5, session: Optional[requests.Session] = None):
         """Poll a URL repeatedly until a successful response or a timeout is reached.
 
         This function sends repeated GET requests to the given URL at a fixed interval,
@@ -73,6 +637,9 @@ class FrontendGeneric:
         interval : float, optional
             Time (in seconds) to wait between each request attempt.
             Default is 0.5.
+        session : requests.Session, optional
+            Session sending the requests. The default is ``None``, in which case
+            a new connection is opened for each request.
 
         Returns
         -------
@@ -89,7 +656,7 @@ class FrontendGeneric:
 
         while time.time() < end_time and not response_success:
             try:
-                response = requests.get(url, timeout=2.0)
+                response = (session or requests).get(url, timeout=2.0)
                 response_success = response.ok
                 if response_success:
                     return True, response.json()
@@ -102,6 +669,32 @@ class FrontendGeneric:
 
         return False, f"Polling failed after {timeout} seconds."
 
+    def call_async(self, function, *args, callback=None, error_callback=None, **kwargs):
+        """Call a function in the backend worker thread without blocking the GUI.
+
+        The calls are run one at a time, in the order they are submitted.
+
+        Parameters
+        ----------
+        function : callable
+            Function to call, usually a method of this class sending requests to the backend.
+        *args
+            Positional arguments of the function.
+        callback : callable, optional
+            Function called in the GUI thread with the returned value. The default is ``None``.
+        error_callback : callable, optional
+            Function called in the GUI thread with the raised exception. The default is ``None``,
+            in which case the exception is logged.
+        **kwargs
+            Keyword arguments of the function.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future of the returned value.
+        """
+        return self.backend_client.submit(function, *args, callback=callback, error_callback=error_callback, **kwargs)
+
     def check_connection(self):
         """Check the backend connection.
 
@@ -111,7 +704,7 @@ class FrontendGeneric:
             ``True`` when successful, ``False`` when failed.
         """
         url = self.url + "/health"
-        response_success, response_content = self.poll_url(url)
+        response_success, response_content = self.poll_url(url, session=self.session)
         if response_success:
             logger.debug(response_content)
         else:
@@ -128,20 +721,20 @@ class FrontendGeneric:
             ``True`` if the backend is busy, ``False`` otherwise.
         """
         try:
-            response = requests.get(self.url + "/status", timeout=DEFAULT_REQUESTS_TIMEOUT)
+            response = self.session.get(self.url + "/status")
             res = response.ok and response.json() == ToolkitThreadStatus.BUSY.value
             return res
         except requests.exceptions.RequestException:
             logger.error("Get backend status failed")
             return False
 
-    def wait_thread(self):
+    def wait_thread(self, timeout: float = 10):
         """
         Wait thread until backend is idle.
 
         Parameters
         ----------
-        timeout : int, optional
+        timeout : float, optional
             Time out in seconds. The default is 10 seconds.
 
         Returns
@@ -150,12 +743,39 @@ class FrontendGeneric:
             ``True`` when the backend is idle, ``False`` otherwise.
         """
         try:
-            response = requests.get(self.url + "/wait_thread", timeout=DEFAULT_REQUESTS_TIMEOUT)
+            response = self.session.get(
+                self.url + "/wait_thread", data=str(timeout), timeout=max(timeout + 1, DEFAULT_REQUESTS_TIMEOUT)
+            )
             return response.ok
         except requests.exceptions.RequestException:
             logger.error("Wait thread failed.")
             return False
 
+    def start_event_listener(self):
+        """Start listening to the backend events.
+
+        The listener is created only once and shared by all the callers.
+
+        Returns
+        -------
+        :class:`BackendEventListener`
+            Listener emitting a Qt signal for each backend event.
+        """
+        if self.event_listener is None:
+            # Over TCP, the stream holds its own connection instead of one of the pool
+            session = None
+            if self.backend_app is not None or general_settings.backend_unix_socket:
+                session = self.session
+            self.event_listener = BackendEventListener(self.url, session=session)
+        if not self.event_listener.isRunning():
+            self.event_listener.start()
+        return self.event_listener
+
+    def stop_event_listener(self):
+        """Stop listening to the backend events."""
+        if self.event_listener is not None:
+            self.event_listener.stop()
+
     def installed_versions(self):
         """
         Get the installed versions of AEDT.
@@ -166,7 +786,7 @@ class FrontendGeneric:
             A list of installed AEDT versions if successful, ``False`` otherwise.
         """
         try:
-            response = requests.get(self.url + "/installed_versions", timeout=DEFAULT_REQUESTS_TIMEOUT)
+            response = self.session.get(self.url + "/installed_versions")
             if response.ok:
                 versions = response.json()
                 return versions
@@ -175,6 +795,31 @@ class FrontendGeneric:
             self.log_and_update_progress(msg, log_level="error")
             return False
 
+    def get_project_index(self, project_list=None):
+        """
+        Get the designs of AEDT project files without launching AEDT.
+
+        Parameters
+        ----------
+        project_list : list, optional
+            Full paths of the project files. The default is ``None``, in which case
+            the projects of the backend properties are indexed.
+
+        Returns
+        -------
+        dict
+            Dictionary of project indexes {project path: index}. The index is ``None``
+            if the file cannot be indexed.
+        """
+        try:
+            response = self.session.get(self.url + "/project_index", json={"project_list": project_list})
+            if response.ok:
+                return response.json()
+        except requests.exceptions.RequestException:
+            msg = "Get project index failed"
+            self.log_and_update_progress(msg, log_level="error")
+        return {}
+
     def get_properties(self):
         """
         Get properties from the backend.
@@ -184,10 +829,18 @@ class FrontendGeneric:
         dict or False
             A dictionary of properties if successful, ``False`` otherwise.
         """
+        # ETag and content of the last properties received, updated together as threads may call this method
+        etag, content = self._properties_cache
+        headers = {"If-None-Match": etag} if etag else {}
         try:
-            response = requests.get(self.url + "/properties", timeout=DEFAULT_REQUESTS_TIMEOUT)
+            response = self.session.get(self.url + "/properties", headers=headers)
             if response.ok:
-                data = response.json()
+                if response.status_code == 304:
+                    # Properties did not change, the cached document is parsed to return a new dictionary
+                    data = json.loads(content)
+                else:
+                    self._properties_cache = (response.headers.get("ETag"), response.content)
+                    data = response.json()
                 if data:
                     logger.debug("Properties from backend updated successfully")
                     return data
@@ -195,7 +848,7 @@ class FrontendGeneric:
                     logger.debug("Backend properties empty")
                     return False
         except requests.exceptions.RequestException:
-            self.ui.update_logger("Get properties failed")
+            self.log_and_update_progress("Get properties failed", log_level="error")
 
     def set_properties(self, data):
         """
@@ -207,7 +860,7 @@ class FrontendGeneric:
             Dictionary of properties to set.
         """
         try:
-            response = requests.put(self.url + "/properties", json=data, timeout=DEFAULT_REQUESTS_TIMEOUT)
+            response = self.session.put(self.url + "/properties", json=data)
             if response.ok:
                 return response.json()
             else:
@@ -237,7 +890,7 @@ class FrontendGeneric:
             be_properties["aedt_version"] = version
             be_properties["non_graphical"] = non_graphical
             self.set_properties(be_properties)
-            response = requests.get(self.url + "/aedt_sessions", timeout=DEFAULT_REQUESTS_TIMEOUT)
+            response = self.session.get(self.url + "/aedt_sessions")
             sessions = []
             if response.ok:
                 sessions = response.json()
@@ -246,9 +899,11 @@ class FrontendGeneric:
             logger.error(f"Find AEDT sessions failed")
             return False
 
-    def launch_aedt(self, selected_version, selected_process, non_graphical=False):
+    def launch_aedt(self, selected_version, selected_process, non_graphical=False, callback=None):
         """Launch AEDT.
 
+        The requests are sent from the backend worker thread, this method returns immediately.
+
         Parameters
         ----------
         selected_version : str
@@ -257,16 +912,26 @@ class FrontendGeneric:
             The selected AEDT process.
         non_graphical : bool, optional
             Flag indicating whether to run AEDT in non-graphical mode. The default is False.
+        callback : callable, optional
+            Function called in the GUI thread once the requests are sent. The default is ``None``.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future of the requests.
         """
-        response = requests.get(self.url + "/status", timeout=DEFAULT_REQUESTS_TIMEOUT)
+        return self.call_async(self.__launch_aedt, selected_version, selected_process, non_graphical, callback=callback)
+
+    def __launch_aedt(self, selected_version, selected_process, non_graphical):
+        response = self.session.get(self.url + "/status")
         res_busy = response.ok and response.json() == ToolkitThreadStatus.BUSY.value
         res_idle = response.ok and response.json() == ToolkitThreadStatus.IDLE.value
         if res_busy:
             msg = MSG_TK_RUNNING
             self.log_and_update_progress(msg, log_level="debug")
         elif res_idle:
-            self.ui.update_progress(0)
-            response = requests.get(self.url + "/health", timeout=DEFAULT_REQUESTS_TIMEOUT)
+            self.backend_client.run_in_gui_thread(self.ui.update_progress, 0)
+            response = self.session.get(self.url + "/health")
             if response.ok and response.json() == "Toolkit is not connected to AEDT.":
                 be_properties = self.get_properties()
                 if be_properties["selected_process"] == 0 or not self.properties.block_settings_after_load:
@@ -282,7 +947,7 @@ class FrontendGeneric:
                             be_properties["use_grpc"] = False
                             be_properties["selected_process"] = int(text_splitted[1])
                     self.set_properties(be_properties)
-                response = requests.post(self.url + "/launch_aedt", timeout=DEFAULT_REQUESTS_TIMEOUT)
+                response = self.session.post(self.url + "/launch_aedt")
 
                 if response.status_code == 200:
                     msg = "Launching AEDT"
@@ -297,27 +962,37 @@ class FrontendGeneric:
             msg = response.json()
             self.log_and_update_progress(msg, log_level="debug", progress=100)
 
-    def open_project(self, selected_project):
+    def open_project(self, selected_project, callback=None):
         """Open an AEDT project.
 
+        The requests are sent from the backend worker thread, this method returns immediately.
+
         Parameters
         ----------
         selected_project : str
             The path to the selected AEDT project.
+        callback : callable, optional
+            Function called in the GUI thread once the requests are sent. The default is ``None``.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future of the requests.
         """
-        response = requests.get(self.url + "/status", timeout=DEFAULT_REQUESTS_TIMEOUT)
+        return self.call_async(self.__open_project, selected_project, callback=callback)
+
+    def __open_project(self, selected_project):
+        response = self.session.get(self.url + "/status")
         res_busy = response.ok and response.json() == ToolkitThreadStatus.BUSY.value
         res_idle = response.ok and response.json() == ToolkitThreadStatus.IDLE.value
         if res_busy:
             msg = MSG_TK_RUNNING
             self.log_and_update_progress(msg, log_level="debug")
         elif res_idle:
-            self.ui.update_progress(0)
-            response = requests.get(self.url + "/health", timeout=DEFAULT_REQUESTS_TIMEOUT)
+            self.backend_client.run_in_gui_thread(self.ui.update_progress, 0)
+            response = self.session.get(self.url + "/health")
             if response.ok and response.json() == "Toolkit is not connected to AEDT.":
-                response = requests.post(
-                    self.url + "/open_project", data=selected_project, timeout=DEFAULT_REQUESTS_TIMEOUT
-                )
+                response = self.session.post(self.url + "/open_project", data=selected_project)
                 if response.status_code == 200:
                     msg = "Project opened"
                     self.log_and_update_progress(msg, log_level="debug")
@@ -340,6 +1015,9 @@ class FrontendGeneric:
         obj_list=None,
         export_path=None,
         export_as_multiple_objects=False,
+        triangle_budget=None,
+        decimation_ratio=None,
+        merge_tiny_objects=None,
     ):
         """Get AEDT model.
 
@@ -363,32 +1041,25 @@ class FrontendGeneric:
            Whether to export the model as multiple objects or not. Default is ``False``
            in which case the model is exported as single object.
 
+        triangle_budget : int, optional
+            Maximum number of triangles of the whole model. The default is ``None``, in which case
+            the number of triangles is not limited.
+        decimation_ratio : float or dict, optional
+            Ratio between the number of triangles after and before the decimation, for all the objects
+            or per object name. The default is ``None``, in which case the objects are not decimated.
+        merge_tiny_objects : float, optional
+            Objects smaller than this fraction of the model size are merged by color and opacity.
+            The default is ``None``, in which case no object is merged.
+
         Returns
         -------
         bool
             ``True`` when successful, ``False`` when failed.
         """
-        # Set active project and design
-        be_properties = self.get_properties()
-
-        if project_selected == "No Project" or design_selected == "No Design":
-            logger.error("Wrong project or design")
+        if not self.__select_design(project_selected, design_selected):
             return False
-        else:
-            for project in be_properties["project_list"]:
-                if self.get_project_name(project) == project_selected:
-                    be_properties["active_project"] = project
-                    if project_selected in list(be_properties["design_list"].keys()):
-                        designs = be_properties["design_list"][project_selected]
-                        for design in designs:
-                            if design_selected == design:
-                                be_properties["active_design"] = design
-                                break
-                    break
 
-        self.set_properties(be_properties)
-
-        response = requests.get(
+        response = self.session.get(
             self.url + "/get_aedt_model",
             json={
                 "air_objects": air_objects,
@@ -396,8 +1067,10 @@ class FrontendGeneric:
                 "obj_list": obj_list,
                 "export_path": export_path,
                 "export_as_multiple_objects": export_as_multiple_objects,
+                "triangle_budget": triangle_budget,
+                "decimation_ratio": decimation_ratio,
+                "merge_tiny_objects": merge_tiny_objects,
             },
-            timeout=DEFAULT_REQUESTS_TIMEOUT,
         )
 
         if response.ok:
@@ -409,6 +1082,263 @@ class FrontendGeneric:
             logger.error(msg)
             return False
 
+    def get_aedt_model_stream(
+        self,
+        project_selected,
+        design_selected,
+        output_dir,
+        air_objects=True,
+        obj_list=None,
+        export_as_multiple_objects=False,
+        chunk_size=MODEL_STREAM_CHUNK_SIZE,
+    ):
+        """Download the AEDT model as OBJ files streamed by the backend.
+
+        The files are written to disk while they are received, so the memory used does not
+        depend on the model size.
+
+        Parameters
+        ----------
+        project_selected : str
+            Project name.
+        design_selected : str
+            Design name.
+        output_dir : str
+            Directory where the OBJ files are written.
+        air_objects : bool, optional
+            Define if air and vacuum objects will be exported.
+        obj_list : list, optional
+            List of objects to export. The default is ``None``, in which case
+            every model object except 3D, vacuum, and air objects are exported.
+        export_as_multiple_objects : bool, optional
+           Whether to export the model as multiple objects or not. Default is ``False``
+           in which case the model is exported as single object.
+        chunk_size : int, optional
+            Maximum size of each received chunk in bytes. The default is ``MODEL_STREAM_CHUNK_SIZE``.
+
+        Returns
+        -------
+        dict or bool
+            Object names with their OBJ file path, color and opacity. ``False`` when failed.
+        """
+        if not self.__select_design(project_selected, design_selected):
+            return False
+
+        response = self.session.get(
+            self.url + "/get_aedt_model_stream",
+            json={
+                "air_objects": air_objects,
+                "obj_list": obj_list,
+                "export_as_multiple_objects": export_as_multiple_objects,
+            },
+            stream=True,
+        )
+
+        try:
+            if not response.ok:
+                logger.error(f"Failed backend call: {self.url}")
+                return False
+            model_info = self.read_model_stream(response.iter_content(chunk_size), output_dir)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.error(f"Model download failed: {e}")
+            return False
+        finally:
+            response.close()
+
+        logger.info("Geometry created.")
+        return model_info
+
+    @staticmethod
+    def read_model_stream(chunks, output_dir):
+        """Write the objects of a model stream to OBJ files.
+
+        Parameters
+        ----------
+        chunks : iterable
+            Chunks of the stream: a JSON manifest on the first line, followed by the
+            content of each object in the manifest order.
+        output_dir : str
+            Directory where the OBJ files are written.
+
+        Returns
+        -------
+        dict
+            Object names with their OBJ file path, color and opacity.
+        """
+        chunks = iter(chunks)
+        buffer = b""
+        while b"\n" not in buffer:
+            chunk = next(chunks, None)
+            if chunk is None:
+                raise ValueError("Model stream manifest is incomplete.")
+            buffer += chunk
+        header, buffer = buffer.split(b"\n", 1)
+        manifest = json.loads(header)
+
+        model_info = {}
+        for element in manifest:
+            name = os.path.basename(element["name"])
+            file_path = os.path.join(output_dir, name + ".obj")
+            remaining = element["size"]
+            with open(file_path, "wb") as f:
+                while remaining:
+                    if not buffer:
+                        buffer = next(chunks, b"")
+                        if not buffer:
+                            raise ValueError(f"Model stream ended before the end of {name}.")
+                    size = min(remaining, len(buffer))
+                    f.write(buffer[:size])
+                    buffer = buffer[size:]
+                    remaining -= size
+            model_info[name] = [file_path, element["color"], element["opacity"]]
+        return model_info
+
+    def get_aedt_mesh(
+        self,
+        project_selected,
+        design_selected,
+        air_objects=True,
+        obj_list=None,
+        export_as_multiple_objects=False,
+        triangle_budget=None,
+        decimation_ratio=None,
+        merge_tiny_objects=None,
+        preview_callback=None,
+    ):
+        """Get the AEDT model as PyVista meshes.
+
+        The backend sends the meshes in a binary format. The meshes are built directly on the
+        received buffer, without parsing OBJ files.
+
+        Parameters
+        ----------
+        project_selected : str
+            Project name.
+        design_selected : str
+            Design name.
+        air_objects : bool, optional
+            Define if air and vacuum objects will be exported.
+        obj_list : list, optional
+            List of objects to export. The default is ``None``, in which case
+            every model object except 3D, vacuum, and air objects are exported.
+        export_as_multiple_objects : bool, optional
+           Whether to export the model as multiple objects or not. Default is ``False``
+           in which case the model is exported as single object.
+        triangle_budget : int, optional
+            Maximum number of triangles of the whole model. The default is ``None``, in which case
+            the number of triangles is not limited.
+        decimation_ratio : float or dict, optional
+            Ratio between the number of triangles after and before the decimation, for all the objects
+            or per object name. The default is ``None``, in which case the objects are not decimated.
+        merge_tiny_objects : float, optional
+            Objects smaller than this fraction of the model size are merged by color and opacity.
+            The default is ``None``, in which case no object is merged.
+        preview_callback : callable, optional
+            Function called with a coarse preview of the model, with the same format as the returned
+            value, before the full meshes are received. The default is ``None``, in which case no
+            preview is requested.
+
+        Returns
+        -------
+        dict or bool
+            Object names with their :class:`pyvista.PolyData` mesh, color and opacity. ``False`` when failed.
+        """
+        if not self.__select_design(project_selected, design_selected):
+            return False
+
+        preview_info = {}
+        model_info = {}
+        response = None
+        try:
+            response = self.session.get(
+                self.url + "/get_aedt_mesh",
+                json={
+                    "air_objects": air_objects,
+                    "obj_list": obj_list,
+                    "export_as_multiple_objects": export_as_multiple_objects,
+                    "triangle_budget": triangle_budget,
+                    "decimation_ratio": decimation_ratio,
+                    "merge_tiny_objects": merge_tiny_objects,
+                    "progressive": preview_callback is not None,
+                },
+                stream=preview_callback is not None,
+            )
+            if not response.ok:
+                logger.error(f"Failed backend call: {self.url}")
+                return False
+            if preview_callback is None:
+                meshes = read_mesh_stream(response.content)
+            else:
+                # Meshes are built as soon as they are received
+                meshes = iter_mesh_frames(response.iter_content(MODEL_STREAM_CHUNK_SIZE))
+            for mesh in meshes:
+                if preview_info and not mesh["preview"]:
+                    preview_callback(preview_info)
+                    preview_info = {}
+                polydata = self.polydata_from_buffers(mesh["points"], mesh["offsets"], mesh["connectivity"])
+                info = preview_info if mesh["preview"] else model_info
+                info[mesh["name"]] = [polydata, mesh["color"], mesh["opacity"]]
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.error(f"Mesh download failed: {e}")
+            return False
+        finally:
+            if response is not None:
+                response.close()
+
+        logger.info("Geometry created.")
+        return model_info
+
+    @staticmethod
+    def polydata_from_buffers(points, offsets, connectivity):
+        """Create a PyVista mesh from its arrays without copying them.
+
+        Parameters
+        ----------
+        points : :class:`numpy.ndarray`
+            ``float32`` points of shape ``(n_points, 3)``.
+        offsets : :class:`numpy.ndarray`
+            ``int32`` offsets of each cell in the connectivity, followed by the connectivity size.
+        connectivity : :class:`numpy.ndarray`
+            ``int32`` point indices of the cells.
+
+        Returns
+        -------
+        :class:`pyvista.PolyData`
+            Mesh sharing the memory of the arrays.
+        """
+        import pyvista as pv
+        from vtkmodules.util.numpy_support import numpy_to_vtk
+        from vtkmodules.vtkCommonDataModel import vtkCellArray
+
+        polydata = pv.PolyData()
+        polydata.points = points
+        cells = vtkCellArray()
+        cells.SetData(numpy_to_vtk(offsets, deep=False), numpy_to_vtk(connectivity, deep=False))
+        polydata.SetPolys(cells)
+        return polydata
+
+    def __select_design(self, project_selected, design_selected):
+        """Set the active project and design in the backend."""
+        be_properties = self.get_properties()
+
+        if project_selected == "No Project" or design_selected == "No Design":
+            logger.error("Wrong project or design")
+            return False
+        else:
+            for project in be_properties["project_list"]:
+                if self.get_project_name(project) == project_selected:
+                    be_properties["active_project"] = project
+                    if project_selected in list(be_properties["design_list"].keys()):
+                        designs = be_properties["design_list"][project_selected]
+                        for design in designs:
+                            if design_selected == design:
+                                be_properties["active_design"] = design
+                                break
+                    break
+
+        self.set_properties(be_properties)
+        return True
+
     def get_aedt_data(self):
         """Get a list of AEDT projects.
 
@@ -479,11 +1409,13 @@ class FrontendGeneric:
         with a '.aedt' extension.
 
         Note:
-            This method relies on backend communication to save the project.
+            This method relies on backend communication to save the project. The requests are
+            sent from the backend worker thread.
 
         Returns
         -------
-        None
+        concurrent.futures.Future or None
+            Future of the requests, ``None`` when no file is selected.
         """
         dialog = QtWidgets.QFileDialog()
         dialog.setOption(QtWidgets.QFileDialog.DontUseNativeDialog, True)
@@ -497,42 +1429,80 @@ class FrontendGeneric:
         )
 
         if file_name:
-            response = requests.get(self.url + "/status", timeout=DEFAULT_REQUESTS_TIMEOUT)
-            res_busy = response.ok and response.json() == ToolkitThreadStatus.BUSY.value
-            res_idle = response.ok and response.json() == ToolkitThreadStatus.IDLE.value
-            if res_busy:
-                msg = MSG_TK_RUNNING
+            return self.call_async(self.__save_project, file_name)
+
+    def __save_project(self, file_name):
+        response = self.session.get(self.url + "/status")
+        res_busy = response.ok and response.json() == ToolkitThreadStatus.BUSY.value
+        res_idle = response.ok and response.json() == ToolkitThreadStatus.IDLE.value
+        if res_busy:
+            msg = MSG_TK_RUNNING
+            self.log_and_update_progress(msg, log_level="debug")
+        elif res_idle:
+            response = self.session.post(self.url + "/save_project", json=file_name)
+            if response.ok:
+                msg = "Saving project: {}".format(file_name)
                 self.log_and_update_progress(msg, log_level="debug")
-            elif res_idle:
-                response = requests.post(self.url + "/save_project", json=file_name, timeout=DEFAULT_REQUESTS_TIMEOUT)
-                if response.ok:
-                    msg = "Saving project: {}".format(file_name)
-                    self.log_and_update_progress(msg, log_level="debug")
-                else:
-                    msg = f"Failed backend call: {self.url}"
-                    self.log_and_update_progress(msg, log_level="error", progress=100)
+            else:
+                msg = f"Failed backend call: {self.url}"
+                self.log_and_update_progress(msg, log_level="error", progress=100)
 
     def release_only(self):
-        """Release the AEDT desktop without closing projects."""
-        response = requests.get(self.url + "/status", timeout=DEFAULT_REQUESTS_TIMEOUT)
+        """Release the AEDT desktop without closing projects.
 
-        if response.ok and response.json() == ToolkitThreadStatus.BUSY.value:
-            self.log_and_update_progress(MSG_TK_RUNNING, log_level="debug")
-        else:
-            properties = {"close_projects": False, "close_desktop": False}
-            if self.close():
-                requests.post(self.url + "/close_aedt", json=properties, timeout=DEFAULT_REQUESTS_TIMEOUT)
+        The backend status is requested from the backend worker thread, the window is closed
+        when it is received.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future of the backend status.
+        """
+        return self.call_async(self.__backend_status, callback=lambda status: self.__release(status, False))
 
     def release_and_close(self):
-        """Release and close the AEDT desktop."""
-        response = requests.get(self.url + "/status", timeout=DEFAULT_REQUESTS_TIMEOUT)
+        """Release and close the AEDT desktop.
+
+        The backend status is requested from the backend worker thread, the window is closed
+        when it is received.
 
-        if response.ok and response.json() == ToolkitThreadStatus.BUSY.value:
+        Returns
+        -------
+        concurrent.futures.Future
+            Future of the backend status.
+        """
+        return self.call_async(self.__backend_status, callback=lambda status: self.__release(status, True))
+
+    def __backend_status(self):
+        response = self.session.get(self.url + "/status")
+        return response.json() if response.ok else None
+
+    def __release(self, status, close_desktop):
+        if status == ToolkitThreadStatus.BUSY.value:
             self.log_and_update_progress(MSG_TK_RUNNING, log_level="debug")
-        elif response.ok and response.json() == ToolkitThreadStatus.IDLE.value:
-            properties = {"close_projects": True, "close_desktop": True}
+        elif not close_desktop or status == ToolkitThreadStatus.IDLE.value:
+            self.__close_properties = {"close_projects": close_desktop, "close_desktop": close_desktop}
             if self.close():
-                requests.post(self.url + "/close_aedt", json=properties, timeout=DEFAULT_REQUESTS_TIMEOUT)
+                # Windows whose close event is not handled by this class are released here
+                self.__release_on_close()
+            else:
+                self.__close_properties = {"close_projects": False, "close_desktop": False}
+
+    def __release_on_close(self):
+        if self.__release_future is None:
+            # The interpreter waits for the worker thread before exiting, so AEDT is released
+            self.__release_future = self.call_async(self.__release_on_exit, self.__close_properties)
+            # The session is closed once the release request is finished
+            self.__release_future.add_done_callback(lambda _: self.session.close())
+        return self.__release_future
+
+    def __release_on_exit(self, properties):
+        if not self.check_connection():
+            return
+        if self.__backend_status() == ToolkitThreadStatus.BUSY.value:
+            logger.debug(MSG_TK_RUNNING)
+        else:
+            self.session.post(self.url + "/close_aedt", json=properties)
 
     def on_cancel_clicked(self):
         """Handle cancel button click."""
@@ -545,9 +1515,8 @@ class FrontendGeneric:
         )
         if close == QtWidgets.QMessageBox.Yes:
             logger.info("Closing toolkit")
-            success = self.check_connection()
-            if success:
-                self.release_only()
+            self.stop_event_listener()
+            self.__release_on_close()
             event.accept()
         else:
             event.ignore()
@@ -556,7 +1525,8 @@ class FrontendGeneric:
         """Log a message and update the progress bar.
 
         This method logs the given message at the specified log level, and updates the progress
-        bar to the given progress percentage if provided.
+        bar to the given progress percentage if provided. It can be called from any thread, the
+        user interface is updated in the GUI thread.
 
         Parameters
         ----------
@@ -580,7 +1550,10 @@ class FrontendGeneric:
         log_func(msg)
 
         # UI logging
-        self.ui.update_logger(msg)
+        self.backend_client.run_in_gui_thread(self.__update_ui, msg, progress, log_level)
+
+    def __update_ui(self, msg, progress, log_level):
+        self.ui.update_logger(msg, log_level)
 
         # Update progress bar if needed
         if progress is not None:
@@ -53,6 +53,9 @@ class HomeMenu(object):
         self.design = None
         self.design_combobox = None
 
+        # Design names of the project files, displayed before AEDT is launched
+        self.project_index = {}
+
         welcome_label = self.ui.load_pages.home_page.findChild(QLabel, "label")
         # Add welcome message
         message = general_settings.welcome_message
@@ -118,20 +121,81 @@ class HomeMenu(object):
                 or backend_properties.get("selected_process") != 0
             ):
                 self.update_project()
-                self.update_design()
+            elif backend_properties.get("project_list"):
+                self.preview_projects(backend_properties["project_list"])
+
+    def preview_projects(self, project_list):
+        """Display the projects and designs read from the project files before AEDT is launched.
+
+        The project files are indexed by the backend, the lists are updated when the index is received.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future of the project index.
+        """
+        return self.app.call_async(self.app.get_project_index, project_list, callback=self.set_project_index)
+
+    def set_project_index(self, project_index):
+        """Display the projects and designs of a project index."""
+        self.project_index = {}
+        for index in project_index.values():
+            if index:
+                self.project_index[index["name"]] = [design["name"] for design in index["designs"]]
+        if not self.project_index:
+            return
+        self.project_combobox.blockSignals(True)
+        self.project_combobox.clear()
+        self.project_combobox.addItems(list(self.project_index))
+        self.project_combobox.blockSignals(False)
+        self.update_design()
 
     def update_project(self):
+        """Update the projects opened in AEDT, and then the designs of the selected project.
+
+        The projects are requested from the backend worker thread, the lists are updated when they
+        are received.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future of the project names.
+        """
+        self.project_index = {}
+        return self.app.call_async(self.app.get_aedt_data, callback=self.set_projects)
+
+    def set_projects(self, project_list):
+        """Display the projects, and then update the designs of the selected project."""
         self.project_combobox.blockSignals(True)
-        project_list = self.app.get_aedt_data()
-        self.main_window.home_menu.project_combobox.setEnabled(True)
-        self.main_window.home_menu.project_combobox.clear()
-        self.main_window.home_menu.project_combobox.addItems(project_list)
+        self.project_combobox.setEnabled(True)
+        self.project_combobox.clear()
+        self.project_combobox.addItems(project_list)
         self.project_combobox.blockSignals(False)
-        return project_list
+        self.update_design()
 
     def update_design(self):
-        self.project_combobox.blockSignals(True)
-        design_list = self.app.update_design_names(self.main_window.home_menu.project_combobox.currentText())
-        self.main_window.home_menu.design_combobox.clear()
-        self.main_window.home_menu.design_combobox.addItems(design_list)
-        self.project_combobox.blockSignals(False)
+        """Update the designs of the selected project.
+
+        The designs are requested from the backend worker thread, unless they are in the project index.
+
+        Returns
+        -------
+        concurrent.futures.Future or None
+            Future of the design names, ``None`` when they are in the project index.
+        """
+        project_name = self.project_combobox.currentText()
+        if project_name in self.project_index:
+            self.set_designs(project_name, self.project_index[project_name] or ["No Design"])
+            return None
+        return self.app.call_async(
+            self.app.update_design_names,
+            project_name,
+            callback=lambda design_list: self.set_designs(project_name, design_list),
+        )
+
+    def set_designs(self, project_name, design_list):
+        """Display the designs of a project if it is still selected."""
+        if project_name != self.project_combobox.currentText():
+            return
+        self.design_combobox.clear()
+        self.design_combobox.addItems(design_list)
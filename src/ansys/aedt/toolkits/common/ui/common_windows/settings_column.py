@@ -23,7 +23,6 @@
 # SOFTWARE.
 
 import os
-import time
 
 from PySide6.QtCore import QObject
 from PySide6.QtCore import QThread
@@ -32,6 +31,9 @@ from PySide6.QtCore import Slot
 from PySide6.QtWidgets import QComboBox
 from PySide6.QtWidgets import QFileDialog
 
+LAUNCH_WAIT_TIMEOUT = 60
+"""Seconds waited by each backend request while AEDT is launching."""
+
 
 class AedtLauncherThread(QThread):
     finished = Signal(bool)
@@ -55,18 +57,15 @@ class AedtLauncherThread(QThread):
         """
         self.main_window.set_properties({"state": "AEDT launcher started", "progress": 5})
 
-        self.app.launch_aedt(self.version, self.session, self.non_graphical)
+        self.app.launch_aedt(self.version, self.session, self.non_graphical).result()
 
-        finished = False
+        # The backend answers as soon as the launch job ends
+        while self.main_window.backend_busy() and not self.main_window.wait_thread(timeout=LAUNCH_WAIT_TIMEOUT):
+            pass
 
-        while not finished:
-            if not self.main_window.backend_busy():
-                finished = True
-                properties = self.main_window.get_properties()
-                actual_log = properties["state"]
-                self.log_update.emit(actual_log)
-                self.progress_update.emit(properties["progress"])
-            time.sleep(1)
+        properties = self.main_window.get_properties()
+        self.log_update.emit(properties["state"])
+        self.progress_update.emit(properties["progress"])
 
         self.aedt_launched = True
         self.finished.emit(self.aedt_launched)
@@ -216,27 +215,49 @@ class SettingsMenu(QObject):
             self.aedt_session.clear()
             self.aedt_session.addItem("New Session")
             non_graphical = self.graphical_mode.isChecked()
-            if self.aedt_version.currentText() and self.aedt_version.currentText() != "AEDT not installed":
-                sessions = self.app.find_process_ids(self.aedt_version.currentText(), non_graphical)
-                for pid in sessions:
-                    if sessions[pid] == -1:
-                        self.aedt_session.addItem("Process {}".format(pid))
-                    else:
-                        self.aedt_session.addItem("Grpc on port {}".format(sessions[pid]))
+            version = self.aedt_version.currentText()
+            if version and version != "AEDT not installed":
+                self.app.call_async(
+                    self.app.find_process_ids,
+                    version,
+                    non_graphical,
+                    callback=lambda sessions: self.add_process_ids(version, sessions),
+                )
+
+    def add_process_ids(self, version, sessions):
+        # Sessions of a version that is no longer selected are discarded
+        if not sessions or version != self.aedt_version.currentText():
+            return
+        for pid in sessions:
+            if sessions[pid] == -1:
+                self.aedt_session.addItem("Process {}".format(pid))
+            else:
+                self.aedt_session.addItem("Grpc on port {}".format(sessions[pid]))
 
     def update_process_id(self):
-        success = self.app.check_connection()
-        if not success:
+        version = self.aedt_version.currentText()
+        non_graphical = self.graphical_mode.isChecked()
+        version_installed = bool(version) and version != "AEDT not installed"
+
+        def find_sessions():
+            if not self.app.check_connection():
+                return None
+            if version_installed:
+                return self.app.find_process_ids(version, non_graphical) or {}
+            return {}
+
+        self.app.call_async(find_sessions, callback=lambda sessions: self.show_process_ids(sessions, version_installed))
+
+    def show_process_ids(self, sessions, update_items=True):
+        if sessions is None:
             msg = "Error getting properties from backend. User interface running without backend"
             self.ui.update_logger(msg)
             return
-        non_graphical = self.graphical_mode.isChecked()
         item_count = self.aedt_session.count()
 
         # Retrieve all items as a list
         aedt_sessions_items = [self.aedt_session.itemText(i) for i in range(item_count)]
-        if self.aedt_version.currentText() and self.aedt_version.currentText() != "AEDT not installed":
-            sessions = self.app.find_process_ids(self.aedt_version.currentText(), non_graphical)
+        if update_items:
             for session in aedt_sessions_items:
                 try:
                     session_id = int(session.split(" ")[-1])
@@ -272,6 +293,10 @@ class SettingsMenu(QObject):
         non_graphical = self.graphical_mode.isChecked()
         self.aedt_thread = AedtLauncherThread(self.main_window, selected_version, selected_session, non_graphical)
 
+        # The listener is started from the GUI thread, it forwards the backend progress while AEDT is launching
+        listener = self.main_window.start_event_listener()
+        listener.progress_changed.connect(self.aedt_thread.progress_update)
+
         self.aedt_thread.start()
 
         self.aedt_thread.log_update.connect(self.ui.update_logger)
@@ -286,13 +311,14 @@ class SettingsMenu(QObject):
     @Slot(bool)
     def handle_aedt_thread_finished(self, aedt_launched):
         # This method will be called when the thread finishes
+        self.main_window.event_listener.progress_changed.disconnect(self.aedt_thread.progress_update)
         if aedt_launched:
             file = self.file.text()
             if file:
                 aedt_file = os.path.normpath(file)
                 self.app.open_project(aedt_file)
+            # Calls run in order, the projects are read once the project is opened
             self.app.home_menu.update_project()
-            self.app.home_menu.update_design()
             if self.ui.is_right_column_visible():
                 self.ui.toggle_right_column()
             if self.main_window.properties.block_settings_after_load:
@@ -316,6 +342,7 @@ class SettingsMenu(QObject):
         )
         if file != "":
             self.file.setText(file)
+            self.app.home_menu.preview_projects([file])
 
     def hide_widgets(self):
         self.aedt_session.setVisible(False)
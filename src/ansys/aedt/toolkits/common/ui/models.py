@@ -44,6 +44,9 @@ class UIProperties(BaseModel):
     toolkit_name: str = "common"
     backend_url: str = "127.0.0.1"
     backend_port: int = 5001
+    in_process_backend: bool = False
+    use_unix_socket: bool = False
+    backend_unix_socket: str = ""
     debug: bool = True
     log_file: str = "common_frontend.log"
     app_name: str = "toolkit Wizard"
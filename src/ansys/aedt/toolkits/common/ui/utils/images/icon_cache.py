@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Cache of the recolored icons painted by the custom widgets.
+
+The widgets paint their icons in ``paintEvent``, which runs on every hover and click. Loading, scaling,
+and recoloring the icon files is done once per path, size, color, and device pixel ratio, and the result
+is kept in ``QPixmapCache``, so a repaint does not read any file.
+"""
+
+from PySide6.QtCore import QPointF
+from PySide6.QtCore import QSize
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QColor
+from PySide6.QtGui import QPainter
+from PySide6.QtGui import QPixmap
+from PySide6.QtGui import QPixmapCache
+
+ICON_CACHE_PREFIX = "pyaedt_toolkits_icon"
+"""Prefix of the icon keys in ``QPixmapCache``."""
+
+
+def _icon_key(image, color, size, device_pixel_ratio):
+    width, height = size if size else (0, 0)
+    return "{}|{}|{}x{}|{}|{}".format(ICON_CACHE_PREFIX, image, width, height, color, device_pixel_ratio)
+
+
+def colored_icon(image, color, size=None, device_pixel_ratio=1.0):
+    """
+    Get an icon filled with a color.
+
+    Parameters
+    ----------
+    image : str
+        Path to the icon image.
+    color : str or QColor
+        Color of the icon.
+    size : tuple, optional
+        Width and height the icon is scaled to, keeping its aspect ratio. The default is ``None``,
+        in which case the icon keeps its size.
+    device_pixel_ratio : float, optional
+        Device pixel ratio of the widget the icon is painted on. The default is ``1.0``.
+
+    Returns
+    -------
+    QPixmap
+        Recolored icon, shared by all the widgets.
+    """
+    color = QColor(color).name(QColor.HexArgb)
+    key = _icon_key(image, color, size, device_pixel_ratio)
+    icon = QPixmapCache.find(key)
+    if icon is not None:
+        return icon
+
+    icon = QPixmap(image)
+    if not icon.isNull() and (size or device_pixel_ratio != 1):
+        logical_size = icon.size().scaled(QSize(*size), Qt.KeepAspectRatio) if size else icon.size()
+        icon = icon.scaled(logical_size * device_pixel_ratio, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        icon.setDevicePixelRatio(device_pixel_ratio)
+    if not icon.isNull():
+        painter = QPainter(icon)
+        painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
+        painter.fillRect(icon.rect(), QColor(color))
+        painter.end()
+    QPixmapCache.insert(key, icon)
+    return icon
+
+
+def draw_icon_centered(qp, icon, rect):
+    """
+    Draw an icon in the center of a rectangle.
+
+    Parameters
+    ----------
+    qp : QPainter
+        QPainter object.
+    icon : QPixmap
+        Icon to draw.
+    rect : QRect
+        Rectangle to paint the icon within.
+    """
+    size = icon.deviceIndependentSize()
+    qp.drawPixmap(QPointF((rect.width() - size.width()) / 2, (rect.height() - size.height()) / 2), icon)
@@ -23,12 +23,12 @@
 # SOFTWARE.
 
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QPainter
-from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import QLabel
 from PySide6.QtWidgets import QVBoxLayout
 from PySide6.QtWidgets import QWidget
 
+from ansys.aedt.toolkits.common.ui.utils.images.icon_cache import colored_icon
+
 
 class PyIcon(QWidget):
     """
@@ -101,11 +101,6 @@ class PyIcon(QWidget):
         """
         color = icon_color if icon_color else self._icon_color
 
-        icon = QPixmap(icon_path)
-        icon = icon.scaled(30, 30, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        painter = QPainter(icon)
-        painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
-        painter.fillRect(icon.rect(), color)
-        painter.end()
+        icon = colored_icon(icon_path, color, (30, 30), self.devicePixelRatioF())
 
         self.icon.setPixmap(icon)
@@ -22,19 +22,18 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-import os
-
 from PySide6.QtCore import QEvent
 from PySide6.QtCore import QPoint
 from PySide6.QtCore import QRect
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QColor
 from PySide6.QtGui import QPainter
-from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import QGraphicsDropShadowEffect
 from PySide6.QtWidgets import QLabel
 from PySide6.QtWidgets import QPushButton
 
+from ansys.aedt.toolkits.common.ui.utils.images.icon_cache import colored_icon
+from ansys.aedt.toolkits.common.ui.utils.images.icon_cache import draw_icon_centered
 from ansys.aedt.toolkits.common.ui.utils.images.load_images import LoadImages
 
 
@@ -118,11 +117,8 @@ class PyLeftMenuButton(QPushButton):
             p.setBrush(QColor(self._bg_one))
             p.drawRoundedRect(rect_inside_active, 8, 8)
 
-            icon_path = self._icon_active_menu
-            app_path = os.path.abspath(os.getcwd())
-            icon_path = os.path.normpath(os.path.join(app_path, icon_path))
             self._set_icon_color = self._icon_color_active
-            self.icon_active(p, icon_path, self.width())
+            self.icon_active(p, self._icon_active_menu, self.width())
 
             p.setPen(QColor(self._set_text_active))
             p.drawText(rect_text, Qt.AlignVCenter, self.text())
@@ -137,11 +133,8 @@ class PyLeftMenuButton(QPushButton):
             p.setBrush(QColor(self._bg_one))
             p.drawRoundedRect(rect_inside_active, 8, 8)
 
-            icon_path = self._icon_active_menu
-            app_path = os.path.abspath(os.getcwd())
-            icon_path = os.path.normpath(os.path.join(app_path, icon_path))
             self._set_icon_color = self._icon_color_active
-            self.icon_active(p, icon_path, self.width())
+            self.icon_active(p, self._icon_active_menu, self.width())
 
             p.setPen(QColor(self._set_text_active))
             p.drawText(rect_text, Qt.AlignVCenter, self.text())
@@ -208,22 +201,13 @@ class PyLeftMenuButton(QPushButton):
         self.repaint()
 
     def icon_paint(self, qp, image, rect, color):
-        icon = QPixmap(image)
         # if icons are not 30x30, they will be scaled
-        icon = icon.scaled(30, 30, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        painter = QPainter(icon)
-        painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
-        painter.fillRect(icon.rect(), color)
-        qp.drawPixmap((rect.width() - icon.width()) / 2, (rect.height() - icon.height()) / 2, icon)
-        painter.end()
+        icon = colored_icon(image, color, (30, 30), self.devicePixelRatioF())
+        draw_icon_centered(qp, icon, rect)
 
     def icon_active(self, qp, image, width):
-        icon = QPixmap(image)
-        painter = QPainter(icon)
-        painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
-        painter.fillRect(icon.rect(), self._bg_one)
+        icon = colored_icon(image, self._bg_one, device_pixel_ratio=self.devicePixelRatioF())
         qp.drawPixmap(width - 5, 0, icon)
-        painter.end()
 
     def change_style(self, event):
         if event == QEvent.Enter:
@@ -22,16 +22,23 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from collections import deque
+import logging
+
+from PySide6.QtCore import QTimer
 from PySide6.QtGui import QFont
-from PySide6.QtGui import QTextCursor
-from PySide6.QtWidgets import QTextEdit
+from PySide6.QtWidgets import QPlainTextEdit
 
 
-class PyLogger(QTextEdit):
+class PyLogger(QPlainTextEdit):
     """
     Logger widget.
 
-    Inherits QTextEdit and provides a simple interface for logging strings.
+    Inherits QPlainTextEdit and provides a simple interface for logging strings.
+
+    Messages are kept in a ring buffer of ``max_lines`` entries, which is the model used for level filtering
+    and search. They are rendered by a timer, so a burst of messages is appended in one layout pass, and the
+    document never holds more than ``max_lines`` lines.
 
     Parameters
     ----------
@@ -45,10 +52,21 @@ class PyLogger(QTextEdit):
         Font size. The default is ``"Segoe UI``".
     height: float or int
         Logger height. The default is ``10``.
+    max_lines: int, optional
+        Maximum number of messages kept. The default is ``5000``.
+    flush_interval: int, optional
+        Time in milliseconds the messages are buffered before they are rendered. The default is ``50``.
     """
 
     def __init__(
-        self, text_color="#f5f6f9", background_color="#000000", font_size=10, font_family="Segoe UI", height=50
+        self,
+        text_color="#f5f6f9",
+        background_color="#000000",
+        font_size=10,
+        font_family="Segoe UI",
+        height=50,
+        max_lines=5000,
+        flush_interval=50,
     ):
         super().__init__()
         self.setReadOnly(True)
@@ -56,18 +74,121 @@ class PyLogger(QTextEdit):
         self.setFont(font)
         self.setStyleSheet(f"background-color: {background_color}; color: {text_color}")
         self.setFixedHeight(height)
+        self.setMaximumBlockCount(max_lines)
         self._font_size = font_size
         self._font_family = font_family
+        self._history = deque(maxlen=max_lines)
+        self._pending = []
+        self._level = logging.NOTSET
+        self._filter_text = ""
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(flush_interval)
+        self._flush_timer.timeout.connect(self.flush)
+
+    @property
+    def history(self):
+        """Messages kept by the logger, as tuples of level and message."""
+        return list(self._history)
 
-    def log(self, message):
+    def log(self, message, level=logging.INFO):
         """
         Logs a message to the widget.
 
         Parameters:
             message: The string message to log.
+            level: Level of the message, as a ``logging`` level or level name. The default is ``logging.INFO``.
+        """
+        level = self._level_number(level)
+        self._history.append((level, message))
+        if self._is_visible(level, message):
+            self._pending.append(message)
+            if not self._flush_timer.isActive():
+                self._flush_timer.start()
+
+    def flush(self):
+        """Render the buffered messages in one layout pass."""
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+        # Only the last messages fit in the document
+        messages = self._pending[-self.maximumBlockCount() :]
+        self._pending = []
+        self.appendPlainText("\n".join(messages))
+        self._scroll_to_end()
+
+    def set_level(self, level):
         """
-        self.append(message)
+        Show only the messages of a level or higher.
+
+        Parameters
+        ----------
+        level : int or str
+            Minimum level, as a ``logging`` level or level name.
+        """
+        self._level = self._level_number(level)
+        self._render()
+
+    def set_filter(self, text):
+        """
+        Show only the messages containing a text.
+
+        Parameters
+        ----------
+        text : str
+            Text to search, not case-sensitive. An empty string shows all messages.
+        """
+        self._filter_text = text.lower()
+        self._render()
+
+    def search(self, text, level=logging.NOTSET):
+        """
+        Search the messages kept by the logger.
+
+        Parameters
+        ----------
+        text : str
+            Text to search, not case-sensitive.
+        level : int or str, optional
+            Minimum level of the messages. The default is ``logging.NOTSET``.
+
+        Returns
+        -------
+        list
+            Messages containing the text, from the oldest to the newest.
+        """
+        text = text.lower()
+        level = self._level_number(level)
+        return [
+            message for message_level, message in self._history if message_level >= level and text in message.lower()
+        ]
+
+    def clear(self):
+        """Clear the messages."""
+        self._history.clear()
+        self._pending = []
+        self._flush_timer.stop()
+        super().clear()
+
+    def _is_visible(self, level, message):
+        return level >= self._level and (not self._filter_text or self._filter_text in message.lower())
+
+    def _render(self):
+        """Render the messages of the ring buffer that pass the level and text filters."""
+        self._flush_timer.stop()
+        self._pending = []
+        self.setPlainText("\n".join(message for level, message in self._history if self._is_visible(level, message)))
+        self._scroll_to_end()
+
+    def _scroll_to_end(self):
+        scroll_bar = self.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
 
-        cursor = self.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        self.setTextCursor(cursor)
+    @staticmethod
+    def _level_number(level):
+        if isinstance(level, str):
+            number = logging.getLevelName(level.upper())
+            if not isinstance(number, int):
+                raise ValueError(f"Unknown logging level {level}.")
+            return number
+        return level
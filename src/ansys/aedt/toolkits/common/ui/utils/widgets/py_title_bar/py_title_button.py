@@ -29,11 +29,13 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QBrush
 from PySide6.QtGui import QColor
 from PySide6.QtGui import QPainter
-from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import QGraphicsDropShadowEffect
 from PySide6.QtWidgets import QLabel
 from PySide6.QtWidgets import QPushButton
 
+from ansys.aedt.toolkits.common.ui.utils.images.icon_cache import colored_icon
+from ansys.aedt.toolkits.common.ui.utils.images.icon_cache import draw_icon_centered
+
 
 class PyTitleButton(QPushButton):
     """
@@ -309,15 +311,9 @@ class PyTitleButton(QPushButton):
         rect : QRect
             Rectangle representing the button's area.
         """
-        icon = QPixmap(image)
-        painter = QPainter(icon)
-        painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
-        if self._is_active:
-            painter.fillRect(icon.rect(), self._icon_color_active)
-        else:
-            painter.fillRect(icon.rect(), self._set_icon_color)
-        qp.drawPixmap((rect.width() - icon.width()) / 2, (rect.height() - icon.height()) / 2, icon)
-        painter.end()
+        color = self._icon_color_active if self._is_active else self._set_icon_color
+        icon = colored_icon(image, color, device_pixel_ratio=self.devicePixelRatioF())
+        draw_icon_centered(qp, icon, rect)
 
     def set_icon(self, icon_path):
         """
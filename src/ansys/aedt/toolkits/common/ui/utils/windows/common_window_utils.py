@@ -657,9 +657,9 @@ class CommonWindowUtils(object):
         """Clear all layout."""
         self.progress.progress = progress_value
 
-    def update_logger(self, text):
-        """Clear all layout."""
-        self.logger.log(text)
+    def update_logger(self, text, level="info"):
+        """Log a message in the logger widget."""
+        self.logger.log(text, level)
 
     @staticmethod
     def item_index(layout, item):
@@ -25,11 +25,14 @@
 """Utils module"""
 
 from enum import Enum
+import getpass
 import os
 import secrets
 import socket
+import stat
 import subprocess  # nosec
 import sys
+import tempfile
 import threading
 import time
 
@@ -139,18 +142,80 @@ def clean_python_processes(url, port):  # pragma: no cover
                 print(f"Process {process.pid} on {ip_tmp}:{port_tmp} was already killed")
 
 
-def check_backend_communication(url_call):  # pragma: no cover
-    """Check backend communication."""
+def get_runtime_dir():
+    """Get the per-user directory of the runtime files, such as the backend Unix domain sockets.
+
+    The directory is ``pyaedt-toolkits`` in ``XDG_RUNTIME_DIR`` when it is defined, or a directory
+    named after the user in the temporary directory otherwise. Only the user can access it.
+
+    Returns
+    -------
+    str
+        Path of the directory.
+    """
+    base_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if base_dir and os.path.isdir(base_dir):
+        runtime_dir = os.path.join(base_dir, "pyaedt-toolkits")
+    else:
+        runtime_dir = os.path.join(tempfile.gettempdir(), "pyaedt-toolkits-{}".format(getpass.getuser()))
+    os.makedirs(runtime_dir, mode=0o700, exist_ok=True)
+    if hasattr(os, "getuid"):
+        # On shared nodes, a directory created by another user must not be used
+        dir_stat = os.stat(runtime_dir)
+        if dir_stat.st_uid != os.getuid() or dir_stat.st_mode & 0o077:
+            raise PermissionError("Runtime directory {} is accessible by other users.".format(runtime_dir))
+    return runtime_dir
+
+
+def unix_socket_path(name):
+    """Get the path of a Unix domain socket in the per-user runtime directory.
+
+    Parameters
+    ----------
+    name : str
+        Name of the socket, for instance the toolkit name and the process ID.
+
+    Returns
+    -------
+    str
+        Path of the socket.
+    """
+    return os.path.join(get_runtime_dir(), "{}.sock".format(name))
+
+
+def remove_unix_socket(path):
+    """Remove the Unix domain socket file of a backend.
+
+    Parameters
+    ----------
+    path : str
+        Path of the socket. Nothing is removed if the path is not a socket.
+    """
+    try:
+        if stat.S_ISSOCK(os.stat(path).st_mode):
+            os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def check_backend_communication(url_call, session=None):  # pragma: no cover
+    """Check backend communication.
+
+    The request is sent with ``session`` when given, for instance to reach a backend listening on a Unix domain socket.
+    """
     try:
-        response = requests.get(url_call + "/health", timeout=DEFAULT_REQUESTS_TIMEOUT)
+        response = (session or requests).get(url_call + "/health", timeout=DEFAULT_REQUESTS_TIMEOUT)
         return response.ok
     except requests.exceptions.RequestException:
         print("Failed to check backend communication.")
         return False
 
 
-def process_desktop_properties(is_linux, url_call):  # pragma: no cover
-    """Process desktop properties."""
+def process_desktop_properties(is_linux, url_call, session=None):  # pragma: no cover
+    """Process desktop properties.
+
+    The requests are sent with ``session`` when given, for instance to reach a backend running in the same process.
+    """
     desktop_pid = None
     desktop_version = None
     grpc = True
@@ -175,12 +240,13 @@ def process_desktop_properties(is_linux, url_call):  # pragma: no cover
             "non_graphical": False,
         }
         try:
-            response = requests.put(url_call + "/properties", json=new_properties, timeout=DEFAULT_REQUESTS_TIMEOUT)
+            client = session or requests
+            response = client.put(url_call + "/properties", json=new_properties, timeout=DEFAULT_REQUESTS_TIMEOUT)
             if not response.ok:
                 return
             print("Connect to AEDT session.")
-            requests.post(url_call + "/launch_aedt", timeout=DEFAULT_REQUESTS_TIMEOUT)
-            requests.post(url_call + "/wait_thread", timeout=DEFAULT_REQUESTS_TIMEOUT)
+            client.post(url_call + "/launch_aedt", timeout=DEFAULT_REQUESTS_TIMEOUT)
+            client.post(url_call + "/wait_thread", timeout=DEFAULT_REQUESTS_TIMEOUT)
         except requests.exceptions.RequestException:
             raise Exception("Properties update failed.")
 
@@ -194,6 +260,16 @@ class ToolkitThreadStatus(str, Enum):
     UNKNOWN = "Toolkit status is unknown."
 
 
+class ToolkitJobState(str, Enum):
+    """Provides an enumeration of states for a toolkit job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    FINISHED = "finished"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
 class PropertiesUpdate(str, Enum):
     """Provides an enumeration of statuses for updating properties."""
 
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import time
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from ansys.aedt.toolkits.common.backend.api import AEDTCommon
+from ansys.aedt.toolkits.common.backend.models import Properties
+
+pytestmark = [pytest.mark.common_api]
+
+GRPC_PORT = 50051
+
+
+def desktop_mock(**kwargs):
+    desktop = MagicMock()
+    desktop.port = GRPC_PORT
+    desktop.aedt_process_id = os.getpid()
+    return desktop
+
+
+@pytest.fixture
+def toolkit():
+    properties = Properties(selected_process=GRPC_PORT, keep_aedt_session=True, aedt_session_idle_timeout=0.2)
+    with patch("ansys.aedt.core.Desktop", side_effect=desktop_mock) as desktop_class:
+        toolkit = AEDTCommon(properties)
+        toolkit.desktop_class = desktop_class
+        yield toolkit
+        toolkit.release_aedt(force=True)
+
+
+def test_keep_session(toolkit):
+    assert toolkit.connect_aedt()
+    desktop = toolkit.desktop
+    assert toolkit.release_aedt(False, False)
+    assert toolkit.desktop is desktop
+    desktop.release_desktop.assert_not_called()
+
+    # The kept session is reused without connecting again
+    assert toolkit.connect_aedt()
+    assert toolkit.desktop_class.call_count == 1
+    metrics = toolkit.get_session_metrics()
+    assert metrics["connections"] == 1
+    assert metrics["reused_connections"] == 1
+    assert metrics["time_saved"] >= 0
+
+    # The session is released once idle
+    toolkit.release_aedt(False, False)
+    time.sleep(0.5)
+    desktop.release_desktop.assert_called_once_with(False, False)
+    assert toolkit.desktop is None
+    assert toolkit.get_session_metrics()["idle_releases"] == 1
+
+
+def test_keep_session_reconnect(toolkit):
+    assert toolkit.connect_aedt()
+    toolkit.release_aedt(False, False)
+
+    # A connection in progress cancels the idle release
+    toolkit.connect_aedt()
+    time.sleep(0.5)
+    assert toolkit.desktop is not None
+
+    # The session is dropped when its process is not running anymore
+    toolkit.desktop.aedt_process_id = 2**22 + 1
+    assert toolkit.connect_aedt()
+    assert toolkit.desktop_class.call_count == 2
+    assert toolkit.desktop.aedt_process_id == os.getpid()
+
+
+def test_release_without_keep_session(toolkit):
+    toolkit.properties.keep_aedt_session = False
+    assert toolkit.connect_aedt()
+    desktop = toolkit.desktop
+    assert toolkit.release_aedt(False, False)
+    desktop.release_desktop.assert_called_once_with(False, False)
+    assert toolkit.desktop is None
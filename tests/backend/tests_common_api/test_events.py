@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+
+import pytest
+
+from ansys.aedt.toolkits.common.backend.events import EventBroker
+from ansys.aedt.toolkits.common.backend.events import event_broker
+from ansys.aedt.toolkits.common.backend.events import format_sse
+from ansys.aedt.toolkits.common.backend.models import Properties
+from ansys.aedt.toolkits.common.backend.thread_manager import ThreadManager
+from ansys.aedt.toolkits.common.utils import ToolkitJobState
+
+pytestmark = [pytest.mark.common_api]
+
+
+def next_event(subscription, name):
+    while True:
+        event = subscription.get(timeout=5)
+        assert event is not None
+        if event[0] == name:
+            return event[1]
+
+
+def test_broker_publish():
+    broker = EventBroker()
+    broker.publish("state", "nobody listening")
+    subscription = broker.subscribe(max_pending_events=2)
+    assert broker.subscribers == 1
+    for progress in range(3):
+        broker.publish("progress", progress)
+    # Slow subscribers lose the oldest events
+    assert subscription.get(timeout=0) == ("progress", 1)
+    assert subscription.get(timeout=0) == ("progress", 2)
+    assert subscription.get(timeout=0) is None
+    broker.unsubscribe(subscription)
+    assert broker.subscribers == 0
+    assert subscription.closed
+
+
+def test_format_sse():
+    assert format_sse("progress", 50) == "event: progress\ndata: 50\n\n"
+
+
+def test_properties_events():
+    properties = Properties()
+    subscription = event_broker.subscribe()
+    try:
+        properties.progress = 50
+        properties.state = "Running"
+        properties.state = "Running"
+        properties.is_toolkit_busy = True
+        properties.active_design = "not published"
+        assert subscription.get(timeout=0) == ("progress", 50)
+        assert subscription.get(timeout=0) == ("state", "Running")
+        assert subscription.get(timeout=0) == ("busy", True)
+        assert subscription.get(timeout=0) is None
+    finally:
+        event_broker.unsubscribe(subscription)
+
+
+def test_job_events():
+    thread_manager = ThreadManager(Properties())
+    subscription = event_broker.subscribe()
+    try:
+        job_id = thread_manager.launch_thread(lambda: 42)
+        job = next_event(subscription, "job")
+        assert job["job_id"] == job_id
+        assert job["state"] == ToolkitJobState.FINISHED.value
+        assert job["result"] == 42
+        assert next_event(subscription, "busy") is False
+    finally:
+        event_broker.unsubscribe(subscription)
+
+
+def test_events_stream():
+    from ansys.aedt.toolkits.common.backend.rest_api import app
+    from ansys.aedt.toolkits.common.backend.rest_api import toolkit_api
+
+    response = app.test_client().get("/events", buffered=False)
+    assert response.status_code == 200
+    assert response.mimetype == "text/event-stream"
+    stream = iter(response.response)
+    try:
+        # Current values are sent first
+        events = [next(stream) for _ in range(3)]
+        assert events[0].startswith(b"event: state\n")
+        assert events[1].startswith(b"event: progress\n")
+        assert events[2].startswith(b"event: busy\n")
+
+        toolkit_api.properties.progress = toolkit_api.properties.progress + 1
+        message = next(stream).decode()
+        assert message.startswith("event: progress\n")
+        assert json.loads(message.split("data: ")[1]) == toolkit_api.properties.progress
+    finally:
+        response.close()
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import getpass
+import os
+import shutil
+import tempfile
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from ansys.aedt.toolkits.common.backend.api import AEDTCommon
+from ansys.aedt.toolkits.common.backend.api import LOD_EXPORT_PREFIX
+from ansys.aedt.toolkits.common.backend.export_cache import ExportCache
+from ansys.aedt.toolkits.common.backend.export_cache import STAGING_SUFFIX
+from ansys.aedt.toolkits.common.backend.export_cache import default_export_cache_dir
+from ansys.aedt.toolkits.common.backend.models import Properties
+from ansys.aedt.toolkits.common.mesh import write_obj
+
+pytestmark = [pytest.mark.common_api]
+
+
+def write_files(directory, sizes):
+    files = []
+    for index, size in enumerate(sizes):
+        file_path = os.path.join(str(directory), "object_{}.obj".format(index))
+        with open(file_path, "wb") as f:
+            f.write(b"v" * size)
+        files.append([file_path, [index, 0, 0], 0.5])
+    return files
+
+
+def test_cache_lru(tmp_path):
+    cache = ExportCache(str(tmp_path / "cache"), max_size=250)
+    project = str(tmp_path / "project.aedt")
+
+    first = cache.put("first", project, write_files(tmp_path, [100]))
+    second = cache.put("second", project, write_files(tmp_path, [100]))
+    assert os.path.dirname(first[0][0]) == str(tmp_path / "cache" / "first")
+    assert cache.get("first") == first
+    assert cache.get("missing") is None
+
+    # The least recently used entry is evicted
+    cache.put("third", project, write_files(tmp_path, [100]))
+    assert cache.get("second") is None
+    assert not os.path.exists(second[0][0])
+    assert len(cache) == 2
+    assert cache.size == 200
+    assert cache.hits == 1
+
+    # Entries survive a restart
+    reloaded = ExportCache(str(tmp_path / "cache"), max_size=250)
+    assert reloaded.get("first") == first
+
+    assert reloaded.invalidate(str(tmp_path / "other.aedt")) == 0
+    assert reloaded.invalidate(project) == 2
+    assert reloaded.get("first") is None
+
+
+def test_cache_pins_and_shared_directory(tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache = ExportCache(str(cache_dir), max_size=150)
+    project = str(tmp_path / "project.aedt")
+    assert getpass.getuser() in os.path.basename(default_export_cache_dir())
+
+    first = cache.put("first", project, write_files(tmp_path, [100]))
+    with cache.pinned(first):
+        # Pinned entries are neither evicted nor removed from the disk
+        second = cache.put("second", project, write_files(tmp_path, [100]))
+        assert cache.get("first") == first
+        assert cache.invalidate(project) == 2
+        assert os.path.isfile(first[0][0])
+        assert not os.path.exists(second[0][0])
+        assert cache.put("first", project, write_files(tmp_path, [100]))[0][0] != first[0][0]
+    assert not os.path.exists(first[0][0])
+
+    # The same export added twice keeps the first entry
+    first = cache.put("first", project, write_files(tmp_path, [100]))
+    assert cache.put("first", project, write_files(tmp_path, [100])) == first
+    assert [name for name in os.listdir(cache_dir) if name.endswith(STAGING_SUFFIX)] == []
+
+    # Entries being written by another backend and unreadable entries are left on the disk
+    (cache_dir / ("third.1234" + STAGING_SUFFIX)).mkdir()
+    (cache_dir / "fourth").mkdir()
+    reloaded = ExportCache(str(cache_dir), max_size=10)
+    assert reloaded.get("first") == first
+    assert sorted(os.listdir(cache_dir)) == ["first", "fourth", "third.1234" + STAGING_SUFFIX]
+
+
+def test_cache_key(tmp_path):
+    project = tmp_path / "project.aedt"
+    assert ExportCache.change_token(str(project)) is None
+    project.write_text("$begin")
+    token = ExportCache.change_token(str(project))
+    assert token
+
+    key = ExportCache.make_key(str(project), "HFSS", token, air_objects=True, obj_list=None)
+    assert key == ExportCache.make_key(str(project), "HFSS", token, obj_list=None, air_objects=True)
+    assert key != ExportCache.make_key(str(project), "HFSS", token, obj_list=None, air_objects=False)
+    assert key != ExportCache.make_key(str(project), "Maxwell", token, obj_list=None, air_objects=True)
+
+    project.write_text("$begin 'AnsoftProject'")
+    assert ExportCache.change_token(str(project)) != token
+
+
+def test_export_aedt_model_cache_hit(tmp_path):
+    project = tmp_path / "project.aedt"
+    project.write_text("$begin")
+    properties = Properties(active_project=str(project), active_design="HFSS")
+    toolkit_api = AEDTCommon(properties)
+    toolkit_api.export_cache = ExportCache(str(tmp_path / "cache"))
+    toolkit_api.aedtapp = MagicMock()
+    toolkit_api.aedtapp.post.export_model_obj.return_value = write_files(tmp_path, [10, 20])
+
+    with patch.object(toolkit_api, "release_aedt"):
+        files = toolkit_api.export_aedt_model(encode=False)
+        assert toolkit_api.aedtapp.post.export_model_obj.call_count == 1
+
+        # The second export does not touch AEDT
+        toolkit_api.aedtapp = None
+        assert toolkit_api.export_aedt_model(encode=False) == files
+        model_info = toolkit_api.export_aedt_model()
+        assert list(model_info) == ["object_0", "object_1"]
+
+        toolkit_api.invalidate_export_cache()
+        with patch.object(toolkit_api, "connect_design") as connect_design:
+            assert toolkit_api.export_aedt_model(encode=False) == []
+            connect_design.assert_called_once()
+
+
+def test_lod_export_directories(tmp_path):
+    files = []
+    for index in range(2):
+        file_path = str(tmp_path / "object_{}.obj".format(index))
+        write_obj(file_path, [[0, 0, index], [1, 0, index], [0, 1, index]], [0, 3], [0, 1, 2])
+        files.append([file_path, [index, 0, 0], 0.5])
+    toolkit_api = AEDTCommon(Properties())
+    toolkit_api.aedtapp = MagicMock()
+    toolkit_api.aedtapp.post.export_model_obj.return_value = files
+
+    def lod_export_dirs():
+        return {name for name in os.listdir(tempfile.gettempdir()) if name.startswith(LOD_EXPORT_PREFIX)}
+
+    existing_dirs = lod_export_dirs()
+    with patch.object(toolkit_api, "release_aedt"):
+        first = toolkit_api.export_aedt_model(encode=False, merge_tiny_objects=0.5)
+        second = toolkit_api.export_aedt_model(encode=False, merge_tiny_objects=0.5)
+        # Each export has its own directory, so the files returned by the first export are kept
+        assert os.path.dirname(first[0][0]) != os.path.dirname(second[0][0])
+        assert all(os.path.isfile(element[0]) for element in first + second)
+
+        # The directory of encoded exports is removed once the objects are encoded
+        model_info = toolkit_api.export_aedt_model(merge_tiny_objects=0.5)
+        assert model_info
+        assert lod_export_dirs() - existing_dirs == {
+            os.path.basename(os.path.dirname(element[0])) for element in first + second
+        }
+    for element in first + second:
+        shutil.rmtree(os.path.dirname(element[0]), ignore_errors=True)
+
+
+def test_launch_thread_invalidates_active_project(tmp_path):
+    project = tmp_path / "project.aedt"
+    other_project = tmp_path / "other.aedt"
+    properties = Properties(active_project=str(project))
+    toolkit_api = AEDTCommon(properties)
+    toolkit_api.export_cache = ExportCache(str(tmp_path / "cache"))
+
+    def export_aedt_model():
+        return True
+
+    def create_geometry():
+        return True
+
+    for key, project_path in [("project", project), ("other", other_project)]:
+        toolkit_api.export_cache.put(key, str(project_path), write_files(tmp_path, [10]))
+
+    # Read-only jobs keep the cache
+    assert toolkit_api.wait_job(toolkit_api.launch_thread(export_aedt_model), timeout=10)
+    assert len(toolkit_api.export_cache) == 2
+
+    # Other jobs only invalidate the exports of the active project
+    assert toolkit_api.wait_job(toolkit_api.launch_thread(create_geometry), timeout=10)
+    assert toolkit_api.export_cache.get("project") is None
+    assert toolkit_api.export_cache.get("other")
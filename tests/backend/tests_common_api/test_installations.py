@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+import os
+import subprocess  # nosec
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from ansys.aedt.toolkits.common.backend import installations
+from ansys.aedt.toolkits.common.backend.installations import AEDTInstallations
+from ansys.aedt.toolkits.common.backend.installations import environment_key
+from ansys.aedt.toolkits.common.backend.installations import versions_from_variables
+from ansys.aedt.toolkits.common.backend.models import Properties
+
+pytestmark = [pytest.mark.common_api]
+
+DISCOVERED = {"variables": ["ANSYSEM_ROOT252", "ANSYSEMSV_ROOT251"], "current_version": "2025.2"}
+
+STARTUP_SCRIPT = """
+import sys
+import time
+
+start = time.perf_counter()
+from ansys.aedt.toolkits.common.backend.installations import aedt_installations
+from ansys.aedt.toolkits.common.backend.rest_api import app
+
+import_time = time.perf_counter() - start
+imported_at_startup = "ansys.aedt.core" in sys.modules
+discoveries_at_startup = aedt_installations.discoveries
+response = app.test_client().get("/installed_versions")
+print(
+    import_time,
+    imported_at_startup,
+    discoveries_at_startup,
+    time.perf_counter() - start,
+    "ansys.aedt.core" in sys.modules,
+    response.status_code,
+)
+"""
+
+
+def test_versions_from_variables():
+    variables = ["ANSYSEM_ROOT252", "ANSYSEMSV_ROOT251", "AWP_ROOT261", "ANSYSEM_PY_CLIENT_ROOT252", "OTHER"]
+    assert versions_from_variables(variables) == ["2025.1 STUDENT", "2025.2", "2026.1"]
+
+
+def test_discovered_once_per_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv("ANSYSEM_ROOT252", str(tmp_path))
+    aedt_installations = AEDTInstallations(str(tmp_path / "installations.json"))
+    with patch.object(installations, "discover_installations", return_value=DISCOVERED) as discover:
+        assert aedt_installations.installed_versions == ["2025.1 STUDENT", "2025.2"]
+        assert aedt_installations.current_version == "2025.2"
+        assert discover.call_count == 1
+
+        monkeypatch.setenv("ANSYSEM_ROOT261", str(tmp_path))
+        aedt_installations.get()
+        assert discover.call_count == 2
+        assert aedt_installations.discoveries == 2
+
+
+def test_cache_file_shared_between_backends(tmp_path, monkeypatch):
+    monkeypatch.setenv("ANSYSEM_ROOT252", str(tmp_path))
+    cache_file = tmp_path / "installations.json"
+    with patch.object(installations, "discover_installations", return_value=DISCOVERED) as discover:
+        AEDTInstallations(str(cache_file)).get()
+        assert json.loads(cache_file.read_text())["key"] == environment_key()
+
+        # A new backend with the same environment reads the cache file
+        assert AEDTInstallations(str(cache_file)).get() == DISCOVERED
+        assert discover.call_count == 1
+
+        monkeypatch.delenv("ANSYSEM_ROOT252")
+        AEDTInstallations(str(cache_file)).get()
+        assert discover.call_count == 2
+
+        cache_file.write_text("not json")
+        AEDTInstallations(str(cache_file)).get()
+        assert discover.call_count == 3
+
+
+def test_backend_startup_benchmark(tmp_path):
+    """Backend import and first response time, without and with the installation cache."""
+    env = dict(os.environ, XDG_RUNTIME_DIR=str(tmp_path), PYTHONWARNINGS="ignore")
+    results = []
+    for _ in range(2):
+        output = subprocess.run(  # nosec
+            [sys.executable, "-c", STARTUP_SCRIPT], env=env, capture_output=True, text=True, check=True
+        ).stdout.split()
+        results.append(
+            {
+                "import_time": float(output[0]),
+                "imported_at_startup": output[1] == "True",
+                "discoveries_at_startup": int(output[2]),
+                "first_response": float(output[3]),
+                "imported": output[4] == "True",
+                "status": output[5],
+            }
+        )
+    cold, warm = results
+    print(
+        f"\nBackend import: {cold['import_time'] * 1000:.0f} ms without cache, "
+        f"{warm['import_time'] * 1000:.0f} ms with cache"
+    )
+    print(
+        f"Startup to first response: {cold['first_response'] * 1000:.0f} ms without cache, "
+        f"{warm['first_response'] * 1000:.0f} ms with cache"
+    )
+
+    assert cold["status"] == warm["status"] == "200"
+    # Importing the backend neither discovers the installations nor imports PyAEDT, even without cache
+    for result in results:
+        assert not result["imported_at_startup"]
+        assert result["discoveries_at_startup"] == 0
+    assert cold["imported"]
+    # PyAEDT is not imported when the installations are cached
+    assert not warm["imported"]
+    assert warm["first_response"] < cold["first_response"]
+
+
+def test_default_aedt_version_resolved_on_first_use():
+    properties = Properties()
+    assert properties.aedt_version == ""
+    with patch.object(AEDTInstallations, "get", return_value=DISCOVERED) as get:
+        assert properties.resolve_aedt_version() == "2025.2"
+        assert properties.resolve_aedt_version() == "2025.2"
+        assert get.call_count == 1
+
+    properties = Properties(aedt_version="2026.1")
+    with patch.object(AEDTInstallations, "get") as get:
+        assert properties.resolve_aedt_version() == "2026.1"
+        get.assert_not_called()
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from contextlib import contextmanager
+import json
+import logging
+import os
+import time
+
+import pytest
+
+from ansys.aedt.toolkits.common.backend import logger_handler
+from ansys.aedt.toolkits.common.backend.logger_handler import JsonLinesFormatter
+from ansys.aedt.toolkits.common.backend.logger_handler import SizeTimedRotatingFileHandler
+from ansys.aedt.toolkits.common.backend.logger_handler import job_id_var
+from ansys.aedt.toolkits.common.backend.logger_handler import request_id_var
+from ansys.aedt.toolkits.common.backend.logger_handler import setup_logger
+from ansys.aedt.toolkits.common.backend.models import Properties
+from ansys.aedt.toolkits.common.backend.rest_api import REQUEST_ID_HEADER
+from ansys.aedt.toolkits.common.backend.rest_api import app
+from ansys.aedt.toolkits.common.backend.thread_manager import ThreadManager
+
+pytestmark = [pytest.mark.common_api]
+
+
+@contextmanager
+def backend_log_handlers(handlers=None, asynchronous=True, level=logging.DEBUG):
+    """Replace the handlers of the backend logger, through a queue or called by the logging thread."""
+    logger = logger_handler.logger
+    previous_handlers, previous_level = logger.handlers[:], logger.level
+    logger.setLevel(level)
+    listener = None
+    try:
+        if asynchronous:
+            listener = setup_logger(logger, handlers)
+        else:
+            for handler in previous_handlers:
+                logger.removeHandler(handler)
+            for handler in handlers:
+                logger.addHandler(handler)
+        yield logger
+    finally:
+        if listener:
+            listener.stop()
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+        for handler in previous_handlers:
+            logger.addHandler(handler)
+        logger.setLevel(previous_level)
+        for handler in handlers:
+            handler.close()
+
+
+def read_json_lines(log_file):
+    with open(log_file) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_json_lines_with_request_and_job_ids(tmp_path):
+    log_file = tmp_path / "backend.log"
+    handler = logging.FileHandler(log_file)
+    handler.setFormatter(JsonLinesFormatter())
+    with backend_log_handlers([handler]) as logger:
+        request_token = request_id_var.set("request-1")
+        job_token = job_id_var.set("job-1")
+        logger.info("Message %s", 1)
+        job_id_var.reset(job_token)
+        request_id_var.reset(request_token)
+        try:
+            raise ValueError("Wrong value")
+        except ValueError:
+            logger.exception("Failed")
+
+    first, second = read_json_lines(log_file)
+    assert first["message"] == "Message 1"
+    assert first["level"] == "INFO"
+    assert (first["request_id"], first["job_id"]) == ("request-1", "job-1")
+    assert second["request_id"] is None
+    assert "ValueError: Wrong value" in second["exception"]
+
+
+def test_request_id_header():
+    client = app.test_client()
+    response = client.get("/health", headers={REQUEST_ID_HEADER: "client-request"})
+    assert response.headers[REQUEST_ID_HEADER] == "client-request"
+    generated = client.get("/health").headers[REQUEST_ID_HEADER]
+    assert generated and generated != "client-request"
+    # The ID does not leak to the next code run by the thread
+    assert request_id_var.get() is None
+
+
+def test_job_carries_request_id():
+    thread_manager = ThreadManager(Properties())
+    token = request_id_var.set("request-2")
+    try:
+        job_id = thread_manager.launch_thread(lambda: [request_id_var.get(), job_id_var.get()])
+    finally:
+        request_id_var.reset(token)
+    job = thread_manager.wait_job(job_id, timeout=10)
+    assert job["result"] == ["request-2", job_id]
+
+
+def test_rotation_on_size_and_time(tmp_path):
+    log_file = str(tmp_path / "backend.log")
+    handler = SizeTimedRotatingFileHandler(log_file, max_bytes=200, backup_count=2)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger = logging.getLogger("test_rotation_on_size_and_time")
+    logger.addHandler(handler)
+    try:
+        for index in range(50):
+            logger.warning("Message %s", index)
+        assert sorted(os.listdir(tmp_path)) == ["backend.log", "backend.log.1", "backend.log.2"]
+        assert os.path.getsize(log_file) <= 200
+
+        handler.maxBytes = 0
+        handler.interval = 0.05
+        handler.rollover_at = time.time() + handler.interval
+        logger.warning("Before rollover")
+        time.sleep(0.1)
+        logger.warning("After rollover")
+        with open(log_file) as f:
+            assert f.read() == "After rollover\n"
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+
+class SlowDiskHandler(logging.FileHandler):
+    """File handler whose writes block, like on a loaded or network drive."""
+
+    def emit(self, record):
+        time.sleep(0.0002)
+        super().emit(record)
+
+
+@pytest.mark.parametrize("handler_class", [logging.FileHandler, SlowDiskHandler])
+def test_debug_request_throughput_benchmark(tmp_path, handler_class):
+    """Requests per second with DEBUG records, written by the request thread or by the listener thread."""
+    client = app.test_client()
+    requests_count = 300
+    throughput = {}
+    for asynchronous in (False, True):
+        log_file = tmp_path / f"backend_{asynchronous}.log"
+        handler = handler_class(log_file)
+        handler.setFormatter(JsonLinesFormatter())
+        with backend_log_handlers([handler], asynchronous=asynchronous):
+            start = time.perf_counter()
+            for index in range(requests_count):
+                response = client.put("/properties", json={"progress": index % 100, "state": "Running"})
+                assert response.status_code == 200
+            throughput[asynchronous] = requests_count / (time.perf_counter() - start)
+        records = read_json_lines(log_file)
+        assert len(records) >= requests_count * 3
+        assert all(record["request_id"] for record in records)
+    print(
+        f"\nRequests per second with DEBUG logs ({handler_class.__name__}): "
+        f"{throughput[False]:.0f} synchronous, {throughput[True]:.0f} queued"
+    )
+    if handler_class is SlowDiskHandler:
+        assert throughput[True] > throughput[False]
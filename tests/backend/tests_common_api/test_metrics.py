@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import threading
+import time
+
+import pytest
+from werkzeug.test import Client
+from werkzeug.wrappers import Response
+
+from ansys.aedt.toolkits.common.backend.metrics import MetricsRegistry
+from ansys.aedt.toolkits.common.backend.models import Properties
+from ansys.aedt.toolkits.common.backend.multithreading_server import InProcessServer
+from ansys.aedt.toolkits.common.backend.multithreading_server import executor_wait_time
+from ansys.aedt.toolkits.common.backend.rest_api import app
+from ansys.aedt.toolkits.common.backend.rest_api import request_count
+from ansys.aedt.toolkits.common.backend.thread_manager import ThreadManager
+from ansys.aedt.toolkits.common.backend.thread_manager import job_duration
+
+pytestmark = [pytest.mark.common_api]
+
+
+def test_text_exposition_format():
+    registry = MetricsRegistry()
+    counter = registry.counter("requests", "Requests.", ("route",))
+    histogram = registry.histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    registry.callback("queue_depth", "Queue depth.", lambda: 3)
+    counter.inc('/a"b')
+    counter.inc('/a"b', amount=2)
+    for value in (0.05, 0.5, 0.1, 5.0):
+        histogram.observe(value, "/a")
+
+    assert registry.render().splitlines() == [
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{route="/a",le="0.1"} 2',
+        'latency_seconds_bucket{route="/a",le="1.0"} 3',
+        'latency_seconds_bucket{route="/a",le="+Inf"} 4',
+        'latency_seconds_sum{route="/a"} 5.65',
+        'latency_seconds_count{route="/a"} 4',
+        "# HELP queue_depth Queue depth.",
+        "# TYPE queue_depth gauge",
+        "queue_depth 3",
+        "# HELP requests_total Requests.",
+        "# TYPE requests_total counter",
+        'requests_total{route="/a\\"b"} 3',
+    ]
+
+
+def parse_families(text):
+    """Check that each sample belongs to the family of the last TYPE line, and get the family types."""
+    families = {}
+    family = None
+    for line in text.splitlines():
+        if line.startswith("# TYPE "):
+            family, metric_type = line.split()[2:]
+            families[family] = metric_type
+            continue
+        if line.startswith("#"):
+            continue
+        name = line.split("{")[0].split(" ")[0]
+        suffixes = ("_bucket", "_sum", "_count") if families[family] == "histogram" else ()
+        assert name == family or any(name == family + suffix for suffix in suffixes), line
+    return families
+
+
+def test_sample_names_match_families():
+    registry = MetricsRegistry()
+    registry.counter("requests", "Requests.", ("route",)).inc("/a")
+    registry.histogram("latency_seconds", "Latency.").observe(0.2)
+    registry.callback("connection_seconds", "Connection time.", lambda: 1.5, metric_type="counter")
+    registry.callback("queue_depth", "Queue depth.", lambda: {("main",): 3}, ("queue",))
+
+    text = registry.render()
+    assert parse_families(text) == {
+        "connection_seconds_total": "counter",
+        "latency_seconds": "histogram",
+        "queue_depth": "gauge",
+        "requests_total": "counter",
+    }
+    assert parse_families(app.test_client().get("/metrics").get_data(as_text=True))
+
+    # Parsed as typed metrics by the reference parser, when it is installed
+    try:
+        from prometheus_client.parser import text_string_to_metric_families
+    except ImportError:
+        return
+    families = {family.name: family.type for family in text_string_to_metric_families(text)}
+    assert families == {
+        "connection_seconds": "counter",
+        "latency_seconds": "histogram",
+        "queue_depth": "gauge",
+        "requests": "counter",
+    }
+
+
+def test_metrics_endpoint():
+    client = app.test_client()
+    count = request_count.value("GET", "/jobs/<job_id>", "404")
+    client.get("/jobs/not_a_job")
+    assert request_count.value("GET", "/jobs/<job_id>", "404") == count + 1
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+    text = response.get_data(as_text=True)
+    assert "# TYPE aedt_toolkit_http_request_duration_seconds histogram" in text
+    assert 'aedt_toolkit_http_requests_total{method="GET",route="/jobs/<job_id>",status="404"}' in text
+    assert "aedt_toolkit_aedt_connections_total 0" in text
+    assert "not_a_job" not in text
+
+
+def test_executor_queue_metrics():
+    release = threading.Event()
+
+    def wsgi_app(environ, start_response):
+        release.wait(5)
+        return Response("done")(environ, start_response)
+
+    server = InProcessServer(wsgi_app, concurrent_routes=set())
+    server.start()
+    count = executor_wait_time.count()
+    try:
+        threads = [threading.Thread(target=Client(server).get, args=("/launch_aedt",)) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.2)
+        # One request runs and two wait in the queue
+        assert "aedt_toolkit_executor_queue_depth 2" in app.test_client().get("/metrics").get_data(as_text=True)
+        release.set()
+        for thread in threads:
+            thread.join()
+    finally:
+        release.set()
+        server.shutdown()
+    assert executor_wait_time.count() == count + 3
+
+
+def test_job_duration():
+    def sleeping_job():
+        time.sleep(0.05)
+
+    thread_manager = ThreadManager(Properties())
+    count = job_duration.count("sleeping_job", "finished")
+    thread_manager.wait_job(thread_manager.launch_thread(sleeping_job), timeout=10)
+    assert job_duration.count("sleeping_job", "finished") == count + 1
+
+
+class CountingLock:
+    """Lock counting its acquisitions."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.acquired = 0
+
+    def __enter__(self):
+        self.acquired += 1
+        return self.lock.__enter__()
+
+    def __exit__(self, *args):
+        return self.lock.__exit__(*args)
+
+
+def test_recording_cost():
+    """Recording a request only takes the lock of each metric and updates the existing values in place."""
+    registry = MetricsRegistry()
+    counter = registry.counter("requests", "Requests.", ("method", "route", "status"))
+    histogram = registry.histogram("request_duration_seconds", "Duration.", ("method", "route", "status"))
+    labels = ("GET", "/properties", "200")
+    counter.inc(*labels)
+    histogram.observe(0.002, *labels)
+    counts, _ = histogram._values[labels]
+
+    locks = [CountingLock() for _ in range(3)]
+    registry._lock, counter._lock, histogram._lock = locks
+    repeats = 1000
+    for _ in range(repeats):
+        counter.inc(*labels)
+        histogram.observe(0.002, *labels)
+
+    # No registry lock and no rendering, one acquisition of the metric lock per record
+    assert [lock.acquired for lock in locks] == [0, repeats, repeats]
+    # The values of the label set are updated in place, nothing is added per record
+    assert list(counter._values) == [labels] and list(histogram._values) == [labels]
+    assert histogram._values[labels][0] is counts
+    assert counter.value(*labels) == repeats + 1
+    assert histogram.count(*labels) == repeats + 1
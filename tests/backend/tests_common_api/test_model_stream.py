@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from unittest.mock import patch
+
+import pytest
+
+from ansys.aedt.toolkits.common.backend.api import Common
+from ansys.aedt.toolkits.common.backend.rest_api import app
+from ansys.aedt.toolkits.common.backend.rest_api import toolkit_api
+from ansys.aedt.toolkits.common.mesh import MESH_MIMETYPE
+from ansys.aedt.toolkits.common.mesh import read_mesh_stream
+from ansys.aedt.toolkits.common.ui.actions_generic import FrontendGeneric
+
+pytestmark = [pytest.mark.common_api]
+
+
+@pytest.fixture
+def exported_files(tmp_path):
+    files = []
+    for index, size in enumerate([10, 0, 2500]):
+        file_path = tmp_path / "object_{}.obj".format(index)
+        file_path.write_bytes(bytes(i % 251 for i in range(size)))
+        files.append([str(file_path), [index, 0, 0], 0.5])
+    return files
+
+
+def test_iter_file_chunks(exported_files):
+    chunks = list(Common.iter_file_chunks([file[0] for file in exported_files], chunk_size=1000))
+    assert [len(chunk) for chunk in chunks] == [10, 1000, 1000, 500]
+
+
+def test_model_stream_round_trip(exported_files, tmp_path):
+    output_dir = tmp_path / "download"
+    output_dir.mkdir()
+    with patch.object(toolkit_api, "export_aedt_model", return_value=exported_files):
+        response = app.test_client().get("/get_aedt_model_stream", json={"air_objects": True})
+    assert response.status_code == 200
+    assert int(response.headers["Content-Length"]) == len(response.data)
+
+    data = response.data
+    model_info = FrontendGeneric.read_model_stream((data[i : i + 333] for i in range(0, len(data), 333)), output_dir)
+
+    assert list(model_info) == ["object_0", "object_1", "object_2"]
+    for file, name in zip(exported_files, model_info):
+        file_path, color, opacity = model_info[name]
+        with open(file_path, "rb") as received, open(file[0], "rb") as sent:
+            assert received.read() == sent.read()
+        assert color == file[1]
+        assert opacity == file[2]
+
+    with pytest.raises(ValueError):
+        FrontendGeneric.read_model_stream([data[:-1]], output_dir)
+
+
+def test_model_stream_no_model():
+    with patch.object(toolkit_api, "export_aedt_model", return_value=[]):
+        response = app.test_client().get("/get_aedt_model_stream")
+    assert response.status_code == 500
+
+
+def test_mesh_stream(tmp_path):
+    file_path = tmp_path / "triangle.obj"
+    file_path.write_text("v 0 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 3\n")
+    with patch.object(toolkit_api, "export_aedt_model", return_value=[[str(file_path), [0, 255, 0], 0.8]]):
+        response = app.test_client().get("/get_aedt_mesh", json={"air_objects": True})
+    assert response.status_code == 200
+    assert response.mimetype == MESH_MIMETYPE
+
+    meshes = read_mesh_stream(response.data)
+    assert [mesh["name"] for mesh in meshes] == ["triangle"]
+    mesh = FrontendGeneric.polydata_from_buffers(meshes[0]["points"], meshes[0]["offsets"], meshes[0]["connectivity"])
+    assert mesh.n_points == 3
+    assert mesh.n_cells == 1
+    assert meshes[0]["color"] == [0, 255, 0]
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from ansys.aedt.toolkits.common.backend.api import AEDTCommon
+from ansys.aedt.toolkits.common.backend.models import Properties
+
+pytestmark = [pytest.mark.common_api]
+
+GRPC_PORT = 50051
+
+
+class ProjectMock:
+    def __init__(self, path, designs):
+        self.path, self.name = os.path.split(os.path.splitext(path)[0])
+        self.designs = designs
+        self.calls = []
+
+    def GetName(self):
+        return self.name
+
+    def GetPath(self):
+        return self.path
+
+    def GetChildNames(self):
+        self.calls.append("GetChildNames")
+        return list(self.designs)
+
+    def GetChildObject(self, name):
+        self.calls.append("GetDesignType")
+        return MagicMock(GetDesignType=MagicMock(return_value=self.designs[name]))
+
+
+def desktop_mock():
+    desktop = MagicMock(port=GRPC_PORT, aedt_process_id=os.getpid())
+    desktop.projects = []
+
+    def open_project(path):
+        designs = {"HFSS1": "HFSS", "2;Circuit1": "Circuit Design"}
+        desktop.projects.append(ProjectMock(path, designs))
+
+    desktop.open = open_project
+    desktop.odesktop.GetProjectList.side_effect = lambda: [project.name for project in desktop.projects]
+    desktop.odesktop.GetProjects.side_effect = lambda: list(desktop.projects)
+    desktop.odesktop.OpenProject.side_effect = open_project
+    desktop.active_project.side_effect = lambda *args: desktop.projects[-1]
+    desktop.active_design.return_value.GetName.return_value = "HFSS1"
+    return desktop
+
+
+def test_project_catalog(tmp_path):
+    desktop = desktop_mock()
+    properties = Properties(selected_process=GRPC_PORT, keep_aedt_session=True)
+    toolkit = AEDTCommon(properties)
+    with patch("ansys.aedt.core.Desktop", return_value=desktop):
+        assert toolkit.open_project(str(tmp_path / "first.aedt"))
+        first = desktop.projects[0]
+        assert properties.design_list == {"first": ["HFSS1", "Circuit1"]}
+        # Only the design name with a prefix needs the design type
+        assert first.calls == ["GetChildNames", "GetDesignType"]
+
+        # Unchanged projects are not read again
+        assert toolkit.open_project(str(tmp_path / "second.aedt"))
+        assert first.calls == ["GetChildNames", "GetDesignType"]
+        assert properties.project_list == [str(tmp_path / "first.aedt"), str(tmp_path / "second.aedt")]
+        assert properties.active_project == str(tmp_path / "second.aedt")
+        assert set(properties.design_list) == {"first", "second"}
+        desktop.odesktop.SetActiveProject.assert_not_called()
+
+        # Closed projects are removed, and the design changes are found when the session is connected
+        desktop.projects.pop()
+        desktop.open(str(tmp_path / "third.aedt"))
+        first.designs["HFSS2"] = "HFSS"
+        toolkit.release_aedt(force=True)
+        assert toolkit.launch_aedt()
+        assert properties.design_list == {"first": ["HFSS1", "Circuit1", "HFSS2"], "third": ["HFSS1", "Circuit1"]}
+        assert first.calls == ["GetChildNames", "GetDesignType", "GetChildNames", "GetDesignType"]
+        desktop.odesktop.SetActiveProject.assert_not_called()
+    toolkit.release_aedt(force=True)
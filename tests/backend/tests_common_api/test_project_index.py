@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+from unittest.mock import patch
+import zipfile
+
+import pytest
+
+from ansys.aedt.toolkits.common.backend import project_index
+from ansys.aedt.toolkits.common.backend.project_index import PROJECT_INDEX_FILE_NAME
+from ansys.aedt.toolkits.common.backend.project_index import ProjectIndexCache
+from ansys.aedt.toolkits.common.backend.project_index import index_project
+from ansys.aedt.toolkits.common.backend.rest_api import app
+from ansys.aedt.toolkits.common.backend.rest_api import toolkit_api
+
+pytestmark = [pytest.mark.common_api]
+
+PROJECT = """$begin 'AnsoftProject'
+\tCreated='Mon Jan 01 00:00:00 2026'
+\t$begin 'Properties'
+\t\tVariableProp('$length', 'UD', '', '1mm')
+\t\tVariableProp('$width', 'UD', '', '2mm')
+\t$end 'Properties'
+\t$begin 'HFSSModel'
+\t\tRepRewriteV2=true
+\t\tName='HFSSDesign1'
+\t\t$begin 'Properties'
+\t\t\tVariableProp('radius', 'UD', '', '1mm')
+\t\t$end 'Properties'
+\t\t$begin 'ModelSetup'
+\t\t\t$begin 'Properties'
+\t\t\t\tVariableProp('ignored', 'UD', '', '1mm')
+\t\t\t$end 'Properties'
+\t\t$end 'ModelSetup'
+\t$end 'HFSSModel'
+\t$begin 'NexximCircuit'
+\t\tName='Circuit1'
+\t$end 'NexximCircuit'
+$end 'AnsoftProject'
+$begin 'ProjectPreview'
+$end 'ProjectPreview'
+"""
+
+EXPECTED_DESIGNS = [
+    {"name": "HFSSDesign1", "design_type": "HFSS", "variables": 1},
+    {"name": "Circuit1", "design_type": "Circuit Design", "variables": 0},
+]
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+def test_index_project(tmp_path, newline):
+    project = tmp_path / "project.aedt"
+    project.write_bytes(PROJECT.replace("\n", newline).encode())
+
+    index = index_project(str(project))
+    assert index["name"] == "project"
+    assert index["variables"] == 2
+    assert index["designs"] == EXPECTED_DESIGNS
+
+    empty = tmp_path / "empty.aedt"
+    empty.write_bytes(b"")
+    assert index_project(str(empty))["designs"] == []
+
+
+def test_index_archive(tmp_path):
+    archive = tmp_path / "archive.aedtz"
+    with zipfile.ZipFile(archive, "w", compression=zipfile.ZIP_DEFLATED) as f:
+        f.writestr("archive/archived.aedtresults/notes.aedt", "")
+        f.writestr("archive/archived.aedt", PROJECT)
+
+    index = index_project(str(archive))
+    assert index["name"] == "archived"
+    assert index["designs"] == EXPECTED_DESIGNS
+
+
+def test_project_index_cache(tmp_path):
+    project = tmp_path / "project.aedt"
+    project.write_text(PROJECT)
+    cache_file = str(tmp_path / "index.json")
+
+    cache = ProjectIndexCache(cache_file)
+    with patch.object(project_index, "index_project", wraps=index_project) as indexer:
+        assert cache.get(str(project))["designs"] == EXPECTED_DESIGNS
+        assert cache.get(str(project))["designs"] == EXPECTED_DESIGNS
+        assert indexer.call_count == 1
+
+        # The cache survives a restart, and changed files are indexed again
+        assert ProjectIndexCache(cache_file).get(str(project))["designs"] == EXPECTED_DESIGNS
+        assert indexer.call_count == 1
+        project.write_text(PROJECT.replace("Circuit1", "Circuit2"))
+        os.utime(project, ns=(0, 10**9))
+        assert cache.get(str(project))["designs"][1]["name"] == "Circuit2"
+        assert indexer.call_count == 2
+
+    assert cache.get(str(tmp_path / "missing.aedt")) is None
+    (tmp_path / "broken.aedtz").write_text("not an archive")
+    assert cache.get(str(tmp_path / "broken.aedtz")) is None
+
+
+def test_project_index_cache_default_file(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    project = tmp_path / "project.aedt"
+    project.write_text(PROJECT)
+
+    # The default cache file is in the per-user runtime directory
+    assert ProjectIndexCache().get(str(project))["designs"] == EXPECTED_DESIGNS
+    assert (tmp_path / "pyaedt-toolkits" / PROJECT_INDEX_FILE_NAME).is_file()
+
+
+def test_project_index_route(tmp_path):
+    project = tmp_path / "project.aedt"
+    project.write_text(PROJECT)
+
+    with patch.object(toolkit_api, "project_index", ProjectIndexCache(str(tmp_path / "index.json"))):
+        response = app.test_client().get("/project_index", json={"project_list": [str(project)]})
+    assert response.status_code == 200
+    assert response.json[str(project)]["designs"] == EXPECTED_DESIGNS
+
+    response = app.test_client().get("/project_index", json={"project_list": "project.aedt"})
+    assert response.status_code == 500
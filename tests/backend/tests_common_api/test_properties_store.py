@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+import sys
+import threading
+
+import pytest
+
+from ansys.aedt.toolkits.common.backend.api import Common
+from ansys.aedt.toolkits.common.backend.models import Properties
+
+pytestmark = [pytest.mark.common_api]
+
+WRITERS = 4
+READERS = 8
+WRITES = 100
+
+
+def check_consistent(properties):
+    """Properties written together must be read together."""
+    step = properties["progress"]
+    assert properties["state"] == f"Step {step}"
+    assert properties["active_design"] == f"Design{step}"
+    assert properties["project_list"] == [f"Project{step}.aedt"]
+    assert properties["design_list"] == {f"Project{step}": [f"Design{step}"]}
+
+
+def test_snapshot_is_shared():
+    properties = Properties()
+    snapshot = properties.snapshot()
+    assert properties.snapshot() is snapshot
+    with pytest.raises(TypeError):
+        snapshot["state"] = "Modified"
+
+    properties.state = "Running"
+    new_snapshot = properties.snapshot()
+    assert new_snapshot is not snapshot
+    assert new_snapshot["state"] == "Running"
+    assert snapshot["state"] == ""
+
+
+def test_get_properties_reads_snapshot():
+    api = Common(Properties())
+    api.properties.project_list = ["Project0.aedt"]
+    api.properties.snapshot()
+
+    # The cached snapshot is read while a writer holds the lock
+    acquired = threading.Event()
+    release = threading.Event()
+    released = []
+
+    def hold_lock():
+        with api.properties.lock:
+            acquired.set()
+            released.append(release.wait(10))
+
+    writer = threading.Thread(target=hold_lock)
+    writer.start()
+    assert acquired.wait(10)
+    try:
+        properties = api.get_properties()
+    finally:
+        release.set()
+        writer.join()
+    assert released == [True]
+
+    # Callers get their own copy
+    properties["project_list"].append("Project1.aedt")
+    assert api.get_properties()["project_list"] == ["Project0.aedt"]
+    assert api.properties.snapshot()["project_list"] == ["Project0.aedt"]
+
+
+@pytest.fixture
+def switch_often():
+    """Switch between threads more often to make races visible."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def test_concurrent_reads_and_writes(switch_often):
+    api = Common(Properties())
+    api.properties.publish_events = False
+    api.set_properties(
+        {
+            "progress": 0,
+            "state": "Step 0",
+            "active_design": "Design0",
+            "project_list": ["Project0.aedt"],
+            "design_list": {"Project0": ["Design0"]},
+        }
+    )
+    errors = []
+    done = threading.Event()
+    start = threading.Barrier(WRITERS + READERS)
+
+    def write(writer):
+        try:
+            start.wait()
+            for index in range(WRITES):
+                step = index * WRITERS + writer
+                if index % 2:
+                    api.set_properties(
+                        {
+                            "progress": step,
+                            "state": f"Step {step}",
+                            "active_design": f"Design{step}",
+                            "project_list": [f"Project{step}.aedt"],
+                            "design_list": {f"Project{step}": [f"Design{step}"]},
+                        }
+                    )
+                else:
+                    with api.properties.lock:
+                        api.properties.progress = step
+                        api.properties.state = f"Step {step}"
+                        api.properties.active_design = f"Design{step}"
+                        api.properties.project_list = [f"Project{step}.aedt"]
+                        api.properties.design_list = {f"Project{step}": [f"Design{step}"]}
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+
+    def read(reader):
+        try:
+            start.wait()
+            last_version = -1
+            while not done.is_set():
+                if reader % 3 == 0:
+                    check_consistent(api.properties.snapshot())
+                elif reader % 3 == 1:
+                    version, data = api.get_serialized_properties()
+                    assert version >= last_version
+                    last_version = version
+                    check_consistent(json.loads(data))
+                else:
+                    check_consistent(api.get_properties())
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+
+    writers = [threading.Thread(target=write, args=(writer,)) for writer in range(WRITERS)]
+    readers = [threading.Thread(target=read, args=(reader,)) for reader in range(READERS)]
+    for thread in writers + readers:
+        thread.start()
+    for thread in writers:
+        thread.join(timeout=60)
+    done.set()
+    for thread in readers:
+        thread.join(timeout=60)
+
+    assert not errors, errors[0]
+    assert api.properties.version == 1 + WRITERS * WRITES * 3
+    check_consistent(api.properties.snapshot())
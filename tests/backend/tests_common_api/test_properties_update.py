@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import timeit
+
+from pydantic import BaseModel
+from pydantic import ConfigDict
+from pydantic import create_model
+import pytest
+
+from ansys.aedt.toolkits.common.backend.api import Common
+from ansys.aedt.toolkits.common.backend.events import event_broker
+from ansys.aedt.toolkits.common.backend.models import CommonProperties
+from ansys.aedt.toolkits.common.backend.models import field_paths
+
+pytestmark = [pytest.mark.common_api]
+
+
+def section_model(depth, width):
+    """Nested model with ``width`` float fields per level."""
+    fields = {f"value_{depth}_{index}": (float, 0.0) for index in range(width)}
+    if depth:
+        section = section_model(depth - 1, width)
+        fields[f"section_{depth - 1}"] = (section, section())
+    return create_model(f"Section{depth}", __config__=ConfigDict(validate_assignment=True), **fields)
+
+
+def properties_model(depth=2, width=5):
+    section = section_model(depth, width)
+    return create_model(
+        "NestedProperties",
+        __base__=CommonProperties,
+        __cls_kwargs__={"validate_assignment": True},
+        section=(section, section()),
+    )
+
+
+def legacy_update(properties, data):
+    """Previous implementation of ``Common._update_properties``, one assignment per key."""
+    is_updated = False
+    for key, value in data.items():
+        is_updated = False
+        if hasattr(properties, key):
+            setattr(properties, key, value)
+            is_updated = True
+        if not is_updated:
+            for attr_name in type(properties).model_fields:
+                attr = getattr(properties, attr_name)
+                if hasattr(attr, "__dict__"):
+                    is_updated = legacy_update(attr, data)
+                    if is_updated:
+                        break
+    return is_updated
+
+
+def test_field_paths():
+    model = properties_model(depth=1, width=2)
+    paths = field_paths(model)
+    assert paths["progress"] == ("progress",)
+    assert paths["section"] == ("section",)
+    assert paths["value_1_0"] == ("section", "value_1_0")
+    assert paths["value_0_1"] == ("section", "section_0", "value_0_1")
+    assert field_paths(model) is paths
+
+    class Shadowed(BaseModel):
+        progress: str = ""
+
+    class ShadowedProperties(CommonProperties):
+        shadowed: Shadowed = Shadowed()
+
+    assert field_paths(ShadowedProperties)["progress"] == ("progress",)
+
+
+def test_update_nested():
+    api = Common(properties_model()())
+    section = api.properties.section.section_1
+    is_updated, _ = api.set_properties({"value_0_2": 3, "value_2_0": 1.5, "active_design": "HFSS"})
+    assert is_updated
+    assert api.properties.section.section_1.section_0.value_0_2 == 3.0
+    assert api.properties.section.value_2_0 == 1.5
+    assert api.properties.active_design == "HFSS"
+    assert api.properties.section.section_1 is not section
+    assert {"section", "active_design"} <= api.properties.model_fields_set
+
+    is_updated, _ = api.set_properties({"value_1_1": 2.0, "unknown_property": 1})
+    assert not is_updated
+    assert api.properties.section.section_1.value_1_1 == 2.0
+
+
+def test_update_is_atomic():
+    api = Common(properties_model()())
+    subscription = event_broker.subscribe()
+    try:
+        is_updated, _ = api.set_properties({"progress": 50, "value_0_0": "not a number", "state": "Failed"})
+        assert not is_updated
+        assert api.properties.progress == 0
+        assert api.properties.state == ""
+        assert api.properties.section.section_1.section_0.value_0_0 == 0.0
+        assert subscription.get(timeout=0) is None
+
+        is_updated, _ = api.set_properties({"progress": 50, "state": "Running"})
+        assert is_updated
+        assert subscription.get(timeout=1) == ("progress", 50)
+        assert subscription.get(timeout=1) == ("state", "Running")
+    finally:
+        event_broker.unsubscribe(subscription)
+
+
+def test_update_benchmark():
+    model = properties_model(depth=2, width=5)
+    data = {f"value_{depth}_{index}": 1.0 for depth in range(3) for index in range(5)}
+    data.update({"state": "Running", "progress": 10})
+    legacy_properties = model()
+    api = Common(model())
+
+    legacy_time = timeit.timeit(lambda: legacy_update(legacy_properties, data), number=1)
+    indexed_time = timeit.timeit(lambda: api._update_properties(api.properties, data), number=1)
+
+    assert api.properties.model_dump() == legacy_properties.model_dump()
+    assert indexed_time < legacy_time
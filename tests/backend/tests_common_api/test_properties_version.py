@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from ansys.aedt.toolkits.common.backend.api import Common
+from ansys.aedt.toolkits.common.backend.models import Properties
+from ansys.aedt.toolkits.common.backend.rest_api import app
+from ansys.aedt.toolkits.common.backend.rest_api import toolkit_api
+from ansys.aedt.toolkits.common.ui.actions_generic import FrontendGeneric
+
+pytestmark = [pytest.mark.common_api]
+
+
+def test_properties_version():
+    api = Common(Properties())
+    properties = api.properties
+    assert properties.version == 0
+
+    version, data = api.get_serialized_properties()
+    assert version == 0
+    assert json.loads(data) == api.get_properties()
+    assert api.get_serialized_properties()[1] is data
+
+    properties.state = "Running"
+    api.set_properties({"progress": 10, "active_design": "HFSS"})
+    assert properties.version == 2
+    new_version, new_data = api.get_serialized_properties()
+    assert new_version == 2
+    assert json.loads(new_data)["active_design"] == "HFSS"
+
+    assert api.get_properties_changes(0) == (2, {"state": "Running", "progress": 10, "active_design": "HFSS"})
+    assert api.get_properties_changes(1) == (2, {"progress": 10, "active_design": "HFSS"})
+    assert api.get_properties_changes(2) == (2, {})
+    assert api.get_properties_changes(5) == (2, api.get_properties())
+
+    # Invalid values do not change the version
+    assert not api.set_properties({"progress": "invalid"})[0]
+    assert properties.version == 2
+
+
+def test_properties_route():
+    client = app.test_client()
+    response = client.get("/properties")
+    assert response.status_code == 200
+    assert response.json == toolkit_api.get_properties()
+    etag = response.headers["ETag"]
+
+    response = client.get("/properties", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert not response.data
+
+    version = toolkit_api.properties.version
+    toolkit_api.set_properties({"state": "Route test"})
+    response = client.get("/properties", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json["state"] == "Route test"
+
+    response = client.get(f"/properties?since={version}")
+    assert response.status_code == 200
+    assert response.json == {"version": version + 1, "properties": {"state": "Route test"}}
+
+    response = client.get("/properties?since=last")
+    assert response.status_code == 400
+
+
+def test_frontend_properties_cache():
+    client = app.test_client()
+    statuses = []
+
+    def get(url, headers=None, timeout=None):
+        response = client.get(url.replace(frontend.url, ""), headers=headers)
+        statuses.append(response.status_code)
+        mock = MagicMock(status_code=response.status_code, ok=response.status_code < 400, content=response.data)
+        mock.headers = response.headers
+        mock.json.side_effect = lambda: json.loads(response.data)
+        return mock
+
+    frontend = FrontendGeneric()
+    with patch.object(frontend.session, "get", side_effect=get) as requests_get:
+        first = frontend.get_properties()
+        first["state"] = "Modified by the caller"
+        second = frontend.get_properties()
+        assert statuses == [200, 304]
+        assert requests_get.call_args.kwargs["headers"]["If-None-Match"] == frontend._properties_cache[0]
+        assert second == toolkit_api.get_properties()
+
+        toolkit_api.set_properties({"state": "Frontend test"})
+        assert frontend.get_properties()["state"] == "Frontend test"
+        assert statuses == [200, 304, 200]
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import itertools
+import threading
+import time
+
+import pytest
+
+from ansys.aedt.toolkits.common.backend.api import AEDTCommon
+from ansys.aedt.toolkits.common.backend.models import Properties
+from ansys.aedt.toolkits.common.backend.session_pool import AEDTSessionPool
+from ansys.aedt.toolkits.common.backend.session_pool import normalize_project
+from ansys.aedt.toolkits.common.backend.thread_manager import ThreadManager
+
+pytestmark = [pytest.mark.common_api]
+
+PORTS = itertools.count(50051)
+
+
+class SessionApiMock:
+    """Toolkit API opening projects in a simulated AEDT session."""
+
+    def __init__(self, properties, opened=None):
+        self.properties = properties
+        self.thread_manager = ThreadManager(properties)
+        self.opened = opened if opened is not None else []
+
+    def create_session_api(self, selected_process=0):
+        return SessionApiMock(Properties(selected_process=selected_process), self.opened)
+
+    def aedt_sessions(self):
+        return {1: 50100, 2: -1}
+
+    def launch_aedt(self):
+        if not self.properties.selected_process:
+            self.properties.selected_process = next(PORTS)
+        return True
+
+    def open_project(self, project_name):
+        if project_name == "missing.aedt":
+            return False
+        self.opened.append((self.properties.selected_process, project_name))
+        self.properties.project_list.append(project_name)
+        return True
+
+    def release_aedt(self, close_projects=False, close_on_exit=False, force=False):
+        return True
+
+    def solve(self, duration):
+        time.sleep(duration)
+        return self.properties.selected_process, self.properties.active_project, threading.current_thread().name
+
+
+@pytest.fixture
+def session_pool():
+    return AEDTSessionPool(SessionApiMock(Properties()))
+
+
+def test_session_pool_dispatch(session_pool):
+    session_ids = [session_pool.add_session(), session_pool.add_session()]
+    assert session_pool.add_session(50100) and not session_pool.add_session(50100)
+    assert session_pool.remove_session(session_ids.pop())
+
+    job_ids = [session_pool.launch_thread("solve", 0.2, project="project_{}.aedt".format(i)) for i in range(4)]
+    assert session_pool.wait_until_idle(timeout=10)
+    results = [session_pool.get_job(job_id) for job_id in job_ids]
+    assert all(result["state"] == "finished" for result in results)
+
+    # Independent projects are solved in parallel by the free sessions
+    assert len({result["session_id"] for result in results}) == 2
+    assert len({tuple(result["result"]) for result in results}) == 4
+    assert len(session_pool.get_sessions()) == 2
+
+
+def test_session_pool_affinity(session_pool):
+    session_ids = [session_pool.add_session(), session_pool.add_session()]
+    first = session_pool.launch_thread("solve", 0.1, project="project.aedt", session_id=session_ids[1])
+    session_pool.wait_job(first, timeout=10)
+
+    # Jobs on an open project are executed by its session, which opens it once
+    job_ids = [session_pool.launch_thread("solve", 0.05, project="project.aedt") for _ in range(3)]
+    job_ids.append(session_pool.launch_thread(lambda api: api.properties.selected_process))
+    assert session_pool.wait_until_idle(timeout=10)
+    assert {session_pool.get_job(job_id)["session_id"] for job_id in job_ids[:3]} == {session_ids[1]}
+    assert session_pool.get_job(job_ids[3])["state"] == "finished"
+    assert len(session_pool.toolkit_api.opened) == 1
+
+    assert not session_pool.launch_thread("solve", 0, session_id="missing")
+    assert session_pool.remove_session(session_ids[0])
+    assert session_pool.wait_until_idle(timeout=10)
+    assert [session["session_id"] for session in session_pool.get_sessions()] == [session_ids[1]]
+
+
+def test_session_pool_open_project_failed(session_pool):
+    session_id = session_pool.add_session()
+    job_id = session_pool.launch_thread("solve", 0, project="project.aedt")
+    session_pool.wait_job(job_id, timeout=10)
+
+    # The process is not run on the project that is already active
+    job = session_pool.wait_job(session_pool.launch_thread("solve", 0, project="missing.aedt"), timeout=10)
+    assert job["state"] == "failed"
+    assert "missing.aedt could not be opened" in job["exception"]
+    assert job["result"] is None
+    session = session_pool.get_sessions()[0]
+    assert session["session_id"] == session_id
+    assert session["projects"] == [normalize_project("project.aedt")]
+
+
+def test_attach_sessions(session_pool):
+    assert len(session_pool.attach_sessions()) == 1
+    assert session_pool.wait_until_idle(timeout=10)
+    assert [session["selected_process"] for session in session_pool.get_sessions()] == [50100]
+
+
+def test_create_session_api():
+    toolkit_api = AEDTCommon(Properties(selected_process=50051, project_list=["project.aedt"]))
+    session_api = toolkit_api.create_session_api(50052)
+    assert session_api.properties.selected_process == 50052
+    assert session_api.properties.keep_aedt_session
+    assert not session_api.properties.project_list
+    assert not session_api.properties.publish_events
+    assert session_api.thread_manager is not toolkit_api.thread_manager
+    assert session_api.export_cache is toolkit_api.export_cache
+    assert toolkit_api.properties.selected_process == 50051
+
+
+def test_session_jobs_allow_list():
+    from ansys.aedt.toolkits.common.backend.rest_api import app
+
+    client = app.test_client()
+    for body in (
+        {"process": "set_properties", "args": [{"use_grpc": False}]},
+        {"process": "_AEDTCommon__drop_session"},
+        {"process": "get_design_names", "args": "not a list"},
+        {"process": ["get_design_names"]},
+    ):
+        assert client.post("/sessions/jobs", json=body).status_code == 500
+    assert not client.get("/sessions/jobs").json
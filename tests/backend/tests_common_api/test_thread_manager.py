@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import threading
+import time
+
+import pytest
+
+from ansys.aedt.toolkits.common.backend.api import Common
+from ansys.aedt.toolkits.common.backend.models import Properties
+from ansys.aedt.toolkits.common.backend.thread_manager import Job
+from ansys.aedt.toolkits.common.backend.thread_manager import ThreadManager
+from ansys.aedt.toolkits.common.utils import ToolkitJobState
+from ansys.aedt.toolkits.common.utils import ToolkitThreadStatus
+
+pytestmark = [pytest.mark.common_api]
+
+
+def wait_for_job(thread_manager, job_id, timeout=10.0):
+    job = thread_manager.wait_job(job_id, timeout=timeout)
+    assert job["state"] not in (ToolkitJobState.QUEUED.value, ToolkitJobState.RUNNING.value)
+    return job
+
+
+@pytest.fixture
+def thread_manager():
+    return ThreadManager(Properties())
+
+
+def test_job_result(thread_manager):
+    job_id = thread_manager.launch_thread(lambda a, b: a + b, 40, 2)
+    assert job_id
+    job = wait_for_job(thread_manager, job_id)
+    assert job["state"] == ToolkitJobState.FINISHED.value
+    assert job["result"] == 42
+    assert job["exception"] is None
+    assert job["timings"]["run_duration"] >= 0
+
+
+def test_job_exception(thread_manager):
+    def failing_process():
+        raise ValueError("Wrong value")
+
+    job = wait_for_job(thread_manager, thread_manager.launch_thread(failing_process))
+    assert job["state"] == ToolkitJobState.FAILED.value
+    assert "Wrong value" in job["exception"]
+    assert thread_manager.get_job("not_a_job") is None
+
+
+def test_jobs_fifo_and_cancel_queued(thread_manager):
+    release = threading.Event()
+    executed = []
+
+    first_id = thread_manager.launch_thread(lambda: release.wait(10) and executed.append("first"))
+    second_id = thread_manager.launch_thread(lambda: executed.append("second"))
+    third_id = thread_manager.launch_thread(lambda: executed.append("third"))
+    assert thread_manager.properties.is_toolkit_busy
+
+    assert thread_manager.cancel_job(second_id)
+    assert thread_manager.get_job(second_id)["state"] == ToolkitJobState.CANCELLED.value
+    release.set()
+
+    wait_for_job(thread_manager, first_id)
+    wait_for_job(thread_manager, third_id)
+    assert executed == ["first", "third"]
+    assert not thread_manager.cancel_job(third_id)
+    assert [job["job_id"] for job in thread_manager.get_jobs()] == [first_id, second_id, third_id]
+
+
+def test_cancel_running_job(thread_manager):
+    started = threading.Event()
+
+    def long_process():
+        started.set()
+        while not thread_manager.is_cancel_requested():
+            time.sleep(0.01)
+        return "stopped"
+
+    job_id = thread_manager.launch_thread(long_process)
+    assert started.wait(10)
+    assert thread_manager.cancel_job(job_id)
+    job = wait_for_job(thread_manager, job_id)
+    assert job["state"] == ToolkitJobState.CANCELLED.value
+    assert job["result"] == "stopped"
+
+
+def test_run_inline_keeps_running_job(thread_manager):
+    started = threading.Event()
+    release = threading.Event()
+
+    job_id = thread_manager.launch_thread(lambda: started.set() or release.wait(10) and "done")
+    assert started.wait(10)
+
+    # A job of another executor run inline does not replace the job of the toolkit thread
+    inline_job = Job(process=thread_manager.is_cancel_requested)
+    inline_job.cancel_event.set()
+    assert thread_manager.run_inline(inline_job, thread_manager.is_cancel_requested)
+    assert not thread_manager.is_cancel_requested()
+
+    assert thread_manager.cancel_job(job_id)
+    assert thread_manager.is_cancel_requested()
+    release.set()
+    job = wait_for_job(thread_manager, job_id)
+    assert job["state"] == ToolkitJobState.CANCELLED.value
+    assert job["result"] == "done"
+
+
+def test_wait_to_be_idle_latency():
+    """A no-op task must be waited for in milliseconds, not seconds."""
+    common = Common(Properties())
+    latencies = []
+    for _ in range(20):
+        start = time.perf_counter()
+        assert common.launch_thread(lambda: None)
+        assert common.wait_to_be_idle(timeout=5)
+        latencies.append(time.perf_counter() - start)
+    assert common.get_thread_status() == ToolkitThreadStatus.IDLE
+    assert max(latencies) < 0.2
+
+
+def test_wait_to_be_idle_timeout():
+    common = Common(Properties())
+    release = threading.Event()
+    common.launch_thread(release.wait, 10)
+    start = time.perf_counter()
+    assert not common.wait_to_be_idle(timeout=0.1)
+    assert time.perf_counter() - start < 1
+    assert common.get_thread_status() == ToolkitThreadStatus.BUSY
+    release.set()
+    assert common.wait_to_be_idle(timeout=5)
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import json
+import os
+import tempfile
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from ansys.aedt.toolkits.common.backend.api import AEDTCommon
+from ansys.aedt.toolkits.common.backend.models import Properties
+from ansys.aedt.toolkits.common.backend.rest_api import app
+from ansys.aedt.toolkits.common.backend.tracing import TracedObject
+from ansys.aedt.toolkits.common.backend.tracing import Tracer
+from ansys.aedt.toolkits.common.backend.tracing import tracer
+
+pytestmark = [pytest.mark.common_api]
+
+GRPC_PORT = 50051
+
+
+@pytest.fixture(autouse=True)
+def clear_traces():
+    tracer.clear()
+    yield
+    tracer.clear()
+
+
+def span_names(span):
+    return [span["name"]] + [name for child in span["children"] for name in span_names(child)]
+
+
+def desktop_mock(tmp_path):
+    desktop = MagicMock(port=GRPC_PORT, aedt_process_id=os.getpid())
+    oproject = MagicMock()
+    oproject.GetName.return_value = "project"
+    oproject.GetPath.return_value = str(tmp_path)
+    oproject.GetChildNames.return_value = ["HFSS1"]
+    desktop.odesktop.GetProjectList.return_value = ["project"]
+    desktop.active_project.return_value = oproject
+    desktop.active_design.return_value.GetName.return_value = "HFSS1"
+    return desktop
+
+
+def test_nested_spans(tmp_path):
+    trace_file = str(tmp_path / "traces.json")
+    test_tracer = Tracer(max_traces=2, trace_file=trace_file)
+    with test_tracer.span("phase", arguments="'project'"):
+        with test_tracer.span("odesktop.GetProjectList") as span:
+            span.attributes["result"] = "['project']"
+        with pytest.raises(ValueError):
+            with test_tracer.span("odesktop.OpenProject"):
+                raise ValueError("Project not found")
+
+    traces = test_tracer.traces()
+    assert len(traces) == 1
+    assert span_names(traces[0]) == ["phase", "odesktop.GetProjectList", "odesktop.OpenProject"]
+    assert traces[0]["attributes"] == {"arguments": "'project'"}
+    assert traces[0]["outcome"] == "ok"
+    assert traces[0]["children"][1]["outcome"] == "error: ValueError('Project not found')"
+    assert traces[0]["duration"] >= sum(child["duration"] for child in traces[0]["children"])
+
+    # The trace file can be loaded in the Chrome trace viewer
+    with open(trace_file, encoding="utf-8") as file:
+        events = json.load(file)["traceEvents"]
+    assert [event["name"] for event in events] == span_names(traces[0])
+    assert all(event["ph"] == "X" and event["pid"] == os.getpid() for event in events)
+    assert (
+        events[0]["ts"] <= events[1]["ts"] <= events[1]["ts"] + events[1]["dur"] <= events[0]["ts"] + events[0]["dur"]
+    )
+    assert events[1]["args"] == {"result": "['project']", "outcome": "ok"}
+
+    # Only the last traces are kept
+    for name in ("second", "third"):
+        with test_tracer.span(name):
+            pass
+    assert [trace["name"] for trace in test_tracer.traces()] == ["second", "third"]
+    test_tracer.configure(max_traces=1)
+    assert [trace["name"] for trace in test_tracer.traces()] == ["third"]
+
+
+def test_traced_aedt_calls(tmp_path):
+    desktop = desktop_mock(tmp_path)
+    properties = Properties(selected_process=GRPC_PORT, trace_aedt_calls=True, toolkit_name="test_tracing")
+    toolkit = AEDTCommon(properties)
+    with patch("ansys.aedt.core.Desktop", return_value=desktop):
+        assert toolkit.open_project(str(tmp_path / "project.aedt"))
+
+    trace = tracer.traces()[-1]
+    assert span_names(trace) == [
+        "open_project",
+        "connect_aedt",
+        "Desktop",
+        "odesktop.OpenProject",
+        "save_project_info",
+        "odesktop.GetProjectList",
+        "oproject.GetName",
+        "oproject.GetChildNames",
+        "oproject.GetPath",
+        "oproject.GetPath",
+        "release_aedt",
+    ]
+    assert trace["attributes"]["result"] == "True"
+    open_project_call = trace["children"][1]
+    assert open_project_call["attributes"]["arguments"] == repr(str(tmp_path / "project.aedt"))
+
+    with open(os.path.join(tempfile.gettempdir(), "test_tracing_aedt_traces.json"), encoding="utf-8") as file:
+        assert json.load(file)["traceEvents"][0]["name"] == "open_project"
+
+    # Without tracing, the AEDT objects are not wrapped
+    tracer.clear()
+    properties.trace_aedt_calls = False
+    with patch("ansys.aedt.core.Desktop", return_value=desktop):
+        assert toolkit.open_project(str(tmp_path / "project.aedt"))
+    assert tracer.traces() == []
+    assert not isinstance(desktop.active_design.call_args[0][0], TracedObject)
+    toolkit.release_aedt(force=True)
+
+
+def test_traces_endpoint():
+    with tracer.span("connect_design"):
+        with tracer.span("odesktop.GetActiveProject"):
+            pass
+    client = app.test_client()
+
+    response = client.get("/debug/traces")
+    assert response.status_code == 200
+    assert span_names(response.json[-1]) == ["connect_design", "odesktop.GetActiveProject"]
+
+    response = client.get("/debug/traces?format=chrome")
+    assert response.status_code == 200
+    assert [event["name"] for event in response.json["traceEvents"]] == ["connect_design", "odesktop.GetActiveProject"]
+
+    assert client.get("/debug/traces?format=xml").status_code == 400
+
+
+def test_traced_object_call():
+    odesktop = MagicMock()
+    odesktop.GetProjectList.return_value = ["project"]
+    odesktop.version = "2024.2"
+    test_tracer = Tracer(max_traces=5)
+    traced_odesktop = TracedObject(odesktop, "odesktop", test_tracer)
+
+    # The call returns the result of the wrapped method and records one span
+    assert traced_odesktop.GetProjectList("arg", active=True) == ["project"]
+    odesktop.GetProjectList.assert_called_once_with("arg", active=True)
+    traces = test_tracer.traces()
+    assert len(traces) == 1
+    assert traces[0]["name"] == "odesktop.GetProjectList"
+    assert traces[0]["outcome"] == "ok"
+    assert traces[0]["children"] == []
+
+    # Attributes are not traced
+    assert traced_odesktop.version == "2024.2"
+    assert len(test_tracer.traces()) == 1
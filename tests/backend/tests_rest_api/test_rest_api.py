@@ -113,3 +113,13 @@ class TestRESTAPI:
     def test_12_get_aedt_model(self, client):
         response = client.get("/get_aedt_model", json={})
         assert response.status_code == 200
+
+    def test_13_jobs(self, client):
+        response = client.get("/jobs")
+        assert response.status_code == 200
+        data = json.loads(response.data.decode("utf-8"))
+        assert isinstance(data, list)
+        response = client.get("/jobs/unknown_job")
+        assert response.status_code == 404
+        response = client.post("/jobs/unknown_job/cancel")
+        assert response.status_code == 404
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import multiprocessing
+import threading
+import time
+import wsgiref.simple_server
+
+import pytest
+import requests
+
+from ansys.aedt.toolkits.common.backend.multithreading_server import InProcessServer
+from ansys.aedt.toolkits.common.backend.multithreading_server import KeepAliveWSGIRequestHandler
+from ansys.aedt.toolkits.common.backend.multithreading_server import MultithreadingServer
+from ansys.aedt.toolkits.common.backend.multithreading_server import ThreadingWSGIServer
+from ansys.aedt.toolkits.common.ui.actions_generic import BackendSession
+from ansys.aedt.toolkits.common.utils import find_free_port
+
+pytestmark = [pytest.mark.server]
+
+URL = "http://127.0.0.1:5001"
+LAUNCH_AEDT_REQUESTS = [
+    ("GET", "/status"),
+    ("GET", "/health"),
+    ("GET", "/properties"),
+    ("PUT", "/properties"),
+    ("POST", "/launch_aedt"),
+]
+"""Requests sent by the UI when the user launches AEDT."""
+STARTUP_TIMEOUT = 60
+
+
+class QuietKeepAliveHandler(KeepAliveWSGIRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+def thread_app(environ, start_response):
+    """WSGI application answering with the request body and the name of the thread serving it."""
+    body = environ["wsgi.input"].read(int(environ.get("CONTENT_LENGTH") or 0))
+    start_response("200 OK", [("Content-Type", "application/json")])
+    if environ["PATH_INFO"] == "/stream":
+        stop = environ["QUERY_STRING"] == "block"
+
+        def stream():
+            yield b"first\n"
+            # Waits like the event stream between two keep-alive comments
+            time.sleep(5 if stop else 0)
+            yield b"second\n"
+
+        return stream()
+    return [threading.current_thread().name.encode(), b" ", body]
+
+
+def run_rest_api(port):
+    """Run the common backend in a separate process, as ``run_toolkit.py`` does."""
+    from ansys.aedt.toolkits.common.backend.rest_api import app
+
+    MultithreadingServer().run(host="127.0.0.1", port=port, app=app)
+
+
+def wait_health(client, url):
+    end_time = time.time() + STARTUP_TIMEOUT
+    while time.time() < end_time:
+        try:
+            if client.get(url + "/health", timeout=1).ok:
+                return True
+        except requests.exceptions.RequestException:
+            time.sleep(0.05)
+    return False
+
+
+@pytest.fixture
+def in_process_server():
+    server = InProcessServer(thread_app)
+    server.start()
+    yield server
+    server.shutdown()
+
+
+def test_in_process_routes(in_process_server):
+    session = BackendSession(app=in_process_server)
+    caller = threading.current_thread().name
+
+    # Routes that can touch AEDT run one by one on the dedicated thread
+    response = session.post(URL + "/open_project", data="project.aedt")
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "application/json"
+    assert response.content == b"AEDT_Worker project.aedt"
+
+    response = session.put(URL + "/properties", json={"active_project": "project"})
+    assert response.content == b'AEDT_Worker {"active_project": "project"}'
+
+    # Read-only routes run on the thread of the caller
+    response = session.get(URL + "/status")
+    assert response.content == f"{caller} ".encode()
+
+    response = session.get(URL + "/stream", stream=True)
+    assert list(response.iter_lines()) == [b"first", b"second"]
+
+
+def test_in_process_stream_shutdown(in_process_server):
+    """Shutting down a streamed response interrupts a blocked read, as over HTTP."""
+    session = BackendSession(app=in_process_server)
+    response = session.get(URL + "/stream?block", stream=True)
+    lines = response.iter_lines(chunk_size=1)
+    assert next(lines) == b"first"
+
+    threading.Timer(0.2, response.raw.shutdown).start()
+    start = time.perf_counter()
+    assert list(lines) == []
+    assert time.perf_counter() - start < 2
+    response.close()
+
+
+def test_in_process_call_latency(in_process_server):
+    """Benchmark the latency of the requests sent to launch AEDT, over HTTP and in process."""
+    executor = InProcessServer(thread_app)
+    executor.start()
+    httpd = wsgiref.simple_server.make_server(
+        "127.0.0.1", 0, app=executor, server_class=ThreadingWSGIServer, handler_class=QuietKeepAliveHandler
+    )
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    actions = 50
+
+    results = {}
+    clients = [
+        ("http", BackendSession(), f"http://127.0.0.1:{httpd.server_port}"),
+        ("in process", BackendSession(app=in_process_server), URL),
+    ]
+    try:
+        for name, client, url in clients:
+            start = time.perf_counter()
+            for _ in range(actions):
+                for method, endpoint in LAUNCH_AEDT_REQUESTS:
+                    kwargs = {"json": {"state": "Launching"}} if method == "PUT" else {}
+                    assert client.request(method, url + endpoint, **kwargs).ok
+            results[name] = (time.perf_counter() - start) / actions / len(LAUNCH_AEDT_REQUESTS)
+            print(f"{name}: {results[name] * 1e6:.0f} us per call")
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+        executor.shutdown()
+
+    assert results["in process"] < results["http"]
+
+
+def test_in_process_startup_time():
+    """Benchmark the time until the common backend answers, in a separate process and in process."""
+    port = find_free_port("127.0.0.1", 5101)
+    start = time.perf_counter()
+    process = multiprocessing.get_context("spawn").Process(target=run_rest_api, args=(port,), daemon=True)
+    process.start()
+    try:
+        assert wait_health(BackendSession(), f"http://127.0.0.1:{port}")
+        process_startup = time.perf_counter() - start
+    finally:
+        process.terminate()
+        process.join()
+
+    start = time.perf_counter()
+    from ansys.aedt.toolkits.common.backend.rest_api import app
+
+    server = InProcessServer(app)
+    server.start()
+    try:
+        assert wait_health(BackendSession(app=server), URL)
+        in_process_startup = time.perf_counter() - start
+    finally:
+        server.shutdown()
+
+    print(f"Backend startup: separate process {process_startup:.2f} s, in process {in_process_startup:.2f} s")
+    assert in_process_startup < process_startup
@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import http.client
+import os
+import socket
+import threading
+import time
+import urllib.request
+import wsgiref.simple_server
+
+import pytest
+import requests
+
+from ansys.aedt.toolkits.common.backend.multithreading_server import KeepAliveWSGIRequestHandler
+from ansys.aedt.toolkits.common.backend.multithreading_server import SingleThreadResponseExecutor
+from ansys.aedt.toolkits.common.backend.multithreading_server import ThreadingWSGIServer
+from ansys.aedt.toolkits.common.backend.multithreading_server import UnixWSGIServer
+from ansys.aedt.toolkits.common.ui.actions_generic import BackendSession
+
+pytestmark = [pytest.mark.server]
+
+SLOW_CALL_DURATION = 2.0
+LAUNCH_AEDT_REQUESTS = [
+    ("GET", "/status"),
+    ("GET", "/health"),
+    ("GET", "/properties"),
+    ("PUT", "/properties"),
+    ("POST", "/launch_aedt"),
+]
+"""Requests sent by the UI when the user launches AEDT."""
+
+
+class QuietHandler(wsgiref.simple_server.WSGIRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+class QuietKeepAliveHandler(KeepAliveWSGIRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+class CountingWSGIServer(ThreadingWSGIServer):
+    """Server counting the connections it accepts."""
+
+    connections = 0
+
+    def process_request(self, request, client_address):
+        self.connections += 1
+        super().process_request(request, client_address)
+
+
+def toy_app(environ, start_response):
+    """WSGI application with a fast read-only route, a slow mutating route and a streamed route."""
+    if environ["PATH_INFO"] in ("/open_project", "/wait_thread"):
+        time.sleep(SLOW_CALL_DURATION)
+    start_response("200 OK", [("Content-Type", "application/json")])
+    if environ["PATH_INFO"] == "/stream":
+        return (chunk for chunk in [b'"o', b'k"'])
+    return [b'"ok"']
+
+
+@pytest.fixture
+def server_url():
+    executor = SingleThreadResponseExecutor(toy_app)
+    httpd = wsgiref.simple_server.make_server(
+        "127.0.0.1", 0, app=executor, server_class=ThreadingWSGIServer, handler_class=QuietHandler
+    )
+    server_thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    server_thread.start()
+    main_thread = threading.Thread(target=executor.execute_responses_on_this_thread, daemon=True)
+    main_thread.start()
+
+    yield f"http://127.0.0.1:{httpd.server_port}"
+
+    executor.shutdown()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def keep_alive_server():
+    executor = SingleThreadResponseExecutor(toy_app)
+    httpd = wsgiref.simple_server.make_server(
+        "127.0.0.1", 0, app=executor, server_class=CountingWSGIServer, handler_class=QuietKeepAliveHandler
+    )
+    server_thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    server_thread.start()
+    main_thread = threading.Thread(target=executor.execute_responses_on_this_thread, daemon=True)
+    main_thread.start()
+
+    yield httpd
+
+    executor.shutdown()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def unix_socket_server(tmp_path):
+    if not hasattr(socket, "AF_UNIX"):
+        pytest.skip("Unix domain sockets are not available.")
+    executor = SingleThreadResponseExecutor(toy_app)
+    httpd = UnixWSGIServer(str(tmp_path / "backend.sock"), QuietKeepAliveHandler)
+    httpd.set_app(executor)
+    server_thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    server_thread.start()
+    main_thread = threading.Thread(target=executor.execute_responses_on_this_thread, daemon=True)
+    main_thread.start()
+
+    yield httpd
+
+    executor.shutdown()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def p99_status_latency(url, samples=100):
+    latencies = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        with urllib.request.urlopen(url + "/status", timeout=10) as response:
+            response.read()
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return latencies[int(0.99 * (len(latencies) - 1))]
+
+
+def test_is_concurrent():
+    executor = SingleThreadResponseExecutor(toy_app)
+    assert executor.is_concurrent({"REQUEST_METHOD": "GET", "PATH_INFO": "/status"})
+    assert executor.is_concurrent({"REQUEST_METHOD": "GET", "PATH_INFO": "/properties/"})
+    assert not executor.is_concurrent({"REQUEST_METHOD": "PUT", "PATH_INFO": "/properties"})
+    assert not executor.is_concurrent({"REQUEST_METHOD": "POST", "PATH_INFO": "/open_project"})
+    assert executor.is_concurrent({"REQUEST_METHOD": "GET", "PATH_INFO": "/jobs/1234"})
+    assert executor.is_concurrent({"REQUEST_METHOD": "POST", "PATH_INFO": "/jobs/1234/cancel"})
+    assert not executor.is_concurrent({"REQUEST_METHOD": "POST", "PATH_INFO": "/jobs/1234"})
+    executor.shutdown()
+
+
+def test_status_latency_with_slow_call_in_flight(server_url):
+    """Benchmark the p99 ``/status`` latency while a slow mutating call is running."""
+    idle_p99 = p99_status_latency(server_url)
+
+    slow_call = threading.Thread(
+        target=lambda: urllib.request.urlopen(
+            urllib.request.Request(server_url + "/open_project", data=b"project", method="POST"), timeout=10
+        ).read()
+    )
+    slow_call.start()
+    time.sleep(0.1)
+    start = time.perf_counter()
+    busy_p99 = p99_status_latency(server_url)
+    elapsed = time.perf_counter() - start
+    slow_call.join()
+
+    print(f"p99 /status latency: idle {idle_p99 * 1000:.2f} ms, slow call in flight {busy_p99 * 1000:.2f} ms")
+    assert elapsed < SLOW_CALL_DURATION
+    assert busy_p99 < SLOW_CALL_DURATION / 10
+
+
+def test_status_latency_with_waiters_in_flight(server_url):
+    """Benchmark the p99 ``/status`` latency while clients wait on the blocking concurrent routes."""
+    idle_p99 = p99_status_latency(server_url)
+
+    waiters = [
+        threading.Thread(target=lambda: urllib.request.urlopen(server_url + "/wait_thread", timeout=10).read())
+        for _ in range(8)
+    ]
+    for waiter in waiters:
+        waiter.start()
+    time.sleep(0.1)
+    start = time.perf_counter()
+    busy_p99 = p99_status_latency(server_url)
+    elapsed = time.perf_counter() - start
+    for waiter in waiters:
+        waiter.join()
+
+    print(f"p99 /status latency: idle {idle_p99 * 1000:.2f} ms, 8 waiters in flight {busy_p99 * 1000:.2f} ms")
+    assert elapsed < SLOW_CALL_DURATION
+    assert busy_p99 < SLOW_CALL_DURATION / 10
+
+
+def test_keep_alive(keep_alive_server):
+    connection = http.client.HTTPConnection("127.0.0.1", keep_alive_server.server_port, timeout=10)
+    # The body is not read by the application, it must not be taken for the next request
+    connection.request("PUT", "/properties", body=b'{"state": "unread"}')
+    response = connection.getresponse()
+    assert response.read() == b'"ok"'
+    assert response.version == 11
+    assert response.getheader("Connection") is None
+
+    connection.request("GET", "/status")
+    assert connection.getresponse().read() == b'"ok"'
+
+    # Streamed responses have no length, so they end with the connection
+    connection.request("GET", "/stream")
+    response = connection.getresponse()
+    assert response.getheader("Connection") == "close"
+    assert response.read() == b'"ok"'
+    connection.close()
+
+    connection.request("GET", "/status")
+    assert connection.getresponse().read() == b'"ok"'
+    connection.close()
+    assert keep_alive_server.connections == 2
+
+
+def test_connections_per_ui_action(keep_alive_server):
+    """Benchmark the connections opened and the latency of the requests sent to launch AEDT."""
+    url = f"http://127.0.0.1:{keep_alive_server.server_port}"
+    actions = 20
+
+    def launch_aedt(client):
+        for method, endpoint in LAUNCH_AEDT_REQUESTS:
+            kwargs = {"json": {"state": "Launching"}} if method == "PUT" else {}
+            response = client.request(method, url + endpoint, timeout=10, **kwargs)
+            assert response.ok
+
+    results = {}
+    for name, client in [("new connection per request", requests), ("pooled session", BackendSession())]:
+        keep_alive_server.connections = 0
+        start = time.perf_counter()
+        for _ in range(actions):
+            launch_aedt(client)
+        results[name] = (keep_alive_server.connections / actions, (time.perf_counter() - start) / actions)
+        print(f"{name}: {results[name][0]:.2f} connections and {results[name][1] * 1000:.2f} ms per action")
+
+    assert results["new connection per request"][0] == len(LAUNCH_AEDT_REQUESTS)
+    assert results["pooled session"][0] == 1 / actions
+
+
+def test_unix_socket(unix_socket_server):
+    path = unix_socket_server.server_address
+    assert oct(os.stat(path).st_mode & 0o777) == oct(0o600)
+
+    session = BackendSession(unix_socket=path)
+    # The host and port of the URL are not used
+    assert session.put("http://127.0.0.1:5001/properties", json={"state": "unread"}).content == b'"ok"'
+    assert session.get("http://localhost/stream").content == b'"ok"'
+
+    # The socket file is removed when the server is closed
+    unix_socket_server.server_close()
+    assert not os.path.exists(path)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        BackendSession(unix_socket=path, retries=0).get("http://localhost/status")
+
+
+def test_requests_not_sent_again_after_read_timeout():
+    """A request that times out while the backend runs it must not queue the same work again."""
+    received = []
+
+    def slow_export_app(environ, start_response):
+        received.append(environ["PATH_INFO"])
+        time.sleep(1.0)
+        start_response("200 OK", [("Content-Type", "application/json")])
+        return [b'"ok"']
+
+    httpd = wsgiref.simple_server.make_server(
+        "127.0.0.1", 0, app=slow_export_app, server_class=ThreadingWSGIServer, handler_class=QuietHandler
+    )
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    try:
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            BackendSession().get(f"http://127.0.0.1:{httpd.server_port}/get_aedt_model", timeout=0.2)
+        time.sleep(0.5)
+        assert received == ["/get_aedt_model"]
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_unix_socket_latency(keep_alive_server, unix_socket_server):
+    """Benchmark the latency of the requests sent to launch AEDT, over TCP and over a Unix domain socket."""
+    actions = 50
+    clients = [
+        ("tcp", BackendSession(), f"http://127.0.0.1:{keep_alive_server.server_port}"),
+        ("unix socket", BackendSession(unix_socket=unix_socket_server.server_address), "http://localhost"),
+    ]
+
+    results = {}
+    for name, client, url in clients:
+        start = time.perf_counter()
+        for _ in range(actions):
+            for method, endpoint in LAUNCH_AEDT_REQUESTS:
+                kwargs = {"json": {"state": "Launching"}} if method == "PUT" else {}
+                assert client.request(method, url + endpoint, timeout=10, **kwargs).ok
+        results[name] = (time.perf_counter() - start) / actions / len(LAUNCH_AEDT_REQUESTS)
+        print(f"{name}: {results[name] * 1e6:.0f} us per request")
+
+    assert results["unix socket"] < results["tcp"]
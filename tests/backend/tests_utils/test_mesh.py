@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import numpy as np
+import pytest
+
+from ansys.aedt.toolkits.common.mesh import apply_lod
+from ansys.aedt.toolkits.common.mesh import decimate
+from ansys.aedt.toolkits.common.mesh import iter_mesh_frames
+from ansys.aedt.toolkits.common.mesh import iter_mesh_stream
+from ansys.aedt.toolkits.common.mesh import read_mesh_stream
+from ansys.aedt.toolkits.common.mesh import read_obj
+from ansys.aedt.toolkits.common.mesh import triangulate
+from ansys.aedt.toolkits.common.mesh import write_obj
+
+pytestmark = [pytest.mark.utils]
+
+OBJ_CONTENT = """# Exported model
+g box
+v 0.0 0.0 0.0
+v 1.0 0.0 0.0
+v 1.0 1.0 0.0
+vn 0.0 0.0 1.0
+v 0.0 1.0 0.0
+f 1//1 2//1 3//1
+f 1/1/1 3/3/1 4/4/1
+usemtl red
+f -4 -3 -2 -1
+"""
+
+
+def grid_mesh(name, size=1.0, resolution=40, origin=(0.0, 0.0, 0.0)):
+    """Create a square surface split in ``2 * resolution**2`` triangles."""
+    x, y = np.meshgrid(np.linspace(0, size, resolution + 1), np.linspace(0, size, resolution + 1))
+    points = np.stack([x.ravel(), y.ravel(), np.zeros(x.size)], axis=1) + origin
+    index = np.arange(x.size).reshape(x.shape)
+    corners = index[:-1, :-1].ravel(), index[:-1, 1:].ravel(), index[1:, 1:].ravel(), index[1:, :-1].ravel()
+    triangles = np.concatenate([np.stack(corners[:3], axis=1), np.stack([corners[0], corners[2], corners[3]], axis=1)])
+    return {
+        "name": name,
+        "points": points.astype(np.float32),
+        "offsets": np.arange(0, 3 * len(triangles) + 1, 3, dtype=np.int32),
+        "connectivity": triangles.ravel().astype(np.int32),
+        "color": [0, 0, 255],
+        "opacity": 1.0,
+    }
+
+
+def test_read_obj(tmp_path):
+    file_path = tmp_path / "box.obj"
+    file_path.write_text(OBJ_CONTENT)
+    points, offsets, connectivity = read_obj(str(file_path))
+    assert points.dtype == np.float32
+    assert points.shape == (4, 3)
+    assert offsets.tolist() == [0, 3, 6, 10]
+    assert connectivity.tolist() == [0, 1, 2, 0, 2, 3, 0, 1, 2, 3]
+
+
+def test_read_obj_triangles(tmp_path):
+    file_path = tmp_path / "triangles.obj"
+    file_path.write_text("v 0 0 0\nv 1 0 0\nv 0 1 0\nv 1 1 0\nf 1 2 3\nf 2 4 3")
+    points, offsets, connectivity = read_obj(str(file_path))
+    assert offsets.tolist() == [0, 3, 6]
+    assert connectivity.tolist() == [0, 1, 2, 1, 3, 2]
+
+
+def test_mesh_stream_round_trip():
+    meshes = [
+        {
+            "name": "box",
+            "points": np.random.rand(5, 3).astype(np.float32),
+            "offsets": np.array([0, 3, 7]),
+            "connectivity": np.array([0, 1, 2, 1, 2, 3, 4]),
+            "color": [255, 0, 0],
+            "opacity": 0.5,
+        },
+        {
+            "name": "empty",
+            "points": np.zeros((0, 3)),
+            "offsets": np.array([0]),
+            "connectivity": np.array([]),
+            "color": None,
+            "opacity": 1.0,
+        },
+    ]
+    data = b"".join(iter_mesh_stream(meshes))
+    received = read_mesh_stream(data)
+
+    assert [mesh["name"] for mesh in received] == ["box", "empty"]
+    for sent, mesh in zip(meshes, received):
+        for key in ("points", "offsets", "connectivity"):
+            assert np.array_equal(mesh[key], sent[key])
+        assert mesh["color"] == sent["color"]
+        assert mesh["opacity"] == sent["opacity"]
+    # Arrays are views on the received buffer
+    assert not received[0]["points"].flags.owndata
+
+    with pytest.raises(ValueError):
+        read_mesh_stream(data[:-1])
+    with pytest.raises(ValueError):
+        read_mesh_stream(b"not a mesh")
+
+
+def test_mesh_frames_chunks():
+    meshes = [dict(grid_mesh("coarse", resolution=2), preview=True), grid_mesh("full", resolution=5)]
+    data = b"".join(iter_mesh_stream(meshes))
+    received = list(iter_mesh_frames(data[i : i + 50] for i in range(0, len(data), 50)))
+    assert [(mesh["name"], mesh["preview"]) for mesh in received] == [("coarse", True), ("full", False)]
+    assert np.array_equal(received[1]["connectivity"], meshes[1]["connectivity"])
+
+    with pytest.raises(ValueError):
+        list(iter_mesh_frames([data[:-1]]))
+
+
+def test_triangulate():
+    triangles = triangulate(np.array([0, 3, 8]), np.array([0, 1, 2, 3, 4, 5, 6, 7]))
+    assert triangles.tolist() == [[0, 1, 2], [3, 4, 5], [3, 5, 6], [3, 6, 7]]
+
+
+def test_write_obj(tmp_path):
+    mesh = grid_mesh("grid", resolution=3)
+    file_path = str(tmp_path / "grid.obj")
+    write_obj(file_path, mesh["points"], mesh["offsets"], mesh["connectivity"])
+    points, offsets, connectivity = read_obj(file_path)
+    assert np.allclose(points, mesh["points"])
+    assert np.array_equal(offsets, mesh["offsets"])
+    assert np.array_equal(connectivity, mesh["connectivity"])
+
+
+def test_decimate():
+    mesh = grid_mesh("grid", resolution=40)
+    points, offsets, connectivity = decimate(mesh["points"], mesh["offsets"], mesh["connectivity"], 0.1)
+    triangles = len(offsets) - 1
+    assert 0.5 * 320 <= triangles <= 320
+    assert connectivity.max() < len(points)
+    assert np.allclose(points[:, 2], 0)
+
+
+def test_apply_lod():
+    meshes = [
+        grid_mesh("large", resolution=40),
+        grid_mesh("screw_1", size=0.01, resolution=2, origin=(0.5, 0.5, 0.0)),
+        grid_mesh("screw_2", size=0.01, resolution=2, origin=(0.2, 0.5, 0.0)),
+    ]
+    assert apply_lod(meshes) == meshes
+
+    reduced = apply_lod(meshes, merge_tiny_objects=0.05)
+    assert [mesh["name"] for mesh in reduced] == ["large", "merged_objects_0"]
+    assert len(reduced[1]["points"]) == 2 * len(meshes[1]["points"])
+    assert len(reduced[1]["offsets"]) - 1 == 2 * (len(meshes[1]["offsets"]) - 1)
+
+    reduced = apply_lod(meshes, triangle_budget=1000)
+    assert sum(len(mesh["offsets"]) - 1 for mesh in reduced) <= 1000
+
+    reduced = apply_lod(meshes, decimation_ratio={"large": 0.5})
+    assert len(reduced[0]["offsets"]) - 1 <= 1600
+    assert reduced[1] is meshes[1]
@@ -24,10 +24,14 @@ import pytest
 
 pytestmark = [pytest.mark.utils]
 
+import os
+import socket
+import stat
 import threading
 from unittest.mock import patch, MagicMock
 
 from ansys.aedt.toolkits.common.utils import run_command, server_actions, wait_for_server, find_free_port
+from ansys.aedt.toolkits.common.utils import get_runtime_dir, remove_unix_socket, unix_socket_path
 
 
 @pytest.fixture
@@ -77,3 +81,33 @@ def test_find_free_port():
     assert isinstance(find_free_port(server='localhost', start_port=5001), int)
 
     assert isinstance(find_free_port(), int)
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets are not available.")
+def test_unix_socket_path(tmp_path, monkeypatch):
+    """Test the Unix domain sockets are created in a directory accessible only by the user."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    path = unix_socket_path("toolkit-1234")
+
+    assert os.path.dirname(path) == get_runtime_dir() == str(tmp_path / "pyaedt-toolkits")
+    assert stat.S_IMODE(os.stat(get_runtime_dir()).st_mode) == 0o700
+
+    os.chmod(get_runtime_dir(), 0o755)
+    with pytest.raises(PermissionError):
+        get_runtime_dir()
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets are not available.")
+def test_remove_unix_socket(tmp_path):
+    """Test only socket files are removed."""
+    path = str(tmp_path / "backend.sock")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.bind(path)
+    remove_unix_socket(path)
+    assert not os.path.exists(path)
+    remove_unix_socket(path)
+
+    regular_file = tmp_path / "backend.log"
+    regular_file.write_text("log")
+    remove_unix_socket(str(regular_file))
+    assert regular_file.exists()
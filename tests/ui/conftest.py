@@ -24,8 +24,11 @@
 
 from unittest.mock import patch
 
+from PySide6.QtWidgets import QApplication
 import pytest
 
+from ansys.aedt.toolkits.common.ui.actions_generic import FrontendGeneric
+
 INSTALLED_VERSIONS = ["2026.1"]
 MOCK_PROPERTIES = {
     "version": "0.1",
@@ -48,3 +51,7 @@ def patched_window_methods():
           patch("ansys.aedt.toolkits.common.ui.actions_generic.FrontendGeneric.set_properties",
                 return_value=None)):
         yield
+        # Calls still running in the backend worker thread must see the patched methods
+        for widget in QApplication.topLevelWidgets():
+            if isinstance(widget, FrontendGeneric):
+                widget.backend_client.wait(timeout=10)
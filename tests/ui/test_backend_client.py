@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import threading
+import time
+
+from ansys.aedt.toolkits.common.ui.actions_generic import AsyncBackendClient
+
+
+def test_callback_runs_in_gui_thread(qtbot):
+    """The call runs in the worker thread and its result is delivered in the GUI thread."""
+    client = AsyncBackendClient()
+    gui_thread = threading.current_thread()
+    calls = []
+
+    def slow_call(value):
+        time.sleep(0.5)
+        return value, threading.current_thread()
+
+    start = time.perf_counter()
+    future = client.submit(slow_call, 1, callback=lambda result: calls.append((result, threading.current_thread())))
+    # The GUI thread does not wait for the backend
+    assert time.perf_counter() - start < 0.1
+    assert not future.done()
+
+    qtbot.waitUntil(lambda: len(calls) == 1, timeout=5000)
+    (value, call_thread), callback_thread = calls[0]
+    assert value == 1
+    assert call_thread is not gui_thread
+    assert callback_thread is gui_thread
+    client.shutdown()
+
+
+def test_calls_run_in_order(qtbot):
+    """The calls reach the backend in the order they are submitted."""
+    client = AsyncBackendClient()
+    calls = []
+    results = []
+
+    def call(value):
+        time.sleep(0.01 * (5 - value))
+        calls.append(value)
+        return value
+
+    for value in range(5):
+        client.submit(call, value, callback=results.append)
+
+    assert client.wait(timeout=5)
+    assert calls == list(range(5))
+    qtbot.waitUntil(lambda: len(results) == 5, timeout=5000)
+    assert results == list(range(5))
+    client.shutdown()
+
+
+def test_error_callback(qtbot):
+    """The exceptions raised by a call are delivered to the error callback in the GUI thread."""
+    client = AsyncBackendClient()
+    errors = []
+
+    def failing_call():
+        raise ValueError("Backend not available")
+
+    future = client.submit(failing_call, callback=lambda result: errors.append(result), error_callback=errors.append)
+
+    qtbot.waitUntil(lambda: len(errors) == 1, timeout=5000)
+    assert isinstance(errors[0], ValueError)
+    assert future.exception() is errors[0]
+    client.shutdown()
+
+
+def test_run_in_gui_thread(qtbot):
+    """Functions called from the worker thread run in the GUI thread."""
+    client = AsyncBackendClient()
+    gui_thread = threading.current_thread()
+    threads = []
+
+    client.submit(client.run_in_gui_thread, lambda: threads.append(threading.current_thread()))
+
+    qtbot.waitUntil(lambda: len(threads) == 1, timeout=5000)
+    assert threads == [gui_thread]
+    client.shutdown()
@@ -44,7 +44,7 @@ def test_windows_default_values(patched_window_methods, qtbot):
     assert multiplier.text() == "1"
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 @patch.object(PyLogger, "log")
 def test_windows_create_geometry_with_default_values(mock_log, mock_post, patched_window_methods, qtbot, caplog):
     """Test the creation of geometry with default values in the geometry menu."""
@@ -87,7 +87,7 @@ def test_windows_create_geometry_backend_busy(mock_log, patched_window_methods,
     assert any("Toolkit running" in call.args[0] for call in mock_log.call_args_list)
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 @patch.object(PyLogger, "log")
 @patch("examples.toolkit.pyaedt_toolkit.ui.run_frontend.ApplicationWindow.get_properties")
 def test_geometry_button_clicked_no_active_project(mock_get_properties,
@@ -22,17 +22,35 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from unittest.mock import patch
 from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QWidget
+from examples.toolkit.pyaedt_toolkit.ui.run_frontend import ApplicationWindow
+import numpy as np
 
+from ansys.aedt.toolkits.common.mesh import iter_mesh_stream
 from ansys.aedt.toolkits.common.ui.utils.widgets.py_logger.py_logger import PyLogger
-from examples.toolkit.pyaedt_toolkit.ui.run_frontend import ApplicationWindow
-from PySide6.QtCore import Qt
 
 DEFAULT_URL = "http://127.0.0.1:5001"
 
 
+def mesh_stream_response():
+    mesh = {
+        "name": "triangle",
+        "points": np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0]], dtype=np.float32),
+        "offsets": np.array([0, 3], dtype=np.int32),
+        "connectivity": np.array([0, 1, 2], dtype=np.int32),
+        "color": [255, 0, 0],
+        "opacity": 0.5,
+    }
+    response = MagicMock()
+    response.content = b"".join(iter_mesh_stream([dict(mesh, preview=True), mesh]))
+    response.iter_content.return_value = [response.content]
+    return response
+
+
 class PyVistaBackendMock:
     def __init__(self, *args, **kwargs):
         super().__init__()
@@ -53,31 +71,37 @@ class SceneMock(QWidget):
         self.set_background = MagicMock()
         self.add_axes_at_origin = MagicMock()
         self.show_grid = MagicMock()
+        self.add_mesh = MagicMock()
 
 
-@patch("examples.toolkit.pyaedt_toolkit.ui.windows.plot_design.plot_design_menu.PyVistaBackend",
-       new=PyVistaBackendMock)
-@patch("examples.toolkit.pyaedt_toolkit.ui.windows.plot_design.plot_design_menu.Plotter",
-       new=PlotterMock)
-@patch("requests.get")
+@patch("examples.toolkit.pyaedt_toolkit.ui.windows.plot_design.plot_design_menu.PyVistaBackend", new=PyVistaBackendMock)
+@patch("examples.toolkit.pyaedt_toolkit.ui.windows.plot_design.plot_design_menu.Plotter", new=PlotterMock)
+@patch("requests.Session.get", return_value=mesh_stream_response())
 @patch.object(PyLogger, "log")
 def test_plot_design_menu_setup_and_button_click(mock_log, mock_get, patched_window_methods, qtbot):
 
     windows = ApplicationWindow()
+    # The projects and designs are received from the backend after the window is displayed
+    qtbot.waitUntil(lambda: windows.home_menu.design_combobox.currentText() != "No Design")
     qtbot.mouseClick(windows.plot_design_menu.plot_design_button, Qt.LeftButton)
 
-    # Wait for the geometry thread to finish and then check the post request
+    # Wait for the geometry thread to finish and then check the post request. The thread may finish before a
+    # signal spy could be connected, so wait on its outcome instead.
     get_model_thread = windows.plot_design_menu.get_model_thread
-    with qtbot.waitSignal(get_model_thread.finished_signal, timeout=1000):
-        pass
+    qtbot.waitUntil(lambda: any("Model exported." in call.args[0] for call in mock_log.call_args_list), timeout=1000)
 
     args, kwargs = mock_get.call_args
-    assert args[0] == f"{DEFAULT_URL}/get_aedt_model"
+    assert args[0] == f"{DEFAULT_URL}/get_aedt_mesh"
     assert "json" in kwargs
 
     assert "air_objects" in kwargs["json"]
+    mesh, color, opacity = get_model_thread.model_info["triangle"]
+    assert mesh.n_cells == 1
+    assert color == [255, 0, 0]
 
+    assert kwargs["json"]["progressive"]
     assert any("Exporting model." in call.args[0] for call in mock_log.call_args_list)
+    assert any("Model preview displayed." in call.args[0] for call in mock_log.call_args_list)
     assert any("Model exported." in call.args[0] for call in mock_log.call_args_list)
 
 
@@ -24,11 +24,16 @@
 
 from unittest.mock import patch
 from ansys.aedt.toolkits.common.ui.actions_generic import DEFAULT_AEDT_SESSION_VALUE
+from ansys.aedt.toolkits.common.ui.actions_generic import FrontendGeneric
 from ansys.aedt.toolkits.common.ui.utils.widgets.py_logger.py_logger import PyLogger
+from ansys.aedt.toolkits.common.utils import ToolkitThreadStatus
 from examples.toolkit.pyaedt_toolkit.ui.run_frontend import ApplicationWindow
 
 from tests.ui.conftest import INSTALLED_VERSIONS
 from PySide6.QtCore import Qt
+from PySide6.QtGui import QCloseEvent
+from PySide6.QtWidgets import QApplication
+from PySide6.QtWidgets import QMessageBox
 
 DUMMY_FILE_PATH = "dummy.aedt"
 
@@ -51,7 +56,11 @@ def test_settings_default_values(patched_window_methods, qtbot):
     assert "" == menu.file.text()
 
 @patch("PySide6.QtWidgets.QFileDialog.getOpenFileName", return_value=(DUMMY_FILE_PATH, None))
-def test_settings_browse_interaction(mock_get_open, patched_window_methods, qtbot):
+@patch(
+    "ansys.aedt.toolkits.common.ui.actions_generic.FrontendGeneric.get_project_index",
+    return_value={DUMMY_FILE_PATH: {"name": "dummy", "designs": [{"name": "HFSSDesign1", "design_type": "HFSS"}]}},
+)
+def test_settings_browse_interaction(mock_get_index, mock_get_open, patched_window_methods, qtbot):
     """Test the default values of the incident wave menu in the application window."""
     windows = ApplicationWindow()
     menu = windows.settings_menu
@@ -61,3 +70,54 @@ def test_settings_browse_interaction(mock_get_open, patched_window_methods, qtbo
 
     mock_get_open.assert_called_once()
     assert DUMMY_FILE_PATH == menu.file.text()
+
+    # The designs of the project file are displayed before AEDT is launched
+    qtbot.waitUntil(lambda: "HFSSDesign1" == windows.home_menu.design_combobox.currentText())
+    mock_get_index.assert_called_once_with([DUMMY_FILE_PATH])
+    assert "dummy" == windows.home_menu.project_combobox.currentText()
+
+
+@patch("PySide6.QtWidgets.QMessageBox.question", return_value=QMessageBox.Yes)
+def test_release_and_close_sends_one_request(mock_question, patched_window_methods, qtbot):
+    """Closing the window releases AEDT with one request, then closes the session."""
+    windows = ApplicationWindow()
+    windows.backend_client.wait(timeout=10)
+    calls = []
+    with (
+        patch.object(windows, "_FrontendGeneric__backend_status", return_value=ToolkitThreadStatus.IDLE.value),
+        patch.object(windows.session, "post", side_effect=lambda url, json: calls.append(("post", url, json))),
+        patch.object(windows.session, "close", side_effect=lambda: calls.append(("close",))),
+    ):
+        windows.release_and_close()
+        qtbot.waitUntil(lambda: len(calls) == 2, timeout=5000)
+        # Toolkits handling the close event of the window do not send a second request
+        FrontendGeneric.closeEvent(windows, QCloseEvent())
+        assert windows.backend_client.wait(timeout=10)
+
+    assert calls == [
+        ("post", windows.url + "/close_aedt", {"close_projects": True, "close_desktop": True}),
+        ("close",),
+    ]
+
+
+@patch("ansys.aedt.toolkits.common.ui.actions_generic.BackendEventListener.start")
+@patch("ansys.aedt.toolkits.common.ui.common_windows.settings_column.AedtLauncherThread.run", lambda self: None)
+def test_launch_aedt_event_listener(mock_start, patched_window_methods, qtbot):
+    """The event listener is created in the GUI thread and forwards the progress while AEDT is launching."""
+    windows = ApplicationWindow()
+    menu = windows.settings_menu
+    menu.launch_aedt()
+
+    listener = windows.event_listener
+    assert listener.thread() is QApplication.instance().thread()
+    mock_start.assert_called_once()
+
+    progress = []
+    menu.aedt_thread.progress_update.connect(progress.append)
+    listener.progress_changed.emit(42)
+    assert progress == [42]
+
+    assert menu.aedt_thread.wait(5000)
+    menu.aedt_thread.finished.emit(False)
+    listener.progress_changed.emit(50)
+    assert progress == [42]
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import time
+from unittest.mock import patch
+
+from PySide6.QtCore import QEvent
+from PySide6.QtGui import QPixmap
+from PySide6.QtGui import QPixmapCache
+from PySide6.QtWidgets import QWidget
+
+from ansys.aedt.toolkits.common.ui.utils.images import icon_cache
+from ansys.aedt.toolkits.common.ui.utils.images.icon_cache import colored_icon
+from ansys.aedt.toolkits.common.ui.utils.images.load_images import LoadImages
+from ansys.aedt.toolkits.common.ui.utils.widgets.py_left_menu.py_left_menu import PyLeftMenu
+
+MENU_ICONS = ["icon_home.svg", "icon_plot_3d.svg", "icon_plot_2d.svg", "help.svg", "icon_log.svg"]
+
+
+def _left_menu(qtbot):
+    parent = QWidget()
+    qtbot.addWidget(parent)
+    left_menu = PyLeftMenu(parent=parent, app_parent=parent)
+    left_menu.add_menus(
+        [
+            {
+                "btn_icon": icon,
+                "btn_id": f"menu_{index}",
+                "btn_text": icon,
+                "btn_tooltip": icon,
+                "show_top": True,
+                "is_active": index == 0,
+            }
+            for index, icon in enumerate(MENU_ICONS)
+        ]
+    )
+    left_menu.resize(240, 400)
+    parent.show()
+    qtbot.waitExposed(parent)
+    return left_menu
+
+
+def _hover_repaint(buttons):
+    # Widgets are rendered with grab, because repaint does not paint on the offscreen platform
+    for button in buttons:
+        button.change_style(QEvent.Enter)
+        button.grab()
+        button.change_style(QEvent.Leave)
+        button.grab()
+
+
+def test_colored_icon_cached(qtbot):
+    QPixmapCache.clear()
+    image = LoadImages().icon_path("icon_home.svg")
+    icon = colored_icon(image, "#c3ccdf", (30, 30))
+    assert icon.width() == icon.height() == 30
+    assert colored_icon(image, "#c3ccdf", (30, 30)).cacheKey() == icon.cacheKey()
+    # Color, size, and device pixel ratio are part of the key
+    assert colored_icon(image, "#568af2", (30, 30)).cacheKey() != icon.cacheKey()
+    assert colored_icon(image, "#c3ccdf").cacheKey() != icon.cacheKey()
+    high_resolution = colored_icon(image, "#c3ccdf", (30, 30), 2.0)
+    assert high_resolution.width() == 60
+    assert high_resolution.deviceIndependentSize().width() == 30
+
+
+def test_left_menu_repaint_benchmark(qtbot):
+    """Repaint cost of the left menu, loading the icons from disk or from the cache."""
+    left_menu = _left_menu(qtbot)
+    buttons = left_menu.findChildren(type(left_menu.toggle_button))
+    assert len(buttons) == len(MENU_ICONS) + 1
+    repeats = 20
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        QPixmapCache.clear()
+        _hover_repaint(buttons)
+    uncached = (time.perf_counter() - start) / (repeats * len(buttons) * 2)
+
+    _hover_repaint(buttons)
+    with patch.object(icon_cache, "QPixmap", side_effect=QPixmap) as pixmap_load:
+        start = time.perf_counter()
+        for _ in range(repeats):
+            _hover_repaint(buttons)
+        cached = (time.perf_counter() - start) / (repeats * len(buttons) * 2)
+        # Repaints do not read any icon file
+        assert pixmap_load.call_count == 0
+    print(f"\nLeft menu button repaint: {uncached * 1e3:.3f} ms loading icons, {cached * 1e3:.3f} ms cached")
+    assert cached < uncached
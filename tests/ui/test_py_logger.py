@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from ansys.aedt.toolkits.common.ui.utils.widgets import PyLogger
+
+
+def test_messages_batched(qtbot):
+    """A burst of messages is rendered in one pass, after the flush interval."""
+    logger = PyLogger(flush_interval=20)
+    qtbot.addWidget(logger)
+    appended = []
+    logger.document().contentsChange.connect(lambda *args: appended.append(args))
+
+    for index in range(100):
+        logger.log(f"Message {index}")
+    assert logger.toPlainText() == ""
+
+    qtbot.waitUntil(lambda: logger.document().blockCount() == 100, timeout=2000)
+    assert len(appended) == 1
+    assert logger.toPlainText().splitlines()[-1] == "Message 99"
+
+
+def test_history_bounded(qtbot):
+    logger = PyLogger(max_lines=50)
+    qtbot.addWidget(logger)
+    for index in range(500):
+        logger.log(f"Message {index}")
+    logger.flush()
+
+    assert len(logger.history) == 50
+    assert logger.document().blockCount() == 50
+    assert logger.toPlainText().splitlines() == [f"Message {index}" for index in range(450, 500)]
+
+
+def test_level_filter_and_search(qtbot):
+    logger = PyLogger()
+    qtbot.addWidget(logger)
+    logger.log("Launching AEDT", "debug")
+    logger.log("AEDT session connected")
+    logger.log("Project not saved", "error")
+    logger.flush()
+
+    logger.set_level("warning")
+    assert logger.toPlainText() == "Project not saved"
+
+    logger.log("Design created", "info")
+    logger.log("Mesh failed", "error")
+    logger.flush()
+    assert logger.toPlainText().splitlines() == ["Project not saved", "Mesh failed"]
+
+    logger.set_level("debug")
+    logger.set_filter("aedt")
+    assert logger.toPlainText().splitlines() == ["Launching AEDT", "AEDT session connected"]
+    assert logger.search("AEDT", level="info") == ["AEDT session connected"]
+
+    logger.set_filter("")
+    assert logger.document().blockCount() == 5
+
+
+def test_one_document_update_per_flush(qtbot):
+    """Each flush renders the pending messages with one document update, keeping the last lines."""
+    messages = [f"Iteration {index}: residual 1e-{index % 10}" for index in range(5000)]
+    logger = PyLogger(max_lines=1000)
+    qtbot.addWidget(logger)
+    updates = []
+    # The oldest lines removed past the maximum are separate changes
+    logger.document().contentsChange.connect(lambda position, removed, added: added and updates.append(position))
+
+    for message in messages:
+        logger.log(message)
+    assert not updates
+    logger.flush()
+    assert len(updates) == 1
+    assert logger.document().blockCount() == 1000
+    assert logger.toPlainText().splitlines() == messages[-1000:]
+
+    logger.flush()
+    assert len(updates) == 1
+    for message in messages[:10]:
+        logger.log(message)
+    logger.flush()
+    assert len(updates) == 2
+    assert logger.toPlainText().splitlines()[-10:] == messages[:10]